@@ -0,0 +1,145 @@
+""" JWT authentication that serves users from an in-process principal cache. """
+
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from authapp.revocation import get_revocation_list
+from authapp.tokens import VERSION_CLAIM
+from core.models import User
+
+
+class PrincipalCache:
+    """
+    Bounded LRU of users' column values keyed by user id, each entry
+    expiring ``ttl`` seconds after it was loaded. Hits are rebuilt into a
+    fresh ``User`` per request, so no two requests share a mutable instance.
+    """
+
+    def __init__(self, size, ttl):
+
+        self.size = size
+        self.ttl = ttl
+        self.fields = [field.attname for field in User._meta.concrete_fields]
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id, version):
+        """ The cached user if it is fresh and stamped with ``version``, else None. """
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] <= now or entry[2] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+        _, db, _, values = entry
+        return User.from_db(db, self.fields, values)
+
+    def put(self, user):
+
+        if self.size <= 0 or user.get_deferred_fields():
+            return
+        entry = (
+            time.monotonic() + self.ttl,
+            user._state.db,
+            user.auth_version,
+            tuple(getattr(user, field) for field in self.fields),
+        )
+        with self._lock:
+            self._entries[user.pk] = entry
+            self._entries.move_to_end(user.pk)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def evict(self, user_id):
+
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+_principals = None
+_principals_lock = threading.Lock()
+
+
+def get_principal_cache():
+    """ The process-wide principal cache, sized from settings on first use. """
+
+    global _principals
+    with _principals_lock:
+        if _principals is None:
+            _principals = PrincipalCache(
+                getattr(settings, 'AUTH_PRINCIPAL_CACHE_SIZE', 10000),
+                getattr(settings, 'AUTH_PRINCIPAL_CACHE_TTL_SECONDS', 60),
+            )
+        return _principals
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    ``JWTAuthentication`` without the per-request user query. Tokens from
+    ``UserRefreshToken`` carry the user's ``auth_version``: a cached user
+    with the same version is served straight from memory, anything else
+    falls back to the database. A token older than the user's current
+    version (password, role or status changed since) is rejected, and so
+    is any token in the revocation list.
+
+    Other processes learn about a change when their entry expires, so
+    ``AUTH_PRINCIPAL_CACHE_TTL_SECONDS`` bounds how stale a user can be.
+    """
+
+    def get_validated_token(self, raw_token):
+
+        validated_token = super().get_validated_token(raw_token)
+        revocations = get_revocation_list()
+        revocations.sync_if_due()
+        if revocations.is_revoked(validated_token):
+            raise InvalidToken('Token has been revoked')
+        return validated_token
+
+    def get_user(self, validated_token):
+
+        version = validated_token.get(VERSION_CLAIM)
+        if version is None:
+            # Issued before tokens were version-stamped
+            return super().get_user(validated_token)
+
+        user = self.cached_user(validated_token, version)
+        if user is None:
+            user = self.remember(super().get_user(validated_token), version)
+        return user
+
+    def cached_user(self, validated_token, version):
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken('Token contained no recognizable user identification')
+
+        user = get_principal_cache().get(user_id, version)
+        if user is not None and api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed('User is inactive', code='user_inactive')
+        return user
+
+    def remember(self, user, version):
+
+        get_principal_cache().put(user)
+        if user.auth_version != version:
+            raise AuthenticationFailed('Token is no longer valid for this user', code='token_outdated')
+        return user
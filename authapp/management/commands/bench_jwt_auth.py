@@ -0,0 +1,92 @@
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from authapp.authentication import CachedJWTAuthentication, get_principal_cache
+from authapp.tokens import UserRefreshToken
+from core.choices import UserRoleChoices
+from core.models import User
+from job.choices import JobStatusChoices
+from job.models import Job
+from job.rest.views.views import JobViewSet, RecruiterDashboardView
+from shared.benchmark import QueryCounter, summarize, timed, write_table
+
+
+class Command(BaseCommand):
+
+    help = "Compare per-request queries and latency of JWTAuthentication and CachedJWTAuthentication."
+
+    def add_arguments(self, parser):
+
+        parser.add_argument('--requests', type=int, default=500, help="Requests per scenario.")
+
+    def run_scenario(self, view, path, token, kwargs, requests):
+
+        factory = APIRequestFactory(SERVER_NAME='localhost')
+        samples, queries = [], 0
+        for _ in range(requests):
+            request = factory.get(path, HTTP_AUTHORIZATION=f'Bearer {token}')
+            with QueryCounter(connection) as counter, timed(samples):
+                response = view(request, **kwargs)
+                response.render()
+            assert response.status_code == 200, (path, response.status_code)
+            queries += counter.count
+        return samples, queries / requests
+
+    def handle(self, *args, **options):
+
+        tag = uuid.uuid4().hex[:8]
+        recruiter, candidate = User.objects.bulk_create([
+            User(
+                email=f'bench-{tag}-{role.lower()}@example.com',
+                username=f'bench-{tag}-{role.lower()}@example.com',
+                first_name='Bench', last_name=role.title(), password='!', role=role,
+            )
+            for role in (UserRoleChoices.RECRUITER, UserRoleChoices.CANDIDATE)
+        ])
+        job = Job.objects.create(
+            title='Bench job', description='Benchmark job', location='Remote',
+            job_status=JobStatusChoices.PUBLISHED, deadline=timezone.now() + timedelta(days=30),
+            recruiter=recruiter,
+        )
+        tokens = {user.pk: str(UserRefreshToken.for_user(user).access_token) for user in (recruiter, candidate)}
+
+        scenarios = [
+            ('jobs list', JobViewSet, {'get': 'list'}, '/api/v1/jobs/jobs/', {}, candidate),
+            ('job detail', JobViewSet, {'get': 'retrieve'}, f'/api/v1/jobs/jobs/{job.pk}/', {'pk': job.pk}, candidate),
+            ('recruiter dashboard', RecruiterDashboardView, None, '/api/v1/jobs/recruiter-dashboard/', {}, recruiter),
+        ]
+        backends = [('JWTAuthentication', JWTAuthentication), ('CachedJWTAuthentication', CachedJWTAuthentication)]
+
+        rows = []
+        try:
+            # The response cache would skip the view, and with it most of the
+            # work authentication is being compared against.
+            with override_settings(JOB_RESPONSE_CACHE_ENABLED=False):
+                for name, view_class, actions, path, kwargs, user in scenarios:
+                    for backend_name, backend in backends:
+                        get_principal_cache().clear()
+                        initkwargs = {'authentication_classes': [backend]}
+                        view = (
+                            view_class.as_view(actions, **initkwargs) if actions
+                            else view_class.as_view(**initkwargs)
+                        )
+                        samples, queries = self.run_scenario(view, path, tokens[user.pk], kwargs, options['requests'])
+                        stats = summarize(samples)
+                        rows.append([name, backend_name, queries, stats['mean'], stats['p50'], stats['p95']])
+        finally:
+            Job.objects.filter(recruiter=recruiter).delete()
+            User.objects.filter(pk__in=[recruiter.pk, candidate.pk]).delete()
+
+        self.stdout.write(f"{options['requests']} requests per scenario")
+        write_table(
+            self.stdout,
+            ['endpoint', 'authentication', 'queries/req', 'mean ms', 'p50 ms', 'p95 ms'],
+            rows,
+        )
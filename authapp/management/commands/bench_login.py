@@ -0,0 +1,131 @@
+import queue
+import threading
+import time
+import uuid
+
+from django.contrib.auth import hashers
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from authapp.rest.views.views import UserLoginView
+from core.choices import UserRoleChoices
+from core.models import User
+from job.rest.views.views import JobViewSet
+from shared.benchmark import summarize, timed, write_table
+from shared import hashing
+
+
+PASSWORD = 'bench-password-123'
+
+
+class Command(BaseCommand):
+
+    help = "Login throughput, and job API latency alongside it, with inline vs pooled password hashing."
+
+    def add_arguments(self, parser):
+
+        parser.add_argument('--logins', type=int, default=60, help="Login attempts per mode.")
+        parser.add_argument('--concurrency', type=int, default=16, help="Threads logging in at once.")
+        parser.add_argument('--readers', type=int, default=2, help="Threads reading the job list meanwhile.")
+
+    def login_worker(self, view, emails, samples, rejected):
+
+        factory = APIRequestFactory(SERVER_NAME='localhost')
+        try:
+            while True:
+                try:
+                    email = emails.get_nowait()
+                except queue.Empty:
+                    return
+                request = factory.post('/api/v1/auth/login/', {'email': email, 'password': PASSWORD}, format='json')
+                with timed(samples):
+                    response = view(request)
+                if response.status_code == 503:
+                    samples.pop()
+                    rejected.append(email)
+                else:
+                    assert response.status_code == 200, response.status_code
+        finally:
+            connection.close()
+
+    def read_worker(self, view, user, done, samples):
+
+        factory = APIRequestFactory(SERVER_NAME='localhost')
+        try:
+            while not done.is_set():
+                request = factory.get('/api/v1/jobs/jobs/')
+                force_authenticate(request, user=user)
+                with timed(samples):
+                    view(request).render()
+        finally:
+            connection.close()
+
+    def run_mode(self, users, options):
+
+        emails = queue.SimpleQueue()
+        for user in users:
+            emails.put(user.email)
+        login_samples, read_samples, rejected = [], [], []
+        done = threading.Event()
+
+        login_view = UserLoginView.as_view()
+        list_view = JobViewSet.as_view({'get': 'list'})
+        logins = [
+            threading.Thread(target=self.login_worker, args=(login_view, emails, login_samples, rejected))
+            for _ in range(options['concurrency'])
+        ]
+        readers = [
+            threading.Thread(target=self.read_worker, args=(list_view, users[0], done, read_samples))
+            for _ in range(options['readers'])
+        ]
+        start = time.perf_counter()
+        for thread in logins + readers:
+            thread.start()
+        for thread in logins:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        done.set()
+        for thread in readers:
+            thread.join()
+        return login_samples, rejected, elapsed, read_samples
+
+    def handle(self, *args, **options):
+
+        tag = uuid.uuid4().hex[:8]
+        encoded = hashers.make_password(PASSWORD)
+        users = User.objects.bulk_create([
+            User(
+                email=f'bench-{tag}-{index}@example.com', username=f'bench-{tag}-{index}@example.com',
+                first_name='Bench', last_name='Candidate', password=encoded, role=UserRoleChoices.CANDIDATE,
+            )
+            for index in range(options['logins'])
+        ])
+
+        rows = []
+        try:
+            with override_settings(JOB_RESPONSE_CACHE_ENABLED=False):
+                for mode, enabled in (('inline', False), ('process pool', True)):
+                    with override_settings(PASSWORD_HASHING_POOL_ENABLED=enabled):
+                        if enabled:
+                            # Start the workers outside the measured run.
+                            hashing.make_password(PASSWORD)
+                        samples, rejected, elapsed, reads = self.run_mode(users, options)
+                    login_stats, read_stats = summarize(samples), summarize(reads)
+                    rows.append([
+                        mode, len(samples) / elapsed, login_stats['p50'], login_stats['p99'], len(rejected),
+                        read_stats['n'] / elapsed, read_stats['p50'], read_stats['p95'],
+                    ])
+        finally:
+            User.objects.filter(email__startswith=f'bench-{tag}-').delete()
+
+        self.stdout.write(
+            f"{options['logins']} logins per mode, {options['concurrency']} concurrent, "
+            f"{options['readers']} job-list readers alongside"
+        )
+        write_table(
+            self.stdout,
+            ['hashing', 'logins/s', 'login p50 ms', 'login p99 ms', '503s', 'reads/s', 'read p50 ms', 'read p95 ms'],
+            rows,
+        )
@@ -0,0 +1,68 @@
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from authapp.rest.views.views import UserLoginView
+from shared import throttling
+from shared.benchmark import summarize, timed, write_table
+
+
+class Command(BaseCommand):
+
+    help = "Measure the per-request cost of the login throttles on each backend."
+
+    def add_arguments(self, parser):
+
+        parser.add_argument('--checks', type=int, default=20000, help="Requests checked per backend.")
+        parser.add_argument('--clients', type=int, default=1000, help="Distinct IPs and emails to spread them over.")
+        parser.add_argument('--limit', type=int, default=5, help="Per-minute limit for each client.")
+
+    def build_requests(self, clients):
+
+        factory = APIRequestFactory(SERVER_NAME='localhost')
+        requests = []
+        for index in range(clients):
+            request = APIView().initialize_request(factory.post(
+                '/api/v1/auth/login/',
+                {'email': f'bench-{index}@example.com', 'password': 'x'},
+                format='json',
+                REMOTE_ADDR=f'10.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}',
+            ))
+            request.data  # parse once, as the view would before throttling
+            requests.append(request)
+        return requests
+
+    def handle(self, *args, **options):
+
+        requests = self.build_requests(options['clients'])
+        rate = f"{options['limit']}/min"
+        backends = [('local', throttling.LocalBackend()), ('cache', throttling.CacheBackend('default'))]
+
+        rows = []
+        previous = throttling._backend
+        try:
+            with override_settings(THROTTLE_RATES={'login_ip': rate, 'login_email': rate}):
+                for name, backend in backends:
+                    throttling._backend = backend
+                    samples, rejected = [], 0
+                    for index in range(options['checks']):
+                        request = requests[index % len(requests)]
+                        with timed(samples):
+                            allowed = all(
+                                throttle.allow_request(request, UserLoginView)
+                                for throttle in (throttling.IPThrottle(), throttling.EmailThrottle())
+                            )
+                        rejected += not allowed
+                    stats = summarize(samples)
+                    rows.append([
+                        name, stats['n'], rejected,
+                        stats['mean'] * 1000, stats['p50'] * 1000, stats['p99'] * 1000,
+                    ])
+        finally:
+            throttling._backend = previous
+
+        self.stdout.write(
+            f"{options['checks']} login checks (IP + email) over {options['clients']} clients at {rate}"
+        )
+        write_table(self.stdout, ['backend', 'checks', '429s', 'mean us', 'p50 us', 'p99 us'], rows)
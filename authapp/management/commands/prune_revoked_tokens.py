@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.models import RevokedToken
+
+
+class Command(BaseCommand):
+
+    help = "Delete revoked-token rows whose tokens have expired anyway."
+
+    def handle(self, *args, **options):
+
+        deleted = RevokedToken.objects.prune(timezone.now())
+        self.stdout.write(f"Pruned {deleted} expired revoked token(s).")
@@ -5,9 +5,16 @@ from django.core.exceptions import ValidationError
 from django.contrib.auth.tokens import default_token_generator
 from django.utils.http import urlsafe_base64_decode
 from django.utils.encoding import force_str
+from django.db import transaction
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
 
 from core.models import User, UserProfile
 from core.choices import UserRoleChoices
+from authapp.revocation import get_revocation_list
+from authapp.tokens import VERSION_CLAIM, UserRefreshToken
 from authapp.utils import EmailService
 
 
@@ -58,10 +65,11 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         """Create user and send welcome email"""
         validated_data.pop('password_confirm')  # Remove password_confirm
         
-        user = User.objects.create_user(**validated_data)
-        
-        EmailService.send_welcome_email(user)
-        
+        with transaction.atomic():
+            user = User.objects.create_user(**validated_data)
+
+            EmailService.send_welcome_email(user)
+
         return user
 
 
@@ -176,7 +184,8 @@ class UserProfileSerializer(serializers.ModelSerializer):
         fields = [
             'user_email', 'user_name', 'user_role', 'photo', 'bio',
             'date_of_birth', 'gender', 'address', 'city', 'country',
-            'resume', 'skills', 'skills_list', 'experience_years'
+            'resume', 'skills', 'skills_list', 'experience_years',
+            'application_email_mode'
         ]
         extra_kwargs = {
             'photo': {'required': False},
@@ -200,4 +209,31 @@ class UserSerializer(serializers.ModelSerializer):
             try:
                 return UserProfileSerializer(obj.profile).data
             except UserProfile.DoesNotExist:
-                return None
\ No newline at end of file
+                return None
+
+class UserTokenObtainPairSerializer(TokenObtainPairSerializer):
+
+    token_class = UserRefreshToken
+
+
+class UserTokenRefreshSerializer(TokenRefreshSerializer):
+    """Refuses revoked refresh tokens and ones issued before the user's last password, role or status change"""
+
+    token_class = UserRefreshToken
+
+    def validate(self, attrs):
+
+        refresh = self.token_class(attrs['refresh'])
+        revocations = get_revocation_list()
+        revocations.sync_if_due()
+        if revocations.is_revoked(refresh):
+            raise InvalidToken('Token has been revoked')
+
+        version = refresh.payload.get(VERSION_CLAIM)
+        if version is not None:
+            current = User.objects.filter(
+                pk=refresh.payload.get(api_settings.USER_ID_CLAIM)
+            ).values_list('auth_version', flat=True).first()
+            if current != version:
+                raise AuthenticationFailed('Token is no longer valid for this user', code='token_outdated')
+        return super().validate(attrs)
@@ -1,7 +1,8 @@
 from django.urls import path
-from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from rest_framework_simplejwt.views import TokenRefreshView
+from authapp.rest.views.views import UserTokenObtainPairView
 
 urlpatterns = [
-    path("", TokenObtainPairView.as_view(), name="token_obtain_pair"),
+    path("", UserTokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("refresh/", TokenRefreshView.as_view(), name="token_refresh"),
 ]
@@ -1,11 +1,13 @@
 from django.urls import path
-from rest_framework_simplejwt.views import TokenRefreshView,TokenObtainPairView
+from rest_framework_simplejwt.views import TokenRefreshView
 
 from authapp.rest.views.views import (
     UserRegistrationView,
     UserLoginView,
+    UserTokenObtainPairView,
     PasswordResetRequestView,
     PasswordResetConfirmView,
+    PasswordHashingStatsView,
     UserProfileView,
     current_user_view,
     logout_view,
@@ -19,7 +21,7 @@ urlpatterns = [
     path('logout/', logout_view, name='user-logout'),
 
     # JWT Token endpoints
-    path('token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
+    path('token/', UserTokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('token/refresh/', TokenRefreshView.as_view(), name='token-refresh'),
     
     # Password reset endpoints
@@ -29,4 +31,6 @@ urlpatterns = [
     # User profile endpoints
     path('profile/', UserProfileView.as_view(), name='user-profile'),
     path('me/', current_user_view, name='current-user'),
+
+    path('hashing-stats/', PasswordHashingStatsView.as_view(), name='password-hashing-stats'),
 ]
\ No newline at end of file
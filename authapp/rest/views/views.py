@@ -1,12 +1,20 @@
 from rest_framework import status, generics, permissions
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import RefreshToken
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework_simplejwt.views import TokenObtainPairView
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
+from rest_framework.views import APIView
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from core.models import User
+from authapp.revocation import get_revocation_list
+from authapp.tokens import UserRefreshToken
+from shared.hashing import get_hashing_pool
+from shared.throttling import EmailThrottle, IPThrottle
 from authapp.rest.serializers.serializers import (
     UserRegistrationSerializer,
     UserLoginSerializer,
@@ -22,6 +30,8 @@ class UserRegistrationView(generics.CreateAPIView):
     queryset = User.objects.all()
     serializer_class = UserRegistrationSerializer
     permission_classes = [AllowAny]
+    throttle_classes = [IPThrottle]
+    throttle_scope = 'register'
 
     @swagger_auto_schema(
         operation_description="Register a new user with a specified role (Recruiter or Candidate)",
@@ -49,7 +59,7 @@ class UserRegistrationView(generics.CreateAPIView):
         serializer.is_valid(raise_exception=True)
         user = serializer.save()
 
-        refresh = RefreshToken.for_user(user)
+        refresh = UserRefreshToken.for_user(user)
         
         return Response({
             'message': 'User registered successfully',
@@ -65,6 +75,8 @@ class UserLoginView(generics.GenericAPIView):
 
     serializer_class = UserLoginSerializer
     permission_classes = [AllowAny]
+    throttle_classes = [IPThrottle, EmailThrottle]
+    throttle_scope = 'login'
 
     @swagger_auto_schema(
         operation_description="Authenticate user and get JWT tokens",
@@ -94,7 +106,7 @@ class UserLoginView(generics.GenericAPIView):
         serializer.is_valid(raise_exception=True)
         
         user = serializer.validated_data['user']
-        refresh = RefreshToken.for_user(user)
+        refresh = UserRefreshToken.for_user(user)
         
         return Response({
             'message': 'Login successful',
@@ -106,10 +118,19 @@ class UserLoginView(generics.GenericAPIView):
         }, status=status.HTTP_200_OK)
 
 
+class UserTokenObtainPairView(TokenObtainPairView):
+    """ simplejwt's token endpoint, limited like ``UserLoginView`` since it checks passwords too. """
+
+    throttle_classes = [IPThrottle, EmailThrottle]
+    throttle_scope = 'login'
+
+
 class PasswordResetRequestView(generics.GenericAPIView):
 
     serializer_class = PasswordResetRequestSerializer
     permission_classes = [AllowAny]
+    throttle_classes = [IPThrottle, EmailThrottle]
+    throttle_scope = 'forgot_password'
 
     @swagger_auto_schema(
         operation_description="Request password reset email",
@@ -230,6 +251,23 @@ Root Causes
         return super().patch(request, *args, **kwargs)
 
 
+class PasswordHashingStatsView(APIView):
+
+    permission_classes = [IsAuthenticated, IsAdminUser]
+
+    def get(self, request):
+
+        pool = get_hashing_pool()
+        return Response(pool.stats() if pool else {'enabled': False})
+
+    def delete(self, request):
+
+        pool = get_hashing_pool()
+        if pool:
+            pool.reset_stats()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
 @swagger_auto_schema(
     method='get',
     operation_description="Get current user information",
@@ -248,7 +286,7 @@ def current_user_view(request):
 
 @swagger_auto_schema(
     method='post',
-    operation_description="Logout user (blacklist refresh token)",
+    operation_description="Logout user (revoke the refresh token and the current access token)",
     request_body=openapi.Schema(
         type=openapi.TYPE_OBJECT,
         properties={
@@ -272,16 +310,26 @@ def current_user_view(request):
 @permission_classes([IsAuthenticated])
 def logout_view(request):
 
-    try:
-        refresh_token = request.data.get('refresh')
-        if refresh_token:
+    revocations = get_revocation_list()
+    refresh_token = request.data.get('refresh')
+    if refresh_token:
+        try:
             token = RefreshToken(refresh_token)
-            token.blacklist()
-        
-        return Response({
-            'message': 'Logout successful'
-        }, status=status.HTTP_200_OK)
-    except Exception:
-        return Response({
-            'error': 'Invalid token'
-        }, status=status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
+        except TokenError:
+            return Response({
+                'error': 'Invalid token'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        if token.get(api_settings.USER_ID_CLAIM) != request.user.pk:
+            return Response({
+                'error': 'Invalid token'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        revocations.revoke(token)
+
+    # Access tokens live as long as refresh tokens, so the one used for
+    # this request is revoked too.
+    if request.auth is not None:
+        revocations.revoke(request.auth)
+
+    return Response({
+        'message': 'Logout successful'
+    }, status=status.HTTP_200_OK)
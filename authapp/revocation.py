@@ -0,0 +1,216 @@
+""" Revoked JWTs: a database table mirrored into every process for per-request checks. """
+
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import Max
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from core.models import RevokedToken
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings. Membership tests can return a
+    false positive (about ``error_rate`` once ``capacity`` keys are in),
+    never a false negative.
+    """
+
+    def __init__(self, capacity, error_rate=0.001):
+
+        self.capacity = max(1, capacity)
+        self.size = math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def positions(self, key):
+
+        # Double hashing: k positions from two 64-bit halves of one digest.
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + index * second) % self.size for index in range(self.hashes)]
+
+    def add(self, key):
+
+        for position in self.positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self.positions(key))
+
+
+class RevocationList:
+    """
+    This process's view of ``RevokedToken``.
+
+    A Bloom filter holds every unexpired revoked ``jti``, so the common
+    case (a token that was never revoked) is answered in memory. A
+    filter hit is settled by a bounded exact set of known-revoked ids,
+    then a bounded set of ids the database already cleared, and only
+    then by a query. Rows revoked by other processes are pulled in every
+    ``sync_seconds``; the filter is rebuilt from unexpired rows every
+    ``rebuild_seconds`` (or once it is over capacity), which is how
+    expired tokens drop out.
+    """
+
+    def __init__(self, capacity, error_rate, exact_size, sync_seconds, rebuild_seconds):
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.exact_size = exact_size
+        self.sync_seconds = sync_seconds
+        self.rebuild_seconds = rebuild_seconds
+        self.db_checks = 0
+        self._bloom = None
+        self._revoked = OrderedDict()  # jti -> exp (epoch seconds)
+        self._cleared = OrderedDict()  # jti -> None, filter false positives
+        self._last_id = 0
+        self._synced_at = self._rebuilt_at = -math.inf
+        self._lock = threading.Lock()
+
+    def due(self):
+
+        return time.monotonic() - self._synced_at >= self.sync_seconds
+
+    def sync_if_due(self):
+
+        if self.due():
+            self.sync()
+
+    async def async_sync_if_due(self):
+
+        if self.due():
+            await sync_to_async(self.sync)()
+
+    def sync(self):
+        """ Pull in revocations recorded since the last sync, rebuilding the filter when due. """
+
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._bloom is None
+                or now - self._rebuilt_at >= self.rebuild_seconds
+                or self._bloom.count > self._bloom.capacity
+            ):
+                self._rebuild(now)
+            else:
+                rows = RevokedToken.objects.filter(pk__gt=self._last_id).order_by('pk')
+                for pk, jti, expires_at in rows.values_list('pk', 'jti', 'expires_at'):
+                    self._remember(jti, expires_at.timestamp())
+                    self._last_id = pk
+            self._synced_at = now
+
+    def _rebuild(self, now):
+
+        current = timezone.now()
+        # Read the high-water mark first: rows added while loading are
+        # picked up again by the next sync, which is harmless.
+        self._last_id = RevokedToken.objects.aggregate(last=Max('pk'))['last'] or 0
+        unexpired = RevokedToken.objects.filter(expires_at__gt=current)
+        bloom = BloomFilter(max(self.capacity, 2 * unexpired.count()), self.error_rate)
+        for jti in unexpired.values_list('jti', flat=True).iterator():
+            bloom.add(jti)
+
+        cutoff = current.timestamp()
+        self._revoked = OrderedDict((jti, exp) for jti, exp in self._revoked.items() if exp > cutoff)
+        # The new filter has different false positives.
+        self._cleared.clear()
+        self._bloom = bloom
+        self._rebuilt_at = now
+
+    def _remember(self, jti, exp):
+
+        self._bloom.add(jti)
+        self._cleared.pop(jti, None)
+        self._revoked[jti] = exp
+        self._revoked.move_to_end(jti)
+        while len(self._revoked) > self.exact_size:
+            self._revoked.popitem(last=False)
+
+    def _record(self, jti, exp, revoked):
+
+        with self._lock:
+            if revoked:
+                self._remember(jti, exp)
+            else:
+                self._cleared[jti] = None
+                while len(self._cleared) > self.exact_size:
+                    self._cleared.popitem(last=False)
+
+    def _lookup(self, token):
+        """ True/False when memory can answer for ``token``, None when the database must. """
+
+        jti = token.get(api_settings.JTI_CLAIM)
+        bloom = self._bloom
+        if jti is None or bloom is None or jti not in bloom:
+            return False
+        if jti in self._revoked:
+            return True
+        if jti in self._cleared:
+            return False
+        return None
+
+    def is_revoked(self, token):
+
+        revoked = self._lookup(token)
+        if revoked is None:
+            self.db_checks += 1
+            jti = token[api_settings.JTI_CLAIM]
+            revoked = RevokedToken.objects.filter(jti=jti).exists()
+            self._record(jti, token['exp'], revoked)
+        return revoked
+
+    async def ais_revoked(self, token):
+
+        revoked = self._lookup(token)
+        if revoked is None:
+            self.db_checks += 1
+            jti = token[api_settings.JTI_CLAIM]
+            revoked = await RevokedToken.objects.filter(jti=jti).aexists()
+            self._record(jti, token['exp'], revoked)
+        return revoked
+
+    def revoke(self, token):
+        """ Revoke a validated access or refresh token everywhere. """
+
+        jti = token[api_settings.JTI_CLAIM]
+        RevokedToken.objects.revoke(
+            jti,
+            token.token_type,
+            datetime_from_epoch(token['exp']),
+            user_id=token.get(api_settings.USER_ID_CLAIM),
+        )
+        with self._lock:
+            if self._bloom is not None:
+                self._remember(jti, token['exp'])
+
+
+_revocations = None
+_revocations_lock = threading.Lock()
+
+
+def get_revocation_list():
+    """ The process-wide revocation list, configured from settings on first use. """
+
+    global _revocations
+    with _revocations_lock:
+        if _revocations is None:
+            _revocations = RevocationList(
+                capacity=getattr(settings, 'TOKEN_REVOCATION_BLOOM_CAPACITY', 100000),
+                error_rate=getattr(settings, 'TOKEN_REVOCATION_BLOOM_ERROR_RATE', 0.001),
+                exact_size=getattr(settings, 'TOKEN_REVOCATION_EXACT_SIZE', 10000),
+                sync_seconds=getattr(settings, 'TOKEN_REVOCATION_SYNC_SECONDS', 2),
+                rebuild_seconds=getattr(settings, 'TOKEN_REVOCATION_REBUILD_SECONDS', 3600),
+            )
+        return _revocations
@@ -1,24 +1,30 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from django.core.mail import send_mail
-from django.conf import settings
-
 
+from authapp.authentication import get_principal_cache
+from authapp.utils import EmailService
 from core.models import User
+from shared.db_router import pin_to_primary, user_identity
 
 @receiver(post_save, sender=User)
 def send_welcome_email(sender, instance, created, **kwargs):
 
     if created and instance.email:
-        subject = 'Welcome to JobSite Platform!'
-        message = f'Hi {instance.get_full_name() or instance.username},\n\n' \
-                 f'Welcome to JobSite! Your account has been successfully created.\n\n' \
-                 f'Regards,\nJobSite Team'
-        send_mail(
-            subject,
-            message,
-            settings.DEFAULT_FROM_EMAIL,
-            [instance.email],
-            fail_silently=False,
-        )
+        # Queued in the user's insert transaction; deduped with the registration serializer's copy.
+        EmailService.send_welcome_email(instance)
+
+
+@receiver(post_save, sender=User)
+def pin_new_user_to_primary(sender, instance, created, raw=False, **kwargs):
+
+    if created and not raw:
+        # A fresh account's first authenticated requests must not hit a
+        # replica that has not copied the row yet.
+        pin_to_primary(user_identity(instance))
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def forget_cached_principal(sender, instance, **kwargs):
 
+    get_principal_cache().evict(instance.pk)
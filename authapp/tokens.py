@@ -0,0 +1,22 @@
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+ROLE_CLAIM = 'role'
+UID_CLAIM = 'uid'
+VERSION_CLAIM = 'ver'
+
+
+class UserRefreshToken(RefreshToken):
+    """
+    Refresh token stamped with the user's role, public uid and
+    ``auth_version``. Access tokens derived from it copy the claims.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+
+        token = super().for_user(user)
+        token[ROLE_CLAIM] = user.role
+        token[UID_CLAIM] = str(user.uid)
+        token[VERSION_CLAIM] = user.auth_version
+        return token
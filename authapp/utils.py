@@ -1,7 +1,6 @@
 
 import secrets
 import string
-from django.core.mail import send_mail
 from django.conf import settings
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
@@ -9,6 +8,8 @@ from django.contrib.auth.tokens import default_token_generator
 from django.utils.http import urlsafe_base64_encode
 from django.utils.encoding import force_bytes
 
+from core.models import EmailOutbox
+
 
 def generate_password_reset_token():
 
@@ -17,51 +18,50 @@ def generate_password_reset_token():
 
 def send_password_reset_email(user, reset_token):
 
-    try:
-        subject = 'Password Reset - JobSite Platform'
-        
-        token = default_token_generator.make_token(user)
-        uid = urlsafe_base64_encode(force_bytes(user.pk))
+    subject = 'Password Reset - JobSite Platform'
     
-        reset_link = f"http://127.0.0.1:8000/api/v1/auth/reset-password/?uid={uid}&token={token}"
+    token = default_token_generator.make_token(user)
+    uid = urlsafe_base64_encode(force_bytes(user.pk))
 
-        html_message = render_to_string('emails/password_reset_email.html', {
-            'user': user,
-            'reset_link': reset_link,
-            'site_name': 'JobSite',
-        })
-        
-        plain_message = strip_tags(html_message)
-        
-        send_mail(
-            subject=subject,
-            message=plain_message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user.email],
-            html_message=html_message,
-            fail_silently=False,
-        )
-        return True
-    except Exception as e:
-        print(f"Error sending password reset email: {str(e)}")
-        return False
+    reset_link = f"http://127.0.0.1:8000/api/v1/auth/reset-password/?uid={uid}&token={token}"
+
+    html_message = render_to_string('emails/password_reset_email.html', {
+        'user': user,
+        'reset_link': reset_link,
+        'site_name': 'JobSite',
+    })
+    
+    plain_message = strip_tags(html_message)
+    
+    # A failed insert is a database error; let it reach the caller's transaction.
+    EmailOutbox.objects.enqueue(
+        subject=subject,
+        body=plain_message,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        recipients=[user.email],
+        html_body=html_message,
+    )
 
 
 
 class EmailService:
+    """Builds outbound mail and queues it in EmailOutbox; run_mail_worker delivers it"""
 
     @staticmethod
     def send_welcome_email(user):
         if not user.email:
             return  
-        subject = 'Welcome to Our Platform'
-        message = f'Hello {user.get_full_name()},\n\nThank you for registering!'
-        send_mail(
+        subject = 'Welcome to JobSite Platform!'
+        message = f'Hi {user.get_full_name() or user.username},\n\n' \
+                 f'Welcome to JobSite! Your account has been successfully created.\n\n' \
+                 f'Regards,\nJobSite Team'
+        # Registration used to send two welcome mails; the key keeps it to one.
+        EmailOutbox.objects.enqueue(
             subject,
             message,
-            settings.DEFAULT_FROM_EMAIL,
             [user.email],
-            fail_silently=False,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            dedupe_key=f'welcome:{user.pk}',
         )
     @staticmethod
     def send_password_reset_email(user, reset_token):
@@ -69,28 +69,58 @@ class EmailService:
         return send_password_reset_email(user, reset_token)
     
     @staticmethod
-    def send_job_application_notification(job, candidate):
-
-        try:
-            subject = f'New Application for {job.title}'
-            
-            html_message = render_to_string('emails/job_application_notification.html', {
-                'job': job,
-                'candidate': candidate,
-                'recruiter': job.recruiter,
-            })
-            
-            plain_message = strip_tags(html_message)
-            
-            send_mail(
-                subject=subject,
-                message=plain_message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[job.recruiter.email],
-                html_message=html_message,
-                fail_silently=False,
-            )
-            return True
-        except Exception as e:
-            print(f"Error sending job application notification: {str(e)}")
-            return False
\ No newline at end of file
+    def send_job_application_notification(job, candidate, dedupe_key=''):
+
+        subject = f'New Application for {job.title}'
+        
+        html_message = render_to_string('emails/job_application_notification.html', {
+            'job': job,
+            'candidate': candidate,
+            'recruiter': job.recruiter,
+        })
+        
+        plain_message = strip_tags(html_message)
+        
+        EmailOutbox.objects.enqueue(
+            subject=subject,
+            body=plain_message,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            recipients=[job.recruiter.email],
+            html_body=html_message,
+            dedupe_key=dedupe_key,
+        )
+
+    @staticmethod
+    def send_application_digest(recruiter, jobs, dedupe_key=''):
+
+        total = sum(job['applications'] for job in jobs)
+        subject = f'{total} new application{"s" if total != 1 else ""} on JobSite'
+        html_message = render_to_string('emails/application_digest.html', {
+            'recruiter': recruiter,
+            'jobs': jobs,
+            'total': total,
+        })
+        EmailOutbox.objects.enqueue(
+            subject=subject,
+            body=strip_tags(html_message),
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            recipients=[recruiter.email],
+            html_body=html_message,
+            dedupe_key=dedupe_key,
+        )
+
+    @staticmethod
+    def send_application_confirmation(job, candidate, dedupe_key=''):
+
+        subject = 'Application Submitted Successfully'
+        message = f'Hi {candidate.get_full_name()},\n\n' \
+                 f'Your application for "{job.title}" has been received.\n\n' \
+                 f'We will review your application and get back to you soon.\n\n' \
+                 f'Regards,\nJobSite Team'
+        EmailOutbox.objects.enqueue(
+            subject,
+            message,
+            [candidate.email],
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            dedupe_key=dedupe_key,
+        )
\ No newline at end of file
@@ -14,3 +14,10 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 application = get_asgi_application()
+
+from django.conf import settings  # noqa: E402
+
+if settings.JOB_SCHEDULER_IN_PROCESS:
+    from job.scheduler import start_in_background
+
+    start_in_background()
@@ -14,7 +14,7 @@ import os
 
 from pathlib import Path
 from datetime import timedelta
-from decouple import config  # For environment variables #added_by_me
+from decouple import Csv, config  # For environment variables #added_by_me
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -59,15 +59,21 @@ AUTH_USER_MODEL = "core.User"
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "shared.middleware.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "silk.middleware.SilkyMiddleware",
 ]
 
+# Request profiling. Silk's middleware is sync-only, so under ASGI it puts
+# every request (async views included) through a thread hop; turn it off there.
+ENABLE_SILK = config("ENABLE_SILK", default=True, cast=bool)
+if ENABLE_SILK:
+    MIDDLEWARE.append("silk.middleware.SilkyMiddleware")
+
 ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
@@ -98,6 +104,54 @@ DATABASES = {
     }
 }
 
+# Database profile. "development" keeps Django's SQLite defaults;
+# "production" uses SQLITE_PRODUCTION_PROFILE: persistent, health-checked
+# connections, BEGIN IMMEDIATE for atomic blocks (no failed lock upgrades
+# under concurrent writers) and the PRAGMAS that core.signals runs on
+# every new connection.
+DATABASE_PROFILE = config("DATABASE_PROFILE", default="development")
+SQLITE_PRODUCTION_PROFILE = {
+    "CONN_MAX_AGE": 600,
+    "CONN_HEALTH_CHECKS": True,
+    "OPTIONS": {"transaction_mode": "IMMEDIATE"},
+    "PRAGMAS": {
+        "journal_mode": "WAL",  # readers and the writer stop blocking each other
+        "synchronous": "NORMAL",  # fsync at checkpoints only; durable across app crashes in WAL mode
+        "busy_timeout": 5000,  # ms to wait for the write lock before "database is locked"
+        "cache_size": -65536,  # 64 MiB page cache per connection
+        "mmap_size": 268435456,  # 256 MiB of the file read through mmap
+        "temp_store": "MEMORY",
+    },
+}
+if DATABASE_PROFILE == "production":
+    DATABASES["default"].update(SQLITE_PRODUCTION_PROFILE)
+
+# Read replicas: comma-separated SQLite files kept in sync with
+# `manage.py sync_sqlite_replicas`. Safe-method requests read from them;
+# writes, and reads by anyone who wrote in the last
+# DATABASE_PRIMARY_STICKY_SECONDS, use the primary.
+DATABASE_REPLICA_PATHS = config("DATABASE_REPLICA_PATHS", default="", cast=Csv())
+DATABASE_REPLICAS = []
+for index, replica_path in enumerate(DATABASE_REPLICA_PATHS, start=1):
+    DATABASES[f"replica_{index}"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": f"file:{Path(replica_path).resolve()}?mode=ro",
+        "OPTIONS": {"uri": True},
+        "TEST": {"MIRROR": "default"},
+        "CONN_MAX_AGE": DATABASES["default"].get("CONN_MAX_AGE", 0),
+        "CONN_HEALTH_CHECKS": DATABASES["default"].get("CONN_HEALTH_CHECKS", False),
+        # Read-only connections cannot change the journal or sync mode.
+        "PRAGMAS": {
+            name: value for name, value in DATABASES["default"].get("PRAGMAS", {}).items()
+            if name not in ("journal_mode", "synchronous")
+        },
+    }
+    DATABASE_REPLICAS.append(f"replica_{index}")
+
+DATABASE_ROUTERS = ["shared.db_router.PrimaryReplicaRouter"]
+DATABASE_PRIMARY_STICKY_SECONDS = 5
+DATABASE_PIN_CACHE_ALIAS = "default"
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -146,7 +200,7 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # Settings for Django REST Framework
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "authapp.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
@@ -156,8 +210,115 @@ REST_FRAMEWORK = {
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(days=60),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=60),
+    "TOKEN_OBTAIN_SERIALIZER": "authapp.rest.serializers.serializers.UserTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "authapp.rest.serializers.serializers.UserTokenRefreshSerializer",
 }
 
+# Authenticated users are served from a per-process LRU for up to this long
+# (authapp.authentication.CachedJWTAuthentication)
+AUTH_PRINCIPAL_CACHE_SIZE = 10000
+AUTH_PRINCIPAL_CACHE_TTL_SECONDS = 60
+
+# Password hashing (shared.hashing): PBKDF2 runs on a pool of WORKERS processes.
+# Once MAX_PENDING checks are queued or running, further logins, sign-ups and
+# resets get an immediate 503 with Retry-After.
+PASSWORD_HASHING_POOL_ENABLED = config("PASSWORD_HASHING_POOL_ENABLED", default=True, cast=bool)
+PASSWORD_HASHING_WORKERS = config("PASSWORD_HASHING_WORKERS", default=2, cast=int)
+PASSWORD_HASHING_MAX_PENDING = 16
+
+# Sliding-window rate limits (shared.throttling), keyed "<throttle_scope>_<ip|email|user>".
+# THROTTLE_BACKEND "local" counts per process; "cache" shares counters through
+# THROTTLE_CACHE_ALIAS, which should then point at a cache every worker can reach.
+THROTTLE_BACKEND = config("THROTTLE_BACKEND", default="local")
+THROTTLE_CACHE_ALIAS = "default"
+THROTTLE_RATES = {
+    "login_ip": "30/min",
+    "login_email": "10/min",
+    "register_ip": "10/hour",
+    "forgot_password_ip": "10/hour",
+    "forgot_password_email": "3/hour",
+    "apply_user": "30/hour",
+}
+
+# Revoked JWTs (authapp.revocation): each process pulls new revocations every
+# SYNC_SECONDS and rebuilds its Bloom filter from unexpired rows every
+# REBUILD_SECONDS. Delete expired rows with `manage.py prune_revoked_tokens`.
+TOKEN_REVOCATION_SYNC_SECONDS = 2
+TOKEN_REVOCATION_REBUILD_SECONDS = 3600
+TOKEN_REVOCATION_BLOOM_CAPACITY = 100000
+TOKEN_REVOCATION_BLOOM_ERROR_RATE = 0.001
+TOKEN_REVOCATION_EXACT_SIZE = 10000
+
+# Job matching engine
+JOB_MATCHING_REFRESH_SECONDS = 60
+JOB_MATCHING_WEIGHTS = {
+    "skills": 0.6,
+    "experience": 0.25,
+    "location": 0.15,
+}
+
+# Email outbox (drained by `manage.py run_mail_worker`)
+EMAIL_OUTBOX_BATCH_SIZE = 50
+EMAIL_OUTBOX_POLL_SECONDS = 5
+EMAIL_OUTBOX_MAX_ATTEMPTS = 5
+EMAIL_OUTBOX_RETRY_BASE_SECONDS = 30
+EMAIL_OUTBOX_RETRY_MAX_SECONDS = 3600
+EMAIL_OUTBOX_LEASE_SECONDS = 300
+
+# Recruiter application digests: flushed once the oldest pending application
+# is this old, or as soon as this many are pending.
+APPLICATION_DIGEST_INTERVAL_SECONDS = 3600
+APPLICATION_DIGEST_MAX_PENDING = 50
+
+# Caching. LocMemCache is per process; point "default" at a shared backend
+# (Redis, Memcached) when running several workers so invalidations reach all.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "jobsite",
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    }
+}
+
+# Job list/detail response cache (job.cache)
+JOB_RESPONSE_CACHE_ENABLED = True
+JOB_RESPONSE_CACHE_ALIAS = "default"
+JOB_RESPONSE_CACHE_TTL = 60
+
+# Job lifecycle scheduler (job.scheduler): publishes drafts at publish_at and
+# closes jobs past their deadline. Run `manage.py run_job_scheduler`, or set
+# JOB_SCHEDULER_IN_PROCESS to start a thread from config.wsgi / config.asgi.
+JOB_SCHEDULER_IN_PROCESS = False
+JOB_SCHEDULER_BATCH_SIZE = 500
+JOB_SCHEDULER_HORIZON_SECONDS = 3600
+JOB_SCHEDULER_RELOAD_SECONDS = 60
+JOB_SCHEDULER_HEAP_SIZE = 1000
+
+# Public job ids are reserved from the database this many at a time per process
+JOB_ID_BLOCK_SIZE = 100
+
+# Bulk job import (jobs/import/ and manage.py import_jobs)
+JOB_IMPORT_BATCH_SIZE = 500
+JOB_IMPORT_MAX_ERRORS = 1000
+
+# Rows fetched per database round trip by applications/export/
+APPLICATION_EXPORT_CHUNK_SIZE = 2000
+
+# Funnel POST jobs/<id>/apply/ through one writer thread per process that
+# group-commits up to BATCH_SIZE applications per transaction (job.write_behind).
+# Callers wait up to TIMEOUT_SECONDS before getting a 503.
+APPLICATION_WRITE_BEHIND_ENABLED = config("APPLICATION_WRITE_BEHIND_ENABLED", default=False, cast=bool)
+APPLICATION_WRITE_BEHIND_BATCH_SIZE = 50
+APPLICATION_WRITE_BEHIND_MAX_DELAY_MS = 2
+APPLICATION_WRITE_BEHIND_TIMEOUT_SECONDS = 10
+
+# Saves of existing BaseModel rows write only the changed columns (plus
+# updated_at) and skip the query when nothing changed (shared.base_model).
+DIRTY_FIELD_SAVES_ENABLED = config("DIRTY_FIELD_SAVES_ENABLED", default=True, cast=bool)
+
+# Serve async versions of the job read endpoints under /api/v1/async/jobs/ (for ASGI)
+ASYNC_READ_ENDPOINTS = config("ASYNC_READ_ENDPOINTS", default=True, cast=bool)
+
 # Swagger settings
 ENABLE_SWAGGER = True
 
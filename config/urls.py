@@ -37,8 +37,12 @@ urlpatterns = [
     path("api/v1/jobs/", include("job.rest.urls")),
 ]
 
+if settings.ASYNC_READ_ENDPOINTS:
+    # Native async job/application reads for ASGI deployments.
+    urlpatterns += [path("api/v1/async/jobs/", include("job.rest.async_urls"))]
 
-urlpatterns += [path("silk/", include("silk.urls", namespace="silk"))]
+if settings.ENABLE_SILK:
+    urlpatterns += [path("silk/", include("silk.urls", namespace="silk"))]
 
 
 if settings.DEBUG:
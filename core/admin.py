@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from core.models import User, UserProfile
+from core.models import EmailOutbox, Skill, User, UserProfile
 
 from shared.base_admin import BaseModelAdmin
 
@@ -54,3 +54,24 @@ class UserProfileAdmin(BaseModelAdmin):
         "date_of_birth",
         "gender",
     ]
+
+
+@admin.register(Skill)
+class SkillAdmin(BaseModelAdmin):
+    model = Skill
+    list_display = ["name", "canonical_name", "created_at"]
+    search_fields = ("name", "canonical_name")
+
+
+@admin.register(EmailOutbox)
+class EmailOutboxAdmin(BaseModelAdmin):
+    model = EmailOutbox
+    list_display = ["subject", "recipients", "delivery_status", "attempts", "next_attempt_at", "sent_at"]
+    list_filter = ["delivery_status"]
+    search_fields = ("subject", "dedupe_key")
+    readonly_fields = BaseModelAdmin.readonly_fields + [
+        "attempts",
+        "claim_token",
+        "sent_at",
+        "last_error",
+    ]
@@ -20,3 +20,16 @@ class StatusChoices(models.TextChoices):
     INACTIVE = "INACTIVE", "Inactive"
     PENDING = "PENDING", "Pending"
     SUSPENDED = "SUSPENDED", "Suspended"
+
+
+class EmailDeliveryChoices(models.TextChoices):
+    """Delivery state of a queued outbound email"""
+    PENDING = "PENDING", "Pending"
+    SENT = "SENT", "Sent"
+    FAILED = "FAILED", "Failed"
+
+
+class ApplicationEmailModeChoices(models.TextChoices):
+    """How a recruiter is told about new applications"""
+    IMMEDIATE = "IMMEDIATE", "One email per application"
+    DIGEST = "DIGEST", "Periodic digest"
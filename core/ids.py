@@ -0,0 +1,124 @@
+""" Block-reserving ID allocator for human-readable public identifiers. """
+
+import threading
+from collections import deque
+
+from django.db import transaction
+
+from core.models import IdSequence
+
+
+# Affine map n -> (MULTIPLIER * n + OFFSET) mod 10**width. MULTIPLIER is
+# coprime with 10, so the map is a permutation of each width's space:
+# consecutive counter values give unrelated-looking but never repeating ids.
+MULTIPLIER = 7_368_787
+OFFSET = 104_729
+
+SCREEN_CHUNK_SIZE = 500
+
+
+def permute(value, width):
+
+    space = 10 ** width
+    return (MULTIPLIER * value + OFFSET) % space
+
+
+class IdAllocator:
+    """
+    Hands out ``<prefix><digits>`` ids from blocks reserved on an
+    ``IdSequence`` row: one short transaction per block instead of a
+    random guess plus an ``exists()`` query per id.
+
+    Reserved values are permuted within the current width, and ids that
+    already exist (e.g. older randomly generated ones) are screened out
+    with one query per block. Spare ids go into an in-process pool only
+    once the reserving transaction commits, so a rollback can never leave
+    this process holding ids another process is about to reserve.
+
+    A reservation made inside the caller's transaction nests in it, and
+    the ``IdSequence`` row lock (on SQLite, the database write lock) is
+    then held until that outer transaction commits. Callers that open one
+    around their inserts should ``prefill`` the pool first.
+    """
+
+    def __init__(self, name, prefix, model, field, initial_width=6, block_size=100):
+
+        self.name = name
+        self.prefix = prefix
+        self.model = model
+        self.field = field
+        self.initial_width = initial_width
+        self.block_size = block_size
+        self._pool = deque()
+        self._lock = threading.Lock()
+
+    def format(self, value, width):
+
+        return f"{self.prefix}{permute(value, width):0{width}d}"
+
+    def reserve(self, count):
+        """ Advance the sequence by up to ``count`` values and return ``(start, stop, width)``. """
+
+        with transaction.atomic():
+            IdSequence.objects.get_or_create(name=self.name, defaults={"width": self.initial_width})
+            sequence = IdSequence.objects.select_for_update().get(name=self.name)
+            start, width = sequence.next_value, sequence.width
+            if start >= 10 ** width:
+                # This width is exhausted; move to the next one.
+                start, width = 0, width + 1
+            stop = min(start + count, 10 ** width)
+            IdSequence.objects.filter(name=self.name).update(next_value=stop, width=width)
+        return start, stop, width
+
+    def screen(self, ids):
+        """ Drop ids that already exist in the target table. """
+
+        taken = set()
+        for index in range(0, len(ids), SCREEN_CHUNK_SIZE):
+            chunk = ids[index:index + SCREEN_CHUNK_SIZE]
+            taken.update(
+                self.model._base_manager.filter(**{f"{self.field}__in": chunk})
+                .values_list(self.field, flat=True)
+            )
+        return [value for value in ids if value not in taken]
+
+    def allocate_block(self, count):
+
+        ids = []
+        while len(ids) < count:
+            start, stop, width = self.reserve(count - len(ids))
+            ids.extend(self.screen([self.format(value, width) for value in range(start, stop)]))
+        return ids
+
+    def take(self, count):
+        """ Return ``count`` unused ids. """
+
+        with self._lock:
+            ids = [self._pool.popleft() for _ in range(min(count, len(self._pool)))]
+
+        missing = count - len(ids)
+        if missing:
+            block = self.allocate_block(max(missing, self.block_size))
+            ids.extend(block[:missing])
+            spare = block[missing:]
+            if spare:
+                transaction.on_commit(lambda: self.release(spare))
+        return ids
+
+    def prefill(self, count):
+        """ Pool at least ``count`` ids now, so ``take(count)`` inside a later transaction skips the sequence row. """
+
+        with self._lock:
+            missing = count - len(self._pool)
+        if missing > 0:
+            block = self.allocate_block(max(missing, self.block_size))
+            transaction.on_commit(lambda: self.release(block))
+
+    def release(self, ids):
+
+        with self._lock:
+            self._pool.extend(ids)
+
+    def allocate(self):
+
+        return self.take(1)[0]
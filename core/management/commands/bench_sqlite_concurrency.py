@@ -0,0 +1,153 @@
+import os
+import random
+import tempfile
+import threading
+import time
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.choices import UserRoleChoices
+from core.management.commands.sync_sqlite_replicas import copy_database
+from core.models import EmailOutbox, User
+from job.choices import JobStatusChoices
+from job.models import Job
+from shared.benchmark import summarize, timed, write_table
+from shared.choices import StatusChoices
+
+
+class Command(BaseCommand):
+
+    help = "Compare concurrent read/write throughput of the development and production SQLite profiles."
+
+    def add_arguments(self, parser):
+
+        parser.add_argument('--readers', type=int, default=8, help="Threads running job list reads.")
+        parser.add_argument('--writers', type=int, default=4, help="Threads running apply-style writes.")
+        parser.add_argument('--seconds', type=float, default=5.0, help="Duration of each profile's run.")
+        parser.add_argument('--jobs', type=int, default=500, help="Jobs in the benchmark database.")
+
+    def read(self, alias, job_ids):
+
+        jobs = Job.objects.using(alias).filter(
+            job_status=JobStatusChoices.PUBLISHED, status=StatusChoices.ACTIVE
+        )
+        list(jobs.order_by('-created_at').values('pk', 'title', 'deadline')[:20])
+        jobs.count()
+
+    def write(self, alias, job_ids):
+
+        # Read, then write in one transaction, like an apply: with deferred
+        # transactions the lock upgrade is where "database is locked" shows up.
+        with transaction.atomic(using=alias):
+            job = Job.objects.using(alias).values('pk', 'recruiter_id').get(pk=random.choice(job_ids))
+            EmailOutbox.objects.using(alias).bulk_create([
+                EmailOutbox(subject='bench', body='bench', recipients=['bench@example.com'])
+            ])
+            Job.objects.using(alias).filter(pk=job['pk']).update(
+                total_applications=F('total_applications') + 1
+            )
+
+    def worker(self, alias, operation, job_ids, stop_at, results):
+
+        connection = connections[alias]
+        samples, errors = [], 0
+        try:
+            while time.monotonic() < stop_at:
+                # What request_started/request_finished do around each request.
+                connection.close_if_unusable_or_obsolete()
+                try:
+                    with timed(samples):
+                        operation(alias, job_ids)
+                except OperationalError:
+                    samples.pop()
+                    errors += 1
+        finally:
+            connection.close()
+        results.append((samples, errors))
+
+    def run_profile(self, alias, job_ids, options):
+
+        stop_at = time.monotonic() + options['seconds']
+        results = {'read': [], 'write': []}
+        threads = [
+            threading.Thread(target=self.worker, args=(alias, self.read, job_ids, stop_at, results['read']))
+            for _ in range(options['readers'])
+        ] + [
+            threading.Thread(target=self.worker, args=(alias, self.write, job_ids, stop_at, results['write']))
+            for _ in range(options['writers'])
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        rows = []
+        for kind, outcomes in results.items():
+            samples = [sample for worker_samples, _ in outcomes for sample in worker_samples]
+            errors = sum(worker_errors for _, worker_errors in outcomes)
+            stats = summarize(samples)
+            rows.append([
+                kind, len(samples), len(samples) / options['seconds'], errors,
+                stats['mean'], stats['p95'],
+            ])
+        return rows
+
+    def handle(self, *args, **options):
+
+        primary = settings.DATABASES[DEFAULT_DB_ALIAS]
+        if primary['ENGINE'] != 'django.db.backends.sqlite3':
+            raise CommandError("This benchmark compares SQLite profiles; the default database is not SQLite.")
+
+        tag = uuid.uuid4().hex[:8]
+        recruiter = User.objects.bulk_create([User(
+            email=f'bench-{tag}-recruiter@example.com', username=f'bench-{tag}-recruiter@example.com',
+            first_name='Bench', last_name='Recruiter', password='!', role=UserRoleChoices.RECRUITER,
+        )])[0]
+        deadline = timezone.now() + timedelta(days=30)
+        job_ids = [job.pk for job in Job.objects.bulk_create([
+            Job(
+                title=f'Bench job {index}', description='Benchmark job', location='Remote',
+                deadline=deadline, recruiter=recruiter,
+            )
+            for index in range(options['jobs'])
+        ])]
+
+        profiles = [
+            ('development', {}),
+            ('production', settings.SQLITE_PRODUCTION_PROFILE),
+        ]
+        rows = []
+        try:
+            with tempfile.TemporaryDirectory() as directory:
+                for name, profile in profiles:
+                    # Each profile runs on its own copy of the current database.
+                    path = os.path.join(directory, f'{name}.sqlite3')
+                    copy_database(str(primary['NAME']), path)
+                    alias = f'bench_{name}'
+                    connections.settings[alias] = connections.configure_settings({
+                        DEFAULT_DB_ALIAS: dict(primary),
+                        alias: {'ENGINE': primary['ENGINE'], 'NAME': path, **profile},
+                    })[alias]
+                    try:
+                        rows += [[name] + row for row in self.run_profile(alias, job_ids, options)]
+                    finally:
+                        connections[alias].close()
+                        del connections.settings[alias]
+        finally:
+            Job.objects.filter(recruiter=recruiter).delete()
+            recruiter.delete()
+
+        self.stdout.write(
+            f"{options['readers']} readers, {options['writers']} writers, {options['seconds']:.0f}s per profile"
+        )
+        write_table(
+            self.stdout,
+            ['profile', 'operation', 'ops', 'ops/s', 'locked errors', 'mean ms', 'p95 ms'],
+            rows,
+        )
@@ -0,0 +1,67 @@
+import time
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.choices import EmailDeliveryChoices
+from core.models import EmailOutbox
+from core.outbox import drain
+
+
+class Command(BaseCommand):
+
+    help = "Deliver queued outbox emails in batches over a single mail connection."
+
+    def add_arguments(self, parser):
+
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help="Drain what is currently due and exit instead of polling."
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help="Messages claimed per batch (defaults to EMAIL_OUTBOX_BATCH_SIZE)."
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=None,
+            help="Seconds to sleep when the outbox is empty (defaults to EMAIL_OUTBOX_POLL_SECONDS)."
+        )
+        parser.add_argument(
+            '--retry-failed',
+            action='store_true',
+            help="Requeue messages that exhausted their attempts before starting."
+        )
+
+    def handle(self, *args, **options):
+
+        interval = options['interval']
+        if interval is None:
+            interval = getattr(settings, 'EMAIL_OUTBOX_POLL_SECONDS', 5)
+
+        if options['retry_failed']:
+            requeued = EmailOutbox.objects.filter(delivery_status=EmailDeliveryChoices.FAILED).update(
+                delivery_status=EmailDeliveryChoices.PENDING,
+                attempts=0,
+                next_attempt_at=timezone.now(),
+                updated_at=timezone.now(),
+            )
+            self.stdout.write(f"Requeued {requeued} failed messages.")
+
+        connection = get_connection()
+        try:
+            while True:
+                sent, failed = drain(connection, options['batch_size'])
+                if sent or failed:
+                    self.stdout.write(f"Sent {sent}, failed {failed}.")
+                if options['once']:
+                    break
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
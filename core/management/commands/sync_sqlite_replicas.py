@@ -0,0 +1,65 @@
+import sqlite3
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+
+def copy_database(source, target):
+    """
+    Snapshot ``source`` into ``target`` with SQLite's online backup API.
+    The copy is consistent while the primary keeps taking writes, and it is
+    written into the existing replica file under SQLite's own locking, so
+    connections already open on the replica see the new data instead of
+    holding on to a replaced file.
+    """
+    src = sqlite3.connect(source)
+    dst = sqlite3.connect(target, timeout=30)
+    try:
+        src.backup(dst)
+        # The copy inherits the primary's WAL flag; replicas are opened
+        # read-only and need a rollback-journal file.
+        dst.execute("PRAGMA journal_mode = DELETE")
+    finally:
+        dst.close()
+        src.close()
+
+
+class Command(BaseCommand):
+
+    help = "Copy the primary SQLite database to every file in DATABASE_REPLICA_PATHS."
+
+    def add_arguments(self, parser):
+
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help="Keep re-copying instead of exiting after one pass."
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=2.0,
+            help="Seconds between copies with --loop."
+        )
+
+    def handle(self, *args, **options):
+
+        primary = settings.DATABASES[DEFAULT_DB_ALIAS]
+        if primary['ENGINE'] != 'django.db.backends.sqlite3':
+            raise CommandError("Replica copies are only supported for a SQLite primary.")
+        targets = getattr(settings, 'DATABASE_REPLICA_PATHS', [])
+        if not targets:
+            raise CommandError("DATABASE_REPLICA_PATHS is empty; nothing to sync.")
+
+        while True:
+            started = time.monotonic()
+            for target in targets:
+                copy_database(str(primary['NAME']), target)
+            self.stdout.write(
+                f"Copied primary to {len(targets)} replica(s) in {time.monotonic() - started:.2f}s."
+            )
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
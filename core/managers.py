@@ -1,4 +1,6 @@
 from django.contrib.auth.base_user import BaseUserManager
+from django.db import models, transaction
+from django.db.utils import IntegrityError
 
 
 class UserManager(BaseUserManager):
@@ -35,3 +37,91 @@ class UserManager(BaseUserManager):
 
     def get_by_natural_key(self, email):
         return self.get(email=email)
+
+
+class SkillManager(models.Manager):
+
+    @staticmethod
+    def canonicalize(name):
+        """Case-folded, whitespace-collapsed form used as the unique key"""
+        return " ".join(name.split()).casefold()
+
+    def parse(self, text):
+        """Map canonical name -> display name for a comma-separated string"""
+        names = {}
+        for raw in (text or "").split(","):
+            display = " ".join(raw.split())
+            if display:
+                names.setdefault(self.canonicalize(display), display)
+        return names
+
+    def from_names(self, names):
+        """Return skills for a canonical -> display mapping, creating missing ones"""
+        if not names:
+            return []
+
+        skills = {
+            skill.canonical_name: skill
+            for skill in self.filter(canonical_name__in=list(names))
+        }
+        missing = [canonical for canonical in names if canonical not in skills]
+        if missing:
+            self.bulk_create(
+                [self.model(name=names[canonical], canonical_name=canonical) for canonical in missing],
+                ignore_conflicts=True,
+            )
+            skills.update(
+                (skill.canonical_name, skill)
+                for skill in self.filter(canonical_name__in=missing)
+            )
+        return [skills[canonical] for canonical in names if canonical in skills]
+
+    def from_text(self, text):
+
+        return self.from_names(self.parse(text))
+
+
+class EmailOutboxManager(models.Manager):
+
+    def enqueue(self, subject, body, recipients, html_body="", from_email=None, dedupe_key=""):
+        """
+        Queue a message in the caller's transaction and return it, or None
+        when a message with the same ``dedupe_key`` is already queued.
+        """
+        recipients = [address for address in recipients if address]
+        if not recipients:
+            return None
+
+        message = self.model(
+            subject=subject,
+            body=body,
+            html_body=html_body,
+            from_email=from_email or "",
+            recipients=recipients,
+            dedupe_key=dedupe_key,
+        )
+        try:
+            with transaction.atomic(using=self.db):
+                message.save(using=self.db)
+        except IntegrityError:
+            if dedupe_key and self.filter(dedupe_key=dedupe_key).exists():
+                return None
+            raise
+        return message
+
+
+class RevokedTokenManager(models.Manager):
+
+    def revoke(self, jti, token_type, expires_at, user_id=None):
+        """ Record a revoked token; revoking one twice is a no-op. """
+
+        self.bulk_create(
+            [self.model(jti=jti, token_type=token_type, expires_at=expires_at, user_id=user_id)],
+            ignore_conflicts=True,
+        )
+
+    def prune(self, now):
+        """ Delete rows for tokens that have expired by ``now``; returns how many. """
+
+        deleted, _ = self.filter(expires_at__lte=now).delete()
+        return deleted
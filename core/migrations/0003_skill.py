@@ -0,0 +1,39 @@
+# Generated by Django 5.2.1 on 2026-10-17 02:53
+
+import dirtyfields.dirtyfields
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_alter_user_options_alter_userprofile_options_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('uid', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, help_text='Unique identifier for this model instance.', unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Timestamp indicating when the instance was created.')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Timestamp indicating when the instance was last updated.')),
+                ('status', models.CharField(choices=[('ACTIVE', 'Active'), ('INACTIVE', 'Inactive'), ('DELETED', 'Deleted'), ('DRAFT', 'Draft'), ('REMOVED', 'Removed')], default='ACTIVE', help_text='Status of the instance, typically used for soft deletion.', max_length=20)),
+                ('name', models.CharField(help_text='Display name, as first entered', max_length=100)),
+                ('canonical_name', models.CharField(help_text='Case-folded name used for matching', max_length=100, unique=True)),
+            ],
+            options={
+                'verbose_name': 'Skill',
+                'verbose_name_plural': 'Skills',
+                'db_table': 'skills',
+                'ordering': ['canonical_name'],
+            },
+            bases=(dirtyfields.dirtyfields.DirtyFieldsMixin, models.Model),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='skill_tags',
+            field=models.ManyToManyField(blank=True, help_text='Normalized skills, kept in sync with the skills field', related_name='profiles', to='core.skill'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-17 03:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_emailoutbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='application_email_mode',
+            field=models.CharField(choices=[('IMMEDIATE', 'One email per application'), ('DIGEST', 'Periodic digest')], default='IMMEDIATE', help_text='Recruiters: email per application or a periodic digest', max_length=20),
+        ),
+    ]
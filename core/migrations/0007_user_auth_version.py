@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-17 03:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_idsequence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='auth_version',
+            field=models.PositiveIntegerField(default=1, help_text='Bumped when role, status or password change; tokens stamped with an older value are rejected'),
+        ),
+    ]
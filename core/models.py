@@ -1,12 +1,17 @@
 from django.contrib.auth.base_user import  AbstractBaseUser
-from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import PermissionsMixin
 from django.db import models
+from django.utils import timezone
 
-from core.choices import GenderChoices,UserRoleChoices
-from core.managers import UserManager
+from core.choices import ApplicationEmailModeChoices, EmailDeliveryChoices, GenderChoices, UserRoleChoices
+from core.managers import EmailOutboxManager, RevokedTokenManager, SkillManager, UserManager
+from shared import hashing
 from shared.base_model import BaseModel
 
+# Changing any of these invalidates the user's outstanding tokens
+AUTH_VERSION_FIELDS = ("password", "role", "status")
+
+
 #User model with role
 class User(AbstractBaseUser, PermissionsMixin, BaseModel):
     username = models.CharField(max_length=50, unique=True, db_index=True)
@@ -31,6 +36,11 @@ class User(AbstractBaseUser, PermissionsMixin, BaseModel):
 
     is_email_verified = models.BooleanField(default=False)
 
+    auth_version = models.PositiveIntegerField(
+        default=1,
+        help_text="Bumped when role, status or password change; tokens stamped with an older value are rejected"
+    )
+
 
     objects = UserManager()
 
@@ -59,17 +69,61 @@ class User(AbstractBaseUser, PermissionsMixin, BaseModel):
         if not self.pk:
 
             if self.password:
-                self.password = make_password(self.password)
+                self.password = hashing.make_password(self.password)
 
             self.username = self.email if not self.username else self.username
 
 
         if self.new_password:
-            self.password = make_password(self.new_password)
+            self.set_password(self.new_password)
             self.new_password = ""
 
+        if not self._state.adding:
+            self.bump_auth_version(kwargs)
+
         super().save(*args, **kwargs)
 
+    # PBKDF2 runs on shared.hashing's process pool
+
+    def set_password(self, raw_password):
+
+        self.password = hashing.make_password(raw_password)
+        self._password = raw_password
+
+    def check_password(self, raw_password):
+
+        def setter(raw_password):
+            self.set_password(raw_password)
+            # Password hash upgrades shouldn't be considered password changes.
+            self._password = None
+            self.save(update_fields=["password"])
+
+        return hashing.check_password(raw_password, self.password, setter)
+
+    async def acheck_password(self, raw_password):
+
+        async def setter(raw_password):
+            self.password = await hashing.amake_password(raw_password)
+            self._password = None
+            await self.asave(update_fields=["password"])
+
+        return await hashing.acheck_password(raw_password, self.password, setter)
+
+    def bump_auth_version(self, save_kwargs):
+
+        update_fields = save_kwargs.get("update_fields")
+        dirty = self.get_dirty_fields()
+        changed = [
+            field for field in AUTH_VERSION_FIELDS
+            if field in dirty and (update_fields is None or field in update_fields)
+            # A rehash on login (set by check_password's setter) keeps the password
+            and not (field == "password" and self._password is None)
+        ]
+        if changed:
+            self.auth_version += 1
+            if update_fields is not None:
+                save_kwargs["update_fields"] = {*update_fields, "auth_version"}
+
     @property
     def is_recruiter(self):
 
@@ -80,6 +134,31 @@ class User(AbstractBaseUser, PermissionsMixin, BaseModel):
 
         return self.role == UserRoleChoices.CANDIDATE
 
+class Skill(BaseModel):
+    """Normalized skill shared by job postings and candidate profiles"""
+
+    name = models.CharField(
+        max_length=100,
+        help_text="Display name, as first entered"
+    )
+    canonical_name = models.CharField(
+        max_length=100,
+        unique=True,
+        help_text="Case-folded name used for matching"
+    )
+
+    objects = SkillManager()
+
+    class Meta:
+        db_table = "skills"
+        verbose_name = "Skill"
+        verbose_name_plural = "Skills"
+        ordering = ["canonical_name"]
+
+    def __str__(self):
+        return self.name
+
+
 class UserProfile(BaseModel):
 
     user = models.OneToOneField(
@@ -118,11 +197,23 @@ class UserProfile(BaseModel):
         blank=True,
         help_text="Comma-separated list of skills"
     )
+    skill_tags = models.ManyToManyField(
+        Skill,
+        blank=True,
+        related_name="profiles",
+        help_text="Normalized skills, kept in sync with the skills field"
+    )
     experience_years = models.PositiveIntegerField(
         null=True, 
         blank=True,
         help_text="Years of experience"
     )
+    application_email_mode = models.CharField(
+        max_length=20,
+        choices=ApplicationEmailModeChoices.choices,
+        default=ApplicationEmailModeChoices.IMMEDIATE,
+        help_text="Recruiters: email per application or a periodic digest"
+    )
 
     class Meta:
         db_table = "user_profiles"
@@ -140,5 +231,106 @@ class UserProfile(BaseModel):
     
 
 
+class EmailOutbox(BaseModel):
+    """
+    Outbound email written in the same transaction as the event that
+    triggers it and delivered later by ``manage.py run_mail_worker``.
+    """
+
+    dedupe_key = models.CharField(
+        max_length=191,
+        blank=True,
+        help_text="Messages sharing a non-empty key are only queued once"
+    )
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    html_body = models.TextField(blank=True)
+    from_email = models.CharField(max_length=254, blank=True)
+    recipients = models.JSONField(default=list)
+
+    delivery_status = models.CharField(
+        max_length=20,
+        choices=EmailDeliveryChoices.choices,
+        default=EmailDeliveryChoices.PENDING
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now,
+        help_text="Earliest time a worker may (re)try this message"
+    )
+    claim_token = models.CharField(max_length=32, blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    objects = EmailOutboxManager()
+
+    class Meta:
+        db_table = "email_outbox"
+        verbose_name = "Email Outbox Message"
+        verbose_name_plural = "Email Outbox"
+        ordering = ["next_attempt_at", "id"]
+        indexes = [
+            models.Index(fields=["delivery_status", "next_attempt_at"]),
+            models.Index(fields=["claim_token"]),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["dedupe_key"],
+                condition=~models.Q(dedupe_key=""),
+                name="email_outbox_unique_dedupe_key",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.recipients)}"
 
 
+class IdSequence(models.Model):
+    """
+    Counter behind ``core.ids.IdAllocator``. Each allocator reserves a block
+    by advancing ``next_value``; ``width`` is the current number of digits
+    and grows by one whenever that space is used up.
+    """
+
+    name = models.CharField(max_length=50, primary_key=True)
+    next_value = models.BigIntegerField(default=0)
+    width = models.PositiveSmallIntegerField(default=6)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "id_sequences"
+        verbose_name = "ID Sequence"
+        verbose_name_plural = "ID Sequences"
+
+    def __str__(self):
+        return f"{self.name}: {self.next_value} (width {self.width})"
+
+
+class RevokedToken(models.Model):
+    """
+    A JWT (access or refresh) that must no longer be accepted, kept until
+    the token would have expired anyway. ``authapp.revocation`` mirrors the
+    table in memory for per-request checks.
+    """
+
+    jti = models.CharField(max_length=255, unique=True)
+    token_type = models.CharField(max_length=20)
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="revoked_tokens"
+    )
+    expires_at = models.DateTimeField(db_index=True)
+    revoked_at = models.DateTimeField(auto_now_add=True)
+
+    objects = RevokedTokenManager()
+
+    class Meta:
+        db_table = "revoked_tokens"
+        verbose_name = "Revoked Token"
+        verbose_name_plural = "Revoked Tokens"
+
+    def __str__(self):
+        return f"{self.token_type} {self.jti}"
@@ -0,0 +1,177 @@
+""" Delivery of queued ``EmailOutbox`` messages over one reused mail connection. """
+
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db.models import F
+from django.utils import timezone
+
+from core.choices import EmailDeliveryChoices
+from core.models import EmailOutbox
+
+
+DEFAULTS = {
+    'BATCH_SIZE': 50,
+    'MAX_ATTEMPTS': 5,
+    'RETRY_BASE_SECONDS': 30,
+    'RETRY_MAX_SECONDS': 3600,
+    'LEASE_SECONDS': 300,
+}
+
+
+def outbox_setting(name):
+
+    return getattr(settings, f'EMAIL_OUTBOX_{name}', DEFAULTS[name])
+
+
+def retry_delay(attempts):
+    """ Exponential backoff after the ``attempts``-th failed delivery. """
+
+    base = outbox_setting('RETRY_BASE_SECONDS')
+    return timedelta(seconds=min(base * 2 ** max(attempts - 1, 0), outbox_setting('RETRY_MAX_SECONDS')))
+
+
+def claim_batch(batch_size=None):
+    """
+    Lease up to ``batch_size`` due messages to this worker.
+
+    Claiming pushes ``next_attempt_at`` past the lease, so concurrent
+    workers skip the rows and a crashed worker's rows become due again
+    once the lease runs out.
+    """
+    now = timezone.now()
+    token = uuid.uuid4().hex
+    due = EmailOutbox.objects.filter(
+        delivery_status=EmailDeliveryChoices.PENDING,
+        next_attempt_at__lte=now,
+    )
+    batch_size = batch_size or outbox_setting('BATCH_SIZE')
+    ids = list(due.order_by('next_attempt_at', 'pk').values_list('pk', flat=True)[:batch_size])
+    if not ids:
+        return []
+
+    due.filter(pk__in=ids).update(
+        claim_token=token,
+        next_attempt_at=now + timedelta(seconds=outbox_setting('LEASE_SECONDS')),
+        updated_at=now,
+    )
+    return list(EmailOutbox.objects.filter(claim_token=token).order_by('pk'))
+
+
+def build_message(message, connection):
+
+    email = EmailMultiAlternatives(
+        subject=message.subject,
+        body=message.body,
+        from_email=message.from_email or settings.DEFAULT_FROM_EMAIL,
+        to=message.recipients,
+        connection=connection,
+    )
+    if message.html_body:
+        email.attach_alternative(message.html_body, 'text/html')
+    return email
+
+
+def record_results(sent, failures):
+
+    now = timezone.now()
+    if sent:
+        EmailOutbox.objects.filter(pk__in=sent).update(
+            delivery_status=EmailDeliveryChoices.SENT,
+            attempts=F('attempts') + 1,
+            sent_at=now,
+            claim_token='',
+            last_error='',
+            updated_at=now,
+        )
+
+    max_attempts = outbox_setting('MAX_ATTEMPTS')
+    for message, error in failures:
+        attempts = message.attempts + 1
+        EmailOutbox.objects.filter(pk=message.pk).update(
+            delivery_status=(
+                EmailDeliveryChoices.FAILED if attempts >= max_attempts else EmailDeliveryChoices.PENDING
+            ),
+            attempts=attempts,
+            next_attempt_at=now + retry_delay(attempts),
+            claim_token='',
+            last_error=f'{type(error).__name__}: {error}',
+            updated_at=now,
+        )
+
+
+def reconnect(connection):
+    """ Drop a connection that may be broken after a failed send and open a fresh one. """
+
+    try:
+        connection.close()
+    except Exception:
+        pass
+    try:
+        connection.open()
+    except Exception:
+        # The next send fails and is recorded against its own message.
+        pass
+
+
+def deliver_batch(connection, batch_size=None):
+    """
+    Claim one batch and send it over ``connection``; return
+    ``(claimed, sent, failed)``.
+
+    Messages go through ``send_messages`` one at a time on the already open
+    connection so a rejected recipient only fails its own message.
+    """
+    messages = claim_batch(batch_size)
+    if not messages:
+        return 0, 0, 0
+
+    sent, failures = [], []
+    try:
+        opened = connection.open()
+    except Exception as exc:
+        failures = [(message, exc) for message in messages]
+    else:
+        try:
+            for message in messages:
+                try:
+                    if connection.send_messages([build_message(message, connection)]):
+                        sent.append(message.pk)
+                    else:
+                        failures.append((message, RuntimeError('backend reported nothing sent')))
+                except Exception as exc:
+                    failures.append((message, exc))
+                    reconnect(connection)
+        finally:
+            if opened:
+                connection.close()
+
+    record_results(sent, failures)
+    return len(messages), len(sent), len(failures)
+
+
+def drain(connection=None, batch_size=None):
+    """
+    Deliver batches until nothing is due, keeping one connection open for
+    the whole run. Returns ``(sent, failed)``.
+    """
+    connection = connection or get_connection()
+    total_sent = total_failed = 0
+    try:
+        opened = connection.open()
+    except Exception:
+        # Let deliver_batch record the failure against the claimed rows.
+        opened = False
+    try:
+        while True:
+            claimed, sent, failed = deliver_batch(connection, batch_size)
+            total_sent += sent
+            total_failed += failed
+            if claimed < (batch_size or outbox_setting('BATCH_SIZE')):
+                break
+    finally:
+        if opened:
+            connection.close()
+    return total_sent, total_failed
@@ -1,7 +1,8 @@
+from django.db.backends.signals import connection_created
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
-from core.models import User, UserProfile
+from core.models import Skill, User, UserProfile
 
 
 @receiver(post_save, sender=User)
@@ -9,3 +10,26 @@ def create_user_profile(sender, instance, created, **kwargs):
 
     if created:
         UserProfile.objects.get_or_create(user=instance)
+
+
+@receiver(post_save, sender=UserProfile)
+def sync_profile_skill_tags(sender, instance, created, update_fields=None, raw=False, **kwargs):
+
+    if raw:
+        return
+    if created and not instance.skills:
+        return
+    if not created and update_fields is not None and "skills" not in update_fields:
+        return
+    instance.skill_tags.set(Skill.objects.from_text(instance.skills))
+
+
+@receiver(connection_created)
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """Run the alias' ``PRAGMAS`` (see DATABASE_PROFILE) once per new SQLite connection"""
+    pragmas = connection.settings_dict.get("PRAGMAS")
+    if connection.vendor != "sqlite" or not pragmas:
+        return
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
@@ -24,7 +24,8 @@ class JobAdmin(BaseModelAdmin):
         'recruiter__first_name', 'recruiter__last_name', 'recruiter__email'
     ]
     readonly_fields = BaseModelAdmin.readonly_fields + [
-        'unique_job_id', 'total_applications'
+        'unique_job_id', 'total_applications', 'pending_applications',
+        'shortlisted_applications', 'accepted_applications', 'rejected_applications'
     ]
     
     fieldsets = (
@@ -44,7 +45,10 @@ class JobAdmin(BaseModelAdmin):
             'fields': ('deadline',)
         }),
         ('Statistics', {
-            'fields': ('total_applications',),
+            'fields': (
+                'total_applications', 'pending_applications', 'shortlisted_applications',
+                'accepted_applications', 'rejected_applications'
+            ),
             'classes': ('collapse',)
         }),
         ('System Fields', {
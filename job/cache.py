@@ -0,0 +1,227 @@
+""" Role-scoped response cache for the job endpoints, invalidated by generation numbers. """
+
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Min, Q
+from django.utils import timezone
+from rest_framework.response import Response
+
+from core.choices import UserRoleChoices
+
+
+KEY_PREFIX = 'jobcache'
+
+# Candidates all see the same published jobs; recruiters see their own;
+# anyone else (staff, users without a role) sees every active job.
+PUBLIC_SCOPE = 'public'
+ALL_SCOPE = 'all'
+SCOPE_KINDS = (PUBLIC_SCOPE, 'recruiter', ALL_SCOPE)
+
+
+def is_enabled():
+
+    return getattr(settings, 'JOB_RESPONSE_CACHE_ENABLED', True)
+
+
+def get_cache():
+
+    return caches[getattr(settings, 'JOB_RESPONSE_CACHE_ALIAS', 'default')]
+
+
+def scope_for(user):
+
+    role = getattr(user, 'role', None)
+    if role == UserRoleChoices.CANDIDATE:
+        return PUBLIC_SCOPE
+    if role == UserRoleChoices.RECRUITER:
+        return f'recruiter:{user.pk}'
+    return ALL_SCOPE
+
+
+def scope_kind(scope):
+
+    return scope.split(':', 1)[0]
+
+
+def generation_key(name):
+
+    return f'{KEY_PREFIX}:gen:{name}'
+
+
+def get_generations(*names):
+    """
+    Current generation for each name. A missing generation is seeded from
+    the clock rather than 0 so an evicted counter never revives responses
+    cached under an older value.
+    """
+    cache = get_cache()
+    keys = [generation_key(name) for name in names]
+    found = cache.get_many(keys)
+    for key in keys:
+        if key not in found:
+            cache.add(key, time.time_ns())
+            found[key] = cache.get(key)
+    return [found[key] for key in keys]
+
+
+def bump_generation(*names):
+
+    cache = get_cache()
+    for name in names:
+        key = generation_key(name)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns())
+
+
+def invalidate_job(job_id, recruiter_id=None):
+    """
+    Drop cached responses for one job. ``recruiter_id`` also invalidates
+    every list the job can appear in; leave it out when only the job's own
+    fields (e.g. application counters) changed.
+    """
+    if not is_enabled():
+        return
+    names = [f'job:{job_id}']
+    if recruiter_id is not None:
+        names += [PUBLIC_SCOPE, ALL_SCOPE, f'recruiter:{recruiter_id}']
+    bump_generation(*names)
+
+
+def invalidate_lists(*recruiter_ids):
+    """ Drop cached list responses that new jobs of ``recruiter_ids`` appear in. """
+
+    if is_enabled():
+        bump_generation(PUBLIC_SCOPE, ALL_SCOPE, *(f'recruiter:{pk}' for pk in recruiter_ids))
+
+
+def invalidate_all():
+
+    if is_enabled():
+        bump_generation(PUBLIC_SCOPE, ALL_SCOPE, 'recruiters')
+
+
+def response_key(request, generations):
+
+    raw = json.dumps(
+        [request.get_host(), request.path, sorted(request.query_params.lists())],
+        separators=(',', ':'),
+    )
+    digest = hashlib.sha1(raw.encode()).hexdigest()
+    return f'{KEY_PREFIX}:resp:{":".join(str(value) for value in generations)}:{digest}'
+
+
+def record(scope, outcome):
+
+    cache = get_cache()
+    key = f'{KEY_PREFIX}:stats:{scope_kind(scope)}:{outcome}'
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1):
+            cache.incr(key)
+
+
+def cache_stats():
+
+    cache = get_cache()
+    keys = [
+        f'{KEY_PREFIX}:stats:{kind}:{outcome}'
+        for kind in SCOPE_KINDS for outcome in ('hit', 'miss')
+    ]
+    values = cache.get_many(keys)
+    stats = {}
+    for kind in SCOPE_KINDS:
+        hits = values.get(f'{KEY_PREFIX}:stats:{kind}:hit', 0)
+        misses = values.get(f'{KEY_PREFIX}:stats:{kind}:miss', 0)
+        total = hits + misses
+        stats[kind] = {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / total, 4) if total else None,
+        }
+    return stats
+
+
+def reset_stats():
+
+    get_cache().delete_many([
+        f'{KEY_PREFIX}:stats:{kind}:{outcome}'
+        for kind in SCOPE_KINDS for outcome in ('hit', 'miss')
+    ])
+
+
+def response_timeout(queryset):
+    """
+    Configured TTL, cut short so the entry expires no later than the next
+    deadline in ``queryset`` (expired jobs must drop out of candidate lists
+    and flip ``is_expired`` on detail pages).
+    """
+    timeout = getattr(settings, 'JOB_RESPONSE_CACHE_TTL', 60)
+    now = timezone.now()
+    nearest = queryset.order_by().aggregate(
+        nearest=Min('deadline', filter=Q(deadline__gt=now))
+    )['nearest']
+    if nearest is not None:
+        timeout = min(timeout, (nearest - now).total_seconds())
+    return int(timeout)
+
+
+class JobResponseCacheMixin:
+    """
+    Serve ``list`` and ``retrieve`` from the cache. Keys combine the
+    caller's scope generation (plus the job's own generation for detail
+    views), the host, path and query parameters; ``job.signals`` bumps the
+    generations after commits that change jobs.
+    """
+
+    cache_header = 'X-Cache'
+
+    def list(self, request, *args, **kwargs):
+
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+    def cached_response(self, handler, request, *args, **kwargs):
+
+        if not is_enabled():
+            return handler(request, *args, **kwargs)
+
+        scope = scope_for(request.user)
+        names = [scope]
+        if scope_kind(scope) == 'recruiter':
+            # Lets invalidate_all() reach every recruiter scope at once.
+            names.append('recruiters')
+        job_id = kwargs.get(self.lookup_url_kwarg or self.lookup_field)
+        if job_id is not None:
+            names.append(f'job:{job_id}')
+
+        cache = get_cache()
+        key = response_key(request, [scope] + get_generations(*names))
+        data = cache.get(key)
+        if data is not None:
+            record(scope, 'hit')
+            response = Response(data)
+            response[self.cache_header] = 'HIT'
+            return response
+
+        record(scope, 'miss')
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            queryset = self.get_queryset()
+            if job_id is not None:
+                queryset = queryset.filter(pk=job_id)
+            timeout = response_timeout(queryset)
+            if timeout > 0:
+                cache.set(key, response.data, timeout)
+        response[self.cache_header] = 'MISS'
+        return response
+
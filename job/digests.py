@@ -0,0 +1,71 @@
+""" Per-recruiter application digests, flushed by ``send_application_digests``. """
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, Count, F, Max, When
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from authapp.utils import EmailService
+from job.choices import ApplicationStatusChoices
+from job.models import JobApplication, RecruiterDigest
+
+
+def digest_rows(recruiter_id, after_id):
+    """
+    Application counts per job for applications newer than ``after_id``,
+    leaving out ones soft-deleted or withdrawn before the flush.
+    """
+    return list(
+        JobApplication.active_objects.filter(job__recruiter_id=recruiter_id, pk__gt=after_id)
+        .exclude(application_status=ApplicationStatusChoices.WITHDRAWN)
+        .order_by()
+        .values('job_id', 'job__title')
+        .annotate(applications=Count('pk'), newest=Max('pk'))
+        .order_by('-applications', 'job__title')
+    )
+
+
+def flush_digest(digest):
+    """ Queue one digest email for ``digest`` and reset it. Returns True if mail was queued. """
+
+    rows = digest_rows(digest.recruiter_id, digest.last_application_id)
+    newest = max((row['newest'] for row in rows), default=digest.last_application_id)
+    now = timezone.now()
+
+    with transaction.atomic():
+        if rows:
+            EmailService.send_application_digest(
+                digest.recruiter,
+                [{'title': row['job__title'], 'applications': row['applications']} for row in rows],
+                dedupe_key=f'digest:{digest.recruiter_id}:{newest}',
+            )
+        # Only subtract what this flush saw; applications counted since keep
+        # the row pending for the next run.
+        RecruiterDigest.objects.filter(pk=digest.recruiter_id).update(
+            pending_applications=Greatest(F('pending_applications') - digest.pending_applications, 0),
+            pending_since=Case(
+                When(pending_applications__lte=digest.pending_applications, then=None),
+                default=F('pending_since'),
+            ),
+            last_application_id=newest,
+            last_sent_at=now,
+            updated_at=now,
+        )
+    return bool(rows)
+
+
+def flush_due_digests(force=False):
+    """
+    Flush every digest past ``APPLICATION_DIGEST_INTERVAL_SECONDS`` or holding
+    at least ``APPLICATION_DIGEST_MAX_PENDING`` applications (all pending
+    digests with ``force``). Returns the number of emails queued.
+    """
+    if force:
+        digests = RecruiterDigest.objects.filter(pending_applications__gt=0)
+    else:
+        digests = RecruiterDigest.objects.due(
+            getattr(settings, 'APPLICATION_DIGEST_INTERVAL_SECONDS', 3600),
+            getattr(settings, 'APPLICATION_DIGEST_MAX_PENDING', 50),
+        )
+    return sum(flush_digest(digest) for digest in digests.select_related('recruiter'))
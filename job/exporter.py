@@ -0,0 +1,110 @@
+""" Streaming CSV / NDJSON export of job applications. """
+
+import csv
+import json
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Value
+from django.db.models.functions import Concat, Trim
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+
+CSV = 'csv'
+NDJSON = 'ndjson'
+FORMATS = (CSV, NDJSON)
+
+CONTENT_TYPES = {
+    CSV: 'text/csv; charset=utf-8',
+    NDJSON: 'application/x-ndjson',
+}
+
+
+def full_name(relation):
+
+    return Trim(Concat(f'{relation}__first_name', Value(' '), f'{relation}__last_name'))
+
+
+# Output columns in order, each a lookup on JobApplication or an expression
+# over the same joins.
+COLUMNS = (
+    ('id', 'pk'),
+    ('job_id', 'job__unique_job_id'),
+    ('job_title', 'job__title'),
+    ('recruiter_name', full_name('job__recruiter')),
+    ('candidate_name', full_name('candidate')),
+    ('candidate_email', 'candidate__email'),
+    ('application_status', 'application_status'),
+    ('cover_letter', 'cover_letter'),
+    ('resume', 'resume'),
+    ('created_at', 'created_at'),
+    ('updated_at', 'updated_at'),
+)
+
+
+def export_setting(name, default):
+
+    return getattr(settings, f'APPLICATION_EXPORT_{name}', default)
+
+
+def export_rows(queryset, chunk_size=None):
+    """
+    Yield one dict per application from a single joined ``.values()`` query,
+    fetched ``chunk_size`` rows at a time.
+    """
+    chunk_size = chunk_size or export_setting('CHUNK_SIZE', 2000)
+    lookups, annotations = {}, {}
+    for column, source in COLUMNS:
+        if isinstance(source, str):
+            lookups[column] = source
+        else:
+            lookups[column] = f'export_{column}'
+            annotations[lookups[column]] = source
+
+    rows = queryset.order_by('pk').annotate(**annotations).values(*lookups.values())
+    for row in rows.iterator(chunk_size=chunk_size):
+        yield {column: row[lookup] for column, lookup in lookups.items()}
+
+
+class Echo:
+    """ File-like object whose ``write`` hands the line back to the csv writer's caller. """
+
+    def write(self, value):
+
+        return value
+
+
+def stream_csv(rows):
+
+    writer = csv.writer(Echo())
+    yield writer.writerow([column for column, _ in COLUMNS])
+    for row in rows:
+        yield writer.writerow([
+            value.isoformat() if hasattr(value, 'isoformat') else value
+            for value in row.values()
+        ])
+
+
+def stream_ndjson(rows):
+
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + '\n'
+
+
+STREAMS = {
+    CSV: stream_csv,
+    NDJSON: stream_ndjson,
+}
+
+
+def export_response(queryset, fmt, filename='applications'):
+    """ Stream ``queryset`` as a file download; nothing is buffered beyond one chunk. """
+
+    response = StreamingHttpResponse(
+        STREAMS[fmt](export_rows(queryset)),
+        content_type=CONTENT_TYPES[fmt],
+    )
+    stamp = timezone.now().strftime('%Y%m%d-%H%M%S')
+    response['Content-Disposition'] = f'attachment; filename="{filename}-{stamp}.{fmt}"'
+    return response
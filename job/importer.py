@@ -0,0 +1,187 @@
+""" Streaming bulk import of job postings from CSV or NDJSON files. """
+
+import codecs
+import csv
+import json
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+
+from job.models import Job, job_ids
+from job.rest.serializers.serializers import JobCreateSerializer
+from job.signals import jobs_bulk_created
+
+
+CSV = 'csv'
+NDJSON = 'ndjson'
+FORMATS = (CSV, NDJSON)
+
+EXTENSIONS = {
+    '.csv': CSV,
+    '.ndjson': NDJSON,
+    '.jsonl': NDJSON,
+}
+CONTENT_TYPES = {
+    'text/csv': CSV,
+    'application/x-ndjson': NDJSON,
+    'application/ndjson': NDJSON,
+    'application/jsonl': NDJSON,
+}
+
+
+class ImportFormatError(ValueError):
+    pass
+
+
+def import_setting(name, default):
+
+    return getattr(settings, f'JOB_IMPORT_{name}', default)
+
+
+def detect_format(name='', content_type='', requested=None):
+
+    if requested:
+        if requested not in FORMATS:
+            raise ImportFormatError(f'Unsupported format "{requested}"; use one of: {", ".join(FORMATS)}.')
+        return requested
+    for extension, fmt in EXTENSIONS.items():
+        if (name or '').lower().endswith(extension):
+            return fmt
+    fmt = CONTENT_TYPES.get((content_type or '').split(';')[0].strip().lower())
+    if fmt is None:
+        raise ImportFormatError('Cannot tell the file format; pass csv or ndjson explicitly.')
+    return fmt
+
+
+def iter_lines(stream):
+    """ Decode a binary stream line by line without reading it all into memory. """
+
+    yield from codecs.iterdecode(stream, 'utf-8-sig')
+
+
+def iter_csv(stream):
+    """
+    Yield ``(row_number, data)`` for each CSV record. Empty cells are left
+    out so optional fields behave as if they were not sent at all.
+    """
+    reader = csv.DictReader(iter_lines(stream))
+    for number, row in enumerate(reader, start=1):
+        if None in row:
+            yield number, ValueError('Row has more cells than the header.')
+            continue
+        yield number, {key.strip(): value for key, value in row.items() if key and value not in ('', None)}
+
+
+def iter_ndjson(stream):
+    """ Yield ``(row_number, data)`` for each non-blank NDJSON line. """
+
+    number = 0
+    for line in iter_lines(stream):
+        if not line.strip():
+            continue
+        number += 1
+        try:
+            data = json.loads(line)
+        except ValueError as exc:
+            yield number, ValueError(f'Invalid JSON: {exc}')
+            continue
+        if not isinstance(data, dict):
+            yield number, ValueError('Each line must be a JSON object.')
+            continue
+        yield number, data
+
+
+READERS = {
+    CSV: iter_csv,
+    NDJSON: iter_ndjson,
+}
+
+
+class JobImporter:
+    """
+    Validate rows with ``JobCreateSerializer`` and insert the valid ones
+    with ``bulk_create``, one transaction per batch.
+
+    Only the current batch and the first ``max_errors`` row errors are
+    kept in memory, so memory stays flat however large the file is. A
+    failed batch does not undo earlier ones: the report says how many rows
+    were created and which ones were rejected.
+    """
+
+    def __init__(self, recruiter, batch_size=None, max_errors=None):
+
+        self.recruiter = recruiter
+        self.batch_size = batch_size or import_setting('BATCH_SIZE', 500)
+        self.max_errors = max_errors if max_errors is not None else import_setting('MAX_ERRORS', 1000)
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+        self.aborted = None
+
+    def add_error(self, number, errors):
+
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({'row': number, 'errors': errors})
+
+    def build(self, data):
+
+        serializer = JobCreateSerializer(data=data)
+        if not serializer.is_valid():
+            return None, serializer.errors
+        return Job(recruiter=self.recruiter, **serializer.validated_data), None
+
+    def flush(self, batch):
+
+        if not batch:
+            return
+        # Reserved up front so the batch transaction doesn't hold the sequence lock.
+        job_ids.prefill(sum(1 for _, job in batch if not job.unique_job_id))
+        try:
+            with transaction.atomic():
+                jobs = Job.objects.bulk_create([job for _, job in batch])
+                jobs_bulk_created.send(sender=Job, jobs=jobs, using=Job.objects.db)
+        except DatabaseError as exc:
+            for number, _ in batch:
+                self.add_error(number, {'non_field_errors': [f'Insert failed: {exc}']})
+            return
+        self.created += len(batch)
+
+    def run(self, rows):
+
+        batch = []
+        try:
+            for number, data in rows:
+                if isinstance(data, Exception):
+                    self.add_error(number, {'non_field_errors': [str(data)]})
+                    continue
+                job, errors = self.build(data)
+                if errors:
+                    self.add_error(number, errors)
+                    continue
+                batch.append((number, job))
+                if len(batch) >= self.batch_size:
+                    self.flush(batch)
+                    batch = []
+        except (UnicodeDecodeError, csv.Error) as exc:
+            # The rest of the file cannot be read; keep what was parsed so far.
+            self.aborted = f'Stopped reading the file: {exc}'
+        self.flush(batch)
+        return self.report()
+
+    def report(self):
+
+        return {
+            'created': self.created,
+            'failed': self.failed,
+            'errors': self.errors,
+            'errors_truncated': self.failed > len(self.errors),
+            'aborted': self.aborted,
+        }
+
+
+def import_jobs(stream, recruiter, fmt, batch_size=None, max_errors=None):
+    """ Import jobs for ``recruiter`` from a binary ``stream`` and return the report. """
+
+    importer = JobImporter(recruiter, batch_size=batch_size, max_errors=max_errors)
+    return importer.run(READERS[fmt](stream))
@@ -0,0 +1,77 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.models import Skill, UserProfile
+from job.models import Job
+
+
+class Command(BaseCommand):
+
+    help = (
+        "Populate the normalized skill index from Job.skills_required "
+        "and UserProfile.skills."
+    )
+
+    def add_arguments(self, parser):
+
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help="Number of rows read and link rows written per batch."
+        )
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help="Drop existing skill links before backfilling."
+        )
+
+    def handle(self, *args, **options):
+
+        batch_size = options['batch_size']
+        sources = [
+            (Job, 'skills_required', 'job_id'),
+            (UserProfile, 'skills', 'userprofile_id'),
+        ]
+
+        with transaction.atomic():
+            # First pass: collect every distinct skill so they can be created in bulk.
+            names = {}
+            for model, text_field, _ in sources:
+                rows = model.objects.order_by().exclude(**{text_field: ''}).values_list(text_field, flat=True)
+                for text in rows.iterator(chunk_size=batch_size):
+                    for canonical, display in Skill.objects.parse(text).items():
+                        names.setdefault(canonical, display)
+
+            skill_ids = {}
+            pending = list(names.items())
+            for start in range(0, len(pending), batch_size):
+                chunk = dict(pending[start:start + batch_size])
+                skill_ids.update(
+                    (skill.canonical_name, skill.pk) for skill in Skill.objects.from_names(chunk)
+                )
+            self.stdout.write(f"{len(skill_ids)} distinct skills.")
+
+            # Second pass: write link rows, ignoring ones that already exist.
+            for model, text_field, owner_column in sources:
+                through = model.skill_tags.through
+                if options['reset']:
+                    through.objects.all().delete()
+
+                links = []
+                total = 0
+                rows = model.objects.order_by().exclude(**{text_field: ''}).values_list('pk', text_field)
+                for pk, text in rows.iterator(chunk_size=batch_size):
+                    for canonical in Skill.objects.parse(text):
+                        links.append(through(**{owner_column: pk, 'skill_id': skill_ids[canonical]}))
+                    if len(links) >= batch_size:
+                        through.objects.bulk_create(links, ignore_conflicts=True)
+                        total += len(links)
+                        links = []
+                if links:
+                    through.objects.bulk_create(links, ignore_conflicts=True)
+                    total += len(links)
+
+                self.stdout.write(f"{model._meta.verbose_name_plural}: {total} skill links written.")
+
+        self.stdout.write(self.style.SUCCESS("Skill backfill complete."))
@@ -0,0 +1,106 @@
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.choices import UserRoleChoices
+from core.models import User
+from job.choices import JobStatusChoices
+from job.models import Job, JobApplication
+from job.rest.serializers.serializers import JobApplicationSerializer
+from job.rest.views.views import JobViewSet
+from job.services import DuplicateApplication
+from shared.benchmark import QueryCounter, summarize, timed, write_table
+
+
+def legacy_apply(request, job_id):
+    """
+    The apply flow before the fast path: scoped job lookup, an ``exists()``
+    duplicate pre-check, the insert, then a ``COUNT(*)`` and job re-save to
+    refresh ``total_applications``.
+    """
+    job = Job.objects.filter(
+        job_status=JobStatusChoices.PUBLISHED,
+        deadline__gt=timezone.now(),
+        status='ACTIVE'
+    ).get(pk=job_id)
+    if JobApplication.objects.filter(job=job, candidate=request.user).exists():
+        raise DuplicateApplication()
+    application = JobApplication.objects.create(job=job, candidate=request.user)
+    job.total_applications = job.applications.count()
+    job.save()
+    return JobApplicationSerializer(application, context={'request': request}).data
+
+
+class Command(BaseCommand):
+
+    help = "Measure queries and latency per apply for the legacy and fast apply paths."
+
+    def add_arguments(self, parser):
+
+        parser.add_argument('--applies', type=int, default=200, help="Applies per path.")
+
+    def handle(self, *args, **options):
+
+        applies = options['applies']
+        tag = uuid.uuid4().hex[:8]
+        factory = APIRequestFactory()
+        view = JobViewSet.as_view({'post': 'apply'})
+
+        # Unusable passwords: hashing one per fixture would dominate the setup time.
+        users = User.objects.bulk_create([
+            User(
+                email=f'bench-{tag}-{index}@example.com', username=f'bench-{tag}-{index}@example.com',
+                first_name='Bench', last_name=str(index), password='!',
+                role=UserRoleChoices.RECRUITER if index < 0 else UserRoleChoices.CANDIDATE,
+            )
+            for index in range(-1, applies)
+        ])
+        recruiter, candidates = users[0], users[1:]
+        deadline = timezone.now() + timedelta(days=30)
+        jobs = {
+            path: Job.objects.create(
+                title=f'Bench {path}', description='Benchmark job', location='Remote',
+                deadline=deadline, recruiter=recruiter,
+            )
+            for path in ('legacy', 'fast')
+        }
+
+        results = []
+        try:
+            with override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend'):
+                for path, job in jobs.items():
+                    samples, queries = [], []
+                    for candidate in candidates:
+                        request = factory.post(
+                            f'/api/v1/jobs/jobs/{job.pk}/apply/', {}, format='json',
+                            HTTP_IDEMPOTENCY_KEY=uuid.uuid4().hex,
+                        )
+                        force_authenticate(request, user=candidate)
+                        with QueryCounter() as counter, timed(samples):
+                            if path == 'legacy':
+                                request = Request(request)
+                                request.user = candidate
+                                legacy_apply(request, job.pk)
+                            else:
+                                response = view(request, pk=job.pk)
+                                assert response.status_code == 201, response.data
+                        queries.append(counter.count)
+
+                    stats = summarize(samples)
+                    results.append([
+                        path, stats['n'], sum(queries) / len(queries),
+                        stats['mean'], stats['p50'], stats['p95'], stats['p99'],
+                    ])
+        finally:
+            User.objects.filter(email__startswith=f'bench-{tag}-').delete()
+
+        write_table(
+            self.stdout,
+            ['path', 'applies', 'queries/apply', 'mean ms', 'p50 ms', 'p95 ms', 'p99 ms'],
+            results,
+        )
@@ -0,0 +1,126 @@
+import queue
+import threading
+import time
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connection
+from django.test.utils import override_settings
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.choices import UserRoleChoices
+from core.models import EmailOutbox, User
+from job.models import Job
+from job.rest.views.views import JobViewSet
+from job.write_behind import get_application_writer
+from shared.benchmark import summarize, timed, write_table
+
+
+class Command(BaseCommand):
+
+    help = "Burst concurrent applications at one job, with and without the write-behind writer."
+
+    def add_arguments(self, parser):
+
+        parser.add_argument('--applies', type=int, default=500, help="Applications per mode.")
+        parser.add_argument('--concurrency', type=int, default=16, help="Threads applying at once.")
+
+    def worker(self, view, job, candidates, samples, failures):
+
+        factory = APIRequestFactory(SERVER_NAME='localhost')
+        try:
+            while True:
+                try:
+                    candidate = candidates.get_nowait()
+                except queue.Empty:
+                    return
+                request = factory.post(f'/api/v1/jobs/jobs/{job.pk}/apply/', {'cover_letter': 'Burst'}, format='json')
+                force_authenticate(request, user=candidate)
+                try:
+                    with timed(samples):
+                        response = view(request, pk=job.pk)
+                    if response.status_code != 201:
+                        samples.pop()
+                        failures.append(response.status_code)
+                except OperationalError:
+                    samples.pop()
+                    failures.append('locked')
+        finally:
+            # What request_finished does; each thread has its own connection.
+            connection.close()
+
+    def run_mode(self, job, candidates, concurrency):
+
+        view = JobViewSet.as_view({'post': 'apply'})
+        pending = queue.SimpleQueue()
+        for candidate in candidates:
+            pending.put(candidate)
+        samples, failures = [], []
+        threads = [
+            threading.Thread(target=self.worker, args=(view, job, pending, samples, failures))
+            for _ in range(concurrency)
+        ]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return samples, failures, time.perf_counter() - start
+
+    def handle(self, *args, **options):
+
+        tag = uuid.uuid4().hex[:8]
+        modes = ['direct', 'write-behind']
+        recruiter = User.objects.bulk_create([User(
+            email=f'bench-{tag}-recruiter@example.com', username=f'bench-{tag}-recruiter@example.com',
+            first_name='Bench', last_name='Recruiter', password='!', role=UserRoleChoices.RECRUITER,
+        )])[0]
+        candidates = User.objects.bulk_create([
+            User(
+                email=f'bench-{tag}-candidate-{index}@example.com',
+                username=f'bench-{tag}-candidate-{index}@example.com',
+                first_name='Bench', last_name='Candidate', password='!', role=UserRoleChoices.CANDIDATE,
+            )
+            for index in range(options['applies'] * len(modes))
+        ])
+        deadline = timezone.now() + timedelta(days=30)
+        jobs = Job.objects.bulk_create([
+            Job(
+                title=f'Bench burst {mode}', description='Benchmark job', location='Remote',
+                deadline=deadline, recruiter=recruiter,
+            )
+            for mode in modes
+        ])
+
+        rows = []
+        try:
+            for index, mode in enumerate(modes):
+                batch = candidates[index * options['applies']:(index + 1) * options['applies']]
+                with override_settings(APPLICATION_WRITE_BEHIND_ENABLED=mode == 'write-behind'):
+                    samples, failures, elapsed = self.run_mode(jobs[index], batch, options['concurrency'])
+                stats = summarize(samples)
+                rows.append([
+                    mode, len(samples), len(samples) / elapsed, len(failures),
+                    stats['mean'], stats['p50'], stats['p99'],
+                ])
+        finally:
+            application_keys = [
+                f'application:{pk}:{who}'
+                for pk in Job.objects.filter(pk__in=[job.pk for job in jobs]).values_list('applications', flat=True)
+                for who in ('recruiter', 'candidate')
+            ]
+            EmailOutbox.objects.filter(dedupe_key__in=application_keys).delete()
+            Job.objects.filter(recruiter=recruiter).delete()
+            User.objects.filter(email__startswith=f'bench-{tag}-').delete()
+
+        self.stdout.write(
+            f"{options['applies']} applications per mode, {options['concurrency']} concurrent, "
+            f"write-behind batches of up to {get_application_writer().batch_size}"
+        )
+        write_table(
+            self.stdout,
+            ['mode', 'applied', 'applies/s', 'failed', 'mean ms', 'p50 ms', 'p99 ms'],
+            rows,
+        )
@@ -0,0 +1,121 @@
+import asyncio
+import time
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import AsyncClient
+from django.test.utils import override_settings
+from django.urls import include, path
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.choices import UserRoleChoices
+from core.models import User
+from job.models import Job, JobApplication
+from job.signals import jobs_bulk_created
+from shared.benchmark import summarize, timed, write_table
+
+
+class BenchUrls:
+    """ Both stacks side by side, whatever ASYNC_READ_ENDPOINTS is set to. """
+
+    urlpatterns = [
+        path('sync/', include('job.rest.urls')),
+        path('async/', include('job.rest.async_urls')),
+    ]
+
+
+class Command(BaseCommand):
+
+    help = "Compare concurrent read throughput of the sync DRF views and the async views under ASGI."
+
+    def add_arguments(self, parser):
+
+        parser.add_argument('--jobs', type=int, default=200, help="Jobs to create for the run.")
+        parser.add_argument('--requests', type=int, default=200, help="Requests per scenario.")
+        parser.add_argument('--concurrency', type=int, default=20, help="Requests in flight at once.")
+
+    async def run_scenario(self, url, token, requests, concurrency):
+
+        client = AsyncClient()
+        headers = {'Authorization': f'Bearer {token}'}
+        samples = []
+        pending = iter(range(requests))
+
+        async def worker():
+
+            for _ in pending:
+                with timed(samples):
+                    response = await client.get(url, headers=headers)
+                assert response.status_code == 200, (url, response.status_code)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return samples, time.perf_counter() - start
+
+    def handle(self, *args, **options):
+
+        tag = uuid.uuid4().hex[:8]
+        recruiter, candidate = User.objects.bulk_create([
+            User(
+                email=f'bench-{tag}-{role.lower()}@example.com',
+                username=f'bench-{tag}-{role.lower()}@example.com',
+                first_name='Bench', last_name=role.title(), password='!', role=role,
+            )
+            for role in (UserRoleChoices.RECRUITER, UserRoleChoices.CANDIDATE)
+        ])
+        deadline = timezone.now() + timedelta(days=30)
+        jobs = Job.objects.bulk_create([
+            Job(
+                title=f'Bench job {index}', description='Benchmark job', location='Remote',
+                skills_required='Python, Django', deadline=deadline, recruiter=recruiter,
+            )
+            for index in range(options['jobs'])
+        ])
+        jobs_bulk_created.send(sender=Job, jobs=jobs)
+        JobApplication.objects.bulk_create([
+            JobApplication(job=job, candidate=candidate) for job in jobs[:50]
+        ])
+        tokens = {user.pk: str(AccessToken.for_user(user)) for user in (recruiter, candidate)}
+
+        scenarios = [
+            ('jobs list', 'jobs/', candidate),
+            ('job detail', f'jobs/{jobs[0].pk}/', candidate),
+            ('applications list', 'applications/', recruiter),
+            ('recruiter dashboard', 'recruiter-dashboard/', recruiter),
+        ]
+
+        results = []
+        try:
+            # The response cache would hide the view cost; silk's sync-only
+            # middleware would force a thread hop on both stacks.
+            with override_settings(
+                ROOT_URLCONF=BenchUrls,
+                ALLOWED_HOSTS=['testserver'],
+                JOB_RESPONSE_CACHE_ENABLED=False,
+                MIDDLEWARE=[name for name in settings.MIDDLEWARE if not name.startswith('silk.')],
+            ):
+                for name, url, user in scenarios:
+                    for stack in ('sync', 'async'):
+                        samples, elapsed = asyncio.run(self.run_scenario(
+                            f'/{stack}/{url}', tokens[user.pk], options['requests'], options['concurrency']
+                        ))
+                        stats = summarize(samples)
+                        results.append([
+                            name, stack, len(samples) / elapsed,
+                            stats['mean'], stats['p50'], stats['p95'],
+                        ])
+        finally:
+            Job.objects.filter(recruiter=recruiter).delete()
+            User.objects.filter(pk__in=[recruiter.pk, candidate.pk]).delete()
+
+        self.stdout.write(
+            f"{options['requests']} requests per scenario, {options['concurrency']} concurrent"
+        )
+        write_table(
+            self.stdout,
+            ['endpoint', 'stack', 'req/s', 'mean ms', 'p50 ms', 'p95 ms'],
+            results,
+        )
@@ -0,0 +1,115 @@
+import time
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.choices import UserRoleChoices
+from core.models import User
+from job.models import Job, JobApplication
+from job.rest.views.views import JobApplicationViewSet, JobViewSet
+from shared.benchmark import QueryCounter, summarize, timed, write_table
+
+
+class Command(BaseCommand):
+
+    help = "Compare 200 and 304 latency for conditional GETs on job and application endpoints."
+
+    def add_arguments(self, parser):
+
+        parser.add_argument('--jobs', type=int, default=200, help="Jobs to create for the run.")
+        parser.add_argument('--requests', type=int, default=200, help="Requests per scenario.")
+
+    def handle(self, *args, **options):
+
+        tag = uuid.uuid4().hex[:8]
+        factory = APIRequestFactory(SERVER_NAME='localhost')
+
+        recruiter, candidate = User.objects.bulk_create([
+            User(
+                email=f'bench-{tag}-{role.lower()}@example.com',
+                username=f'bench-{tag}-{role.lower()}@example.com',
+                first_name='Bench', last_name=role.title(), password='!', role=role,
+            )
+            for role in (UserRoleChoices.RECRUITER, UserRoleChoices.CANDIDATE)
+        ])
+        deadline = timezone.now() + timedelta(days=30)
+        jobs = Job.objects.bulk_create([
+            Job(
+                unique_job_id=f'B{tag}{index:06d}', title=f'Bench job {index}',
+                description='Benchmark job', location='Remote',
+                skills_required='Python, Django', deadline=deadline, recruiter=recruiter,
+            )
+            for index in range(options['jobs'])
+        ])
+        JobApplication.objects.bulk_create([
+            JobApplication(job=job, candidate=candidate) for job in jobs[:50]
+        ])
+
+        detail_view = JobViewSet.as_view({'get': 'retrieve'})
+        detail_path, detail_kwargs = f'/api/v1/jobs/jobs/{jobs[0].pk}/', {'pk': jobs[0].pk}
+        # (name, view, path, kwargs, validator sent back for the 304 run)
+        scenarios = [
+            ('jobs list', JobViewSet.as_view({'get': 'list'}), '/api/v1/jobs/jobs/', {}, 'ETag'),
+            ('job detail', detail_view, detail_path, detail_kwargs, 'ETag'),
+            ('job detail', detail_view, detail_path, detail_kwargs, 'Last-Modified'),
+            ('applications list', JobApplicationViewSet.as_view({'get': 'list'}),
+             '/api/v1/jobs/applications/', {}, 'ETag'),
+        ]
+        conditional_headers = {'ETag': 'HTTP_IF_NONE_MATCH', 'Last-Modified': 'HTTP_IF_MODIFIED_SINCE'}
+
+        results = []
+        try:
+            # Measure the uncached query + serialization cost against the 304 path.
+            with override_settings(JOB_RESPONSE_CACHE_ENABLED=False):
+                for name, view, path, kwargs, validator in scenarios:
+                    value = None
+                    for expected in (200, 304):
+                        samples, queries = [], []
+                        for _ in range(options['requests']):
+                            headers = {conditional_headers[validator]: value} if expected == 304 else {}
+                            request = factory.get(path, **headers)
+                            force_authenticate(request, user=candidate)
+                            with QueryCounter() as counter, timed(samples):
+                                response = view(request, **kwargs)
+                                response.render()
+                            assert response.status_code == expected, (name, validator, response.status_code)
+                            queries.append(counter.count)
+                            value = response[validator]
+                        stats = summarize(samples)
+                        results.append([
+                            name, validator, expected, sum(queries) / len(queries), len(response.content),
+                            stats['mean'], stats['p50'], stats['p95'],
+                        ])
+
+                self.check_counter_change(factory, detail_view, detail_path, detail_kwargs, candidate, jobs[0])
+        finally:
+            Job.objects.filter(recruiter=recruiter).delete()
+            User.objects.filter(pk__in=[recruiter.pk, candidate.pk]).delete()
+
+        write_table(
+            self.stdout,
+            ['endpoint', 'validator', 'status', 'queries', 'bytes', 'mean ms', 'p50 ms', 'p95 ms'],
+            results,
+        )
+
+    def check_counter_change(self, factory, view, path, kwargs, user, job):
+        """ Counter bumps leave updated_at alone; both validators must still see them. """
+
+        request = factory.get(path)
+        force_authenticate(request, user=user)
+        response = view(request, **kwargs)
+        validators = {'HTTP_IF_NONE_MATCH': response['ETag'], 'HTTP_IF_MODIFIED_SINCE': response['Last-Modified']}
+
+        # Last-Modified has one-second resolution.
+        time.sleep(1.1)
+        Job.objects.bump_counters(job.pk, accepted_applications=1)
+        for header, value in validators.items():
+            request = factory.get(path, **{header: value})
+            force_authenticate(request, user=user)
+            response = view(request, **kwargs)
+            assert response.status_code == 200, (header, response.status_code)
+        self.stdout.write("Counter change invalidates If-None-Match and If-Modified-Since: ok")
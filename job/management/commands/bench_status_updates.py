@@ -0,0 +1,93 @@
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from core.choices import UserRoleChoices
+from core.models import User
+from job.choices import ApplicationStatusChoices
+from job.models import Job, JobApplication
+from job.rest.serializers.serializers import JobApplicationStatusSerializer
+from shared.benchmark import QueryCounter, summarize, timed, write_table
+
+
+class Command(BaseCommand):
+
+    help = "Compare write bytes and latency of application status updates with full-row and dirty-field saves."
+
+    def add_arguments(self, parser):
+
+        parser.add_argument('--updates', type=int, default=300, help="Status updates per mode.")
+        parser.add_argument('--cover-letter-bytes', type=int, default=4000, help="Size of each cover letter.")
+
+    def run_updates(self, application_ids, status):
+
+        samples, queries, written = [], 0, 0
+        for pk in application_ids:
+            # Loaded outside the timing, as the view's get_object() would.
+            application = JobApplication.objects.get(pk=pk)
+            serializer = JobApplicationStatusSerializer(
+                application, data={'application_status': status}, partial=True
+            )
+            serializer.is_valid(raise_exception=True)
+            with QueryCounter(connection) as counter, timed(samples):
+                serializer.save()
+            queries += counter.count
+            written += counter.bytes
+        return samples, queries / len(application_ids), written / len(application_ids)
+
+    def handle(self, *args, **options):
+
+        tag = uuid.uuid4().hex[:8]
+        modes = [('full row', False), ('dirty fields', True)]
+        recruiter = User.objects.bulk_create([User(
+            email=f'bench-{tag}-recruiter@example.com', username=f'bench-{tag}-recruiter@example.com',
+            first_name='Bench', last_name='Recruiter', password='!', role=UserRoleChoices.RECRUITER,
+        )])[0]
+        candidates = User.objects.bulk_create([
+            User(
+                email=f'bench-{tag}-candidate-{index}@example.com',
+                username=f'bench-{tag}-candidate-{index}@example.com',
+                first_name='Bench', last_name='Candidate', password='!', role=UserRoleChoices.CANDIDATE,
+            )
+            for index in range(options['updates'])
+        ])
+        job = Job.objects.create(
+            title='Bench status updates', description='Benchmark job ' * 200, location='Remote',
+            deadline=timezone.now() + timedelta(days=30), recruiter=recruiter,
+        )
+        cover_letter = 'x' * options['cover_letter_bytes']
+
+        rows = []
+        try:
+            for name, enabled in modes:
+                applications = JobApplication.objects.bulk_create([
+                    JobApplication(job=job, candidate=candidate, cover_letter=cover_letter)
+                    for candidate in candidates
+                ])
+                application_ids = [application.pk for application in applications]
+                with override_settings(DIRTY_FIELD_SAVES_ENABLED=enabled):
+                    # A real transition, then the same PATCH again (nothing changes).
+                    for scenario, status in [
+                        ('PENDING -> REVIEWING', ApplicationStatusChoices.REVIEWING),
+                        ('repeat REVIEWING', ApplicationStatusChoices.REVIEWING),
+                    ]:
+                        samples, queries, written = self.run_updates(application_ids, status)
+                        stats = summarize(samples)
+                        rows.append([name, scenario, queries, written, stats['mean'], stats['p50'], stats['p99']])
+                JobApplication.objects.filter(pk__in=application_ids).delete()
+        finally:
+            Job.objects.filter(recruiter=recruiter).delete()
+            User.objects.filter(email__startswith=f'bench-{tag}-').delete()
+
+        self.stdout.write(
+            f"{options['updates']} status updates per row, cover letters of {options['cover_letter_bytes']} bytes"
+        )
+        write_table(
+            self.stdout,
+            ['save', 'update', 'queries/update', 'bytes/update', 'mean ms', 'p50 ms', 'p99 ms'],
+            rows,
+        )
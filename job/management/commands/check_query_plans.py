@@ -0,0 +1,75 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from job.choices import ApplicationStatusChoices, JobStatusChoices
+from job.models import Job, JobApplication
+
+
+def hot_querysets():
+    """
+    The soft-delete-scoped queries served by the job API, paired with the
+    partial index each one is expected to use. Ids are placeholders; the
+    plan does not depend on them.
+    """
+    now = timezone.now()
+    return [
+        (
+            'candidate job list',
+            Job.active_objects.filter(job_status=JobStatusChoices.PUBLISHED, deadline__gt=now)[:20],
+            'jobs_active_status_deadline',
+        ),
+        (
+            'recruiter job list',
+            Job.active_objects.filter(recruiter_id=1).order_by('-created_at')[:20],
+            'jobs_active_recruiter_created',
+        ),
+        (
+            'job applications by status',
+            JobApplication.active_objects.filter(
+                job_id=1, application_status=ApplicationStatusChoices.PENDING
+            ).order_by(),
+            'applications_active_job_status',
+        ),
+        (
+            'candidate application list',
+            JobApplication.active_objects.filter(candidate_id=1).order_by('-created_at')[:20],
+            'applications_active_candidate',
+        ),
+    ]
+
+
+class Command(BaseCommand):
+
+    help = "Run EXPLAIN QUERY PLAN on the hot job queries and check they use the partial indexes."
+
+    def add_arguments(self, parser):
+
+        parser.add_argument(
+            '--strict',
+            action='store_true',
+            help="Exit with an error when a query does not use its expected index."
+        )
+
+    def handle(self, *args, **options):
+
+        if connection.vendor != 'sqlite':
+            self.stdout.write(self.style.WARNING(
+                f"Plans are only checked on SQLite; skipping for {connection.vendor}."
+            ))
+            return
+
+        missing = []
+        for name, queryset, index in hot_querysets():
+            plan = queryset.explain()
+            used = index in plan
+            if not used:
+                missing.append(name)
+            style = self.style.SUCCESS if used else self.style.ERROR
+            self.stdout.write(style(f"{'OK  ' if used else 'MISS'} {name}: expects {index}"))
+            if options['verbosity'] > 1 or not used:
+                for line in plan.splitlines():
+                    self.stdout.write(f"       {line}")
+
+        if missing and options['strict']:
+            raise CommandError(f"Expected indexes not used by: {', '.join(missing)}")
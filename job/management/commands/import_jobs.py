@@ -0,0 +1,59 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from core.choices import UserRoleChoices
+from job.importer import FORMATS, ImportFormatError, detect_format, import_jobs
+
+
+class Command(BaseCommand):
+
+    help = "Bulk import job postings for a recruiter from a CSV or NDJSON file."
+
+    def add_arguments(self, parser):
+
+        parser.add_argument('path', help="CSV or NDJSON file to import.")
+        parser.add_argument(
+            '--recruiter',
+            required=True,
+            help="Email of the recruiter the jobs are posted for."
+        )
+        parser.add_argument(
+            '--format',
+            dest='import_format',
+            choices=FORMATS,
+            help="File format; detected from the file extension when omitted."
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            help="Rows per bulk insert transaction (defaults to JOB_IMPORT_BATCH_SIZE)."
+        )
+
+    def handle(self, *args, **options):
+
+        User = get_user_model()
+        try:
+            recruiter = User.objects.get(email=options['recruiter'], role=UserRoleChoices.RECRUITER)
+        except User.DoesNotExist:
+            raise CommandError(f"No recruiter with email {options['recruiter']}.")
+
+        try:
+            fmt = detect_format(options['path'], requested=options['import_format'])
+        except ImportFormatError as exc:
+            raise CommandError(str(exc))
+
+        try:
+            with open(options['path'], 'rb') as stream:
+                report = import_jobs(stream, recruiter, fmt, batch_size=options['batch_size'])
+        except OSError as exc:
+            raise CommandError(str(exc))
+
+        for error in report['errors']:
+            self.stderr.write(f"Row {error['row']}: {dict(error['errors'])}")
+        if report['errors_truncated']:
+            self.stderr.write(f"... {report['failed'] - len(report['errors'])} more rows rejected.")
+        if report['aborted']:
+            self.stderr.write(report['aborted'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {report['created']} jobs, rejected {report['failed']} rows."
+        ))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from job.search import is_supported, rebuild_index
+
+
+class Command(BaseCommand):
+
+    help = "Rebuild the full-text search index for job postings."
+
+    def add_arguments(self, parser):
+
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help="Number of jobs inserted into the index per batch."
+        )
+
+    def handle(self, *args, **options):
+
+        if not is_supported():
+            self.stdout.write(self.style.WARNING(
+                "Full-text index is only available on SQLite; nothing to rebuild."
+            ))
+            return
+
+        with transaction.atomic():
+            total = rebuild_index(batch_size=options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} jobs."))
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from job.models import RecruiterStats
+
+
+class Command(BaseCommand):
+
+    help = "Recompute recruiter dashboard counters from the jobs and applications tables."
+
+    def add_arguments(self, parser):
+
+        parser.add_argument(
+            '--recruiter',
+            type=int,
+            action='append',
+            dest='recruiters',
+            help="Recruiter id to reconcile (repeatable). Defaults to all recruiters."
+        )
+
+    def handle(self, *args, **options):
+
+        fields = RecruiterStats.objects.counter_fields()
+        with transaction.atomic():
+            before = {
+                row['pk']: row
+                for row in RecruiterStats.objects.values('pk', *fields)
+            }
+            rows = RecruiterStats.objects.recompute(options['recruiters'])
+
+        drifted = 0
+        for recruiter_id, stats in rows.items():
+            previous = before.get(recruiter_id)
+            if previous is None or any(previous[field] != getattr(stats, field) for field in fields):
+                drifted += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Reconciled {len(rows)} recruiters ({drifted} corrected)."
+        ))
@@ -0,0 +1,60 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from job.models import Job
+
+
+class Command(BaseCommand):
+
+    help = "Verify the denormalized application counters on jobs and repair any drift."
+
+    def add_arguments(self, parser):
+
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help="Number of jobs checked per grouped query."
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help="Report drift without writing corrections."
+        )
+
+    def handle(self, *args, **options):
+
+        batch_size = options['batch_size']
+        fields = Job.objects.counter_fields()
+        checked = drifted = 0
+        now = timezone.now()
+        last_pk = 0
+
+        while True:
+            batch = list(
+                Job.objects.order_by('pk').filter(pk__gt=last_pk).values('pk', *fields)[:batch_size]
+            )
+            if not batch:
+                break
+            last_pk = batch[-1]['pk']
+            actual = Job.objects.counted_applications([row['pk'] for row in batch])
+
+            repairs = []
+            for row in batch:
+                expected = actual.get(row['pk'], dict.fromkeys(fields, 0))
+                if any(row[field] != expected[field] for field in fields):
+                    repairs.append(Job(pk=row['pk'], counters_updated_at=now, **expected))
+                    if options['verbosity'] > 1:
+                        self.stdout.write(f"Job {row['pk']}: {row} -> {expected}")
+
+            checked += len(batch)
+            drifted += len(repairs)
+            if repairs and not options['dry_run']:
+                with transaction.atomic():
+                    Job.objects.bulk_update(repairs, fields + ['counters_updated_at'])
+
+        action = "found" if options['dry_run'] else "repaired"
+        self.stdout.write(self.style.SUCCESS(
+            f"Checked {checked} jobs, {action} {drifted} with drifted counters."
+        ))
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from job.scheduler import CLOSE, PUBLISH, JobLifecycleScheduler, apply_transition
+
+
+class Command(BaseCommand):
+
+    help = "Publish scheduled DRAFT jobs and close jobs past their deadline."
+
+    def add_arguments(self, parser):
+
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help="Apply every due transition and exit instead of running continuously."
+        )
+
+    def handle(self, *args, **options):
+
+        if options['once']:
+            published = apply_transition(PUBLISH)
+            closed = apply_transition(CLOSE)
+            self.stdout.write(self.style.SUCCESS(
+                f"Published {len(published)} jobs, closed {len(closed)} jobs."
+            ))
+            return
+
+        scheduler = JobLifecycleScheduler()
+        self.stdout.write("Job scheduler running; press Ctrl+C to stop.")
+        try:
+            scheduler.run_forever()
+        except KeyboardInterrupt:
+            scheduler.stop()
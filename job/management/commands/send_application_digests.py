@@ -0,0 +1,47 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from job.digests import flush_due_digests
+
+
+class Command(BaseCommand):
+
+    help = "Queue recruiter application digests that are due (run_mail_worker delivers them)."
+
+    def add_arguments(self, parser):
+
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help="Flush every pending digest regardless of interval and size."
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help="Keep checking for due digests instead of exiting."
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=None,
+            help="Seconds between checks with --loop (defaults to EMAIL_OUTBOX_POLL_SECONDS)."
+        )
+
+    def handle(self, *args, **options):
+
+        interval = options['interval']
+        if interval is None:
+            interval = getattr(settings, 'EMAIL_OUTBOX_POLL_SECONDS', 5)
+
+        try:
+            while True:
+                queued = flush_due_digests(force=options['force'])
+                if queued or not options['loop']:
+                    self.stdout.write(f"Queued {queued} digests.")
+                if not options['loop']:
+                    break
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
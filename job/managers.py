@@ -0,0 +1,241 @@
+import contextvars
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import models, transaction
+from django.db.models import Case, Count, F, Q, Value, When
+from django.db.models.functions import Coalesce, Greatest
+from django.db.utils import IntegrityError
+from django.utils import timezone
+
+from core.choices import UserRoleChoices
+from job.choices import ApplicationStatusChoices, JobStatusChoices
+from shared.base_model import BaseManager
+from shared.choices import StatusChoices
+
+
+# Application statuses with a denormalized counter column on Job.
+JOB_STATUS_COUNTERS = (
+    ApplicationStatusChoices.PENDING,
+    ApplicationStatusChoices.SHORTLISTED,
+    ApplicationStatusChoices.ACCEPTED,
+    ApplicationStatusChoices.REJECTED,
+)
+
+
+def application_counter(application_status):
+    """Name of the counter column for applications in a status"""
+    return f'{application_status.lower()}_applications'
+
+
+# (manager, pk) -> pending Counter of deltas while coalesce_counters() is active
+_pending_counters = contextvars.ContextVar('pending_counters', default=None)
+
+
+@contextmanager
+def coalesce_counters():
+    """
+    Hold counter bumps made in the block and apply them on the way out as
+    one ``UPDATE`` per row. Bumps from a block that raises are dropped, so
+    open one per savepoint; a nested block hands its totals to the outer one.
+    """
+    pending = defaultdict(Counter)
+    token = _pending_counters.set(pending)
+    try:
+        yield
+    finally:
+        _pending_counters.reset(token)
+
+    outer = _pending_counters.get()
+    for (manager, pk), deltas in pending.items():
+        if outer is not None:
+            outer[manager, pk].update(deltas)
+        else:
+            manager.apply_deltas(pk, deltas)
+
+
+def defer_deltas(manager, pk, deltas):
+
+    pending = _pending_counters.get()
+    if pending is None:
+        return False
+    pending[manager, pk].update(deltas)
+    return True
+
+
+class JobManager(BaseManager):
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """``bulk_create`` skips ``Job.save``, so assign missing public ids here"""
+        from job.models import job_ids
+
+        objs = list(objs)
+        missing = [job for job in objs if not job.unique_job_id]
+        for job, unique_job_id in zip(missing, job_ids.take(len(missing))):
+            job.unique_job_id = unique_job_id
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def counter_fields(self):
+
+        return ['total_applications'] + [application_counter(value) for value in JOB_STATUS_COUNTERS]
+
+    def bump_counters(self, job_id, **deltas):
+        """
+        Apply ``deltas`` to a job's application counters in one atomic
+        ``UPDATE``. Decrements are clamped at zero so drift can never
+        violate the positive-integer constraint.
+        """
+        if not defer_deltas(self, job_id, deltas):
+            self.apply_deltas(job_id, deltas)
+
+    def apply_deltas(self, job_id, deltas):
+
+        changes = {}
+        for field, delta in deltas.items():
+            if delta > 0:
+                changes[field] = F(field) + delta
+            elif delta < 0:
+                changes[field] = Greatest(F(field) + delta, Value(0))
+        if changes:
+            # updated_at is left alone: it tracks edits to the job itself,
+            # which the matching engine's watermark keys off.
+            self.filter(pk=job_id).update(counters_updated_at=timezone.now(), **changes)
+
+    def counted_applications(self, job_ids):
+        """Actual counter values for ``job_ids``, computed in one grouped query"""
+        from job.models import JobApplication
+
+        active = Q(status=StatusChoices.ACTIVE)
+        counted = active & ~Q(application_status=ApplicationStatusChoices.WITHDRAWN)
+        aggregates = {'total_applications': Count('pk', filter=counted)}
+        for value in JOB_STATUS_COUNTERS:
+            aggregates[application_counter(value)] = Count(
+                'pk', filter=active & Q(application_status=value)
+            )
+
+        rows = JobApplication.objects.order_by().filter(job_id__in=job_ids).values('job_id').annotate(**aggregates)
+        return {row.pop('job_id'): row for row in rows}
+
+
+class RecruiterStatsManager(models.Manager):
+
+    def counter_fields(self):
+
+        return ['published_jobs', 'closed_jobs', 'total_applications'] + [
+            application_counter(value) for value in ApplicationStatusChoices.values
+        ]
+
+    def bump(self, recruiter_id, **deltas):
+        """
+        Apply ``deltas`` to a recruiter's counters with a single atomic
+        ``UPDATE ... SET col = col + n``. A missing row is recomputed from
+        scratch once the surrounding transaction commits.
+        """
+        if not defer_deltas(self, recruiter_id, deltas):
+            self.apply_deltas(recruiter_id, deltas)
+
+    def apply_deltas(self, recruiter_id, deltas):
+
+        deltas = {field: delta for field, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        updated = self.filter(pk=recruiter_id).update(
+            **{field: F(field) + delta for field, delta in deltas.items()}
+        )
+        if not updated:
+            transaction.on_commit(lambda: self.recompute([recruiter_id]))
+
+    def recompute(self, recruiter_ids=None):
+        """
+        Rebuild counters with one conditional-aggregation query and upsert
+        them. Returns the recomputed rows keyed by recruiter id.
+        """
+        User = get_user_model()
+
+        job_active = Q(posted_jobs__status=StatusChoices.ACTIVE)
+        application_active = Q(posted_jobs__applications__status=StatusChoices.ACTIVE)
+        aggregates = {
+            'published_jobs': Count(
+                'posted_jobs',
+                filter=job_active & Q(posted_jobs__job_status=JobStatusChoices.PUBLISHED),
+                distinct=True,
+            ),
+            'closed_jobs': Count(
+                'posted_jobs',
+                filter=job_active & Q(posted_jobs__job_status=JobStatusChoices.CLOSED),
+                distinct=True,
+            ),
+            'total_applications': Count(
+                'posted_jobs__applications',
+                filter=application_active,
+                distinct=True,
+            ),
+        }
+        for value in ApplicationStatusChoices.values:
+            aggregates[application_counter(value)] = Count(
+                'posted_jobs__applications',
+                filter=application_active & Q(posted_jobs__applications__application_status=value),
+                distinct=True,
+            )
+
+        recruiters = User.objects.order_by()
+        if recruiter_ids is None:
+            recruiters = recruiters.filter(role=UserRoleChoices.RECRUITER)
+        else:
+            recruiters = recruiters.filter(pk__in=recruiter_ids)
+
+        rows = [
+            self.model(recruiter_id=row.pop('pk'), **row)
+            for row in recruiters.values('pk').annotate(**aggregates)
+        ]
+        if rows:
+            self.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=['recruiter'],
+                update_fields=self.counter_fields() + ['updated_at'],
+            )
+        return {row.recruiter_id: row for row in rows}
+
+
+class RecruiterDigestManager(models.Manager):
+
+    def add_pending(self, recruiter_id, application_id):
+        """ Count one more application towards the recruiter's next digest. """
+
+        now = timezone.now()
+        updated = self.filter(pk=recruiter_id).update(
+            pending_applications=F('pending_applications') + 1,
+            pending_since=Coalesce('pending_since', Value(now)),
+            # Starting a new digest: anything older was already mailed.
+            last_application_id=Case(
+                When(pending_applications=0, then=Value(application_id - 1)),
+                default=F('last_application_id'),
+                output_field=models.BigIntegerField(),
+            ),
+            updated_at=now,
+        )
+        if updated:
+            return
+        try:
+            with transaction.atomic(using=self.db):
+                self.create(
+                    recruiter_id=recruiter_id,
+                    pending_applications=1,
+                    pending_since=now,
+                    last_application_id=application_id - 1,
+                )
+        except IntegrityError:
+            # Created concurrently; count against that row instead.
+            self.add_pending(recruiter_id, application_id)
+
+    def due(self, interval_seconds, max_pending, now=None):
+
+        now = now or timezone.now()
+        return self.filter(pending_applications__gt=0).filter(
+            Q(pending_applications__gte=max_pending) |
+            Q(pending_since__lte=now - timedelta(seconds=interval_seconds))
+        )
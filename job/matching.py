@@ -0,0 +1,349 @@
+""" In-memory candidate-to-job matching over a NumPy skill-incidence matrix. """
+
+import threading
+import time
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from job.choices import ExperienceLevelChoices, JobStatusChoices
+
+
+DEFAULT_WEIGHTS = {
+    'skills': 0.6,
+    'experience': 0.25,
+    'location': 0.15,
+}
+
+# Years of experience expected for each level as (minimum, maximum).
+EXPERIENCE_YEARS = {
+    ExperienceLevelChoices.ENTRY: (0, 1),
+    ExperienceLevelChoices.JUNIOR: (1, 3),
+    ExperienceLevelChoices.MID: (3, 5),
+    ExperienceLevelChoices.SENIOR: (5, 8),
+    ExperienceLevelChoices.LEAD: (8, 12),
+    ExperienceLevelChoices.EXECUTIVE: (10, np.inf),
+}
+
+REMOTE_KEYWORDS = ('remote', 'anywhere')
+
+
+def experience_range(level):
+    """
+    Map a free-text experience level ("MID", "Mid-level", ...) to a
+    (minimum, maximum) years range, or (-1, -1) when it is not recognised.
+    """
+    normalized = ''.join(ch for ch in (level or '').upper() if ch.isalnum())
+    for value, years in EXPERIENCE_YEARS.items():
+        if normalized.startswith(value):
+            return years
+    return (-1, -1)
+
+
+def location_key(location):
+
+    return (location or '').split(',')[0].strip().casefold()
+
+
+class JobMatchingEngine:
+    """
+    Keeps one row per active job: a skill-incidence vector normalized by
+    the number of required skills, plus experience, location and deadline
+    columns. Scoring a candidate is one matrix-vector product followed by
+    ``argpartition`` for the top-k.
+
+    Rows are refreshed incrementally: ``Job`` signals mark ids dirty in
+    this process, and writes from other processes are picked up through an
+    ``updated_at`` watermark at most every ``JOB_MATCHING_REFRESH_SECONDS``.
+
+    ``_lock`` guards the arrays and is never held across a query; refreshes
+    are serialised by ``_refresh_lock`` so their results apply in order.
+    """
+
+    def __init__(self):
+
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._generation = 0
+        self._loaded = False
+        self._dirty = set()
+        self._reset()
+
+    def _reset(self):
+
+        self._size = 0
+        self._rows = {}
+        self._columns = {}
+        self._locations = {}
+        self._job_ids = np.zeros(0, dtype=np.int64)
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._deadlines = np.zeros(0, dtype=np.float64)
+        self._exp_min = np.zeros(0, dtype=np.float32)
+        self._exp_max = np.zeros(0, dtype=np.float32)
+        self._location_ids = np.zeros(0, dtype=np.int32)
+        self._remote = np.zeros(0, dtype=bool)
+        self._watermark = None
+        self._refreshed_at = 0.0
+
+    @property
+    def size(self):
+
+        return self._size
+
+    def mark_dirty(self, job_id):
+
+        with self._lock:
+            self._dirty.add(job_id)
+
+    def invalidate(self):
+
+        with self._lock:
+            # Refreshes already querying see the bump and drop their results.
+            self._generation += 1
+            self._loaded = False
+            self._dirty.clear()
+            self._reset()
+
+    # Storage helpers
+
+    def _ensure_capacity(self, rows, columns):
+
+        row_capacity, column_capacity = self._matrix.shape
+        if rows <= row_capacity and columns <= column_capacity:
+            return
+
+        new_rows = max(rows, row_capacity * 2, 64) if rows > row_capacity else row_capacity
+        new_columns = max(columns, column_capacity * 2, 64) if columns > column_capacity else column_capacity
+
+        matrix = np.zeros((new_rows, new_columns), dtype=np.float32)
+        matrix[:self._size, :column_capacity] = self._matrix[:self._size]
+        self._matrix = matrix
+
+        if new_rows > row_capacity:
+            for name in ('_job_ids', '_deadlines', '_exp_min', '_exp_max', '_location_ids', '_remote'):
+                current = getattr(self, name)
+                grown = np.zeros(new_rows, dtype=current.dtype)
+                grown[:self._size] = current[:self._size]
+                setattr(self, name, grown)
+
+    def _column(self, skill_id):
+
+        column = self._columns.get(skill_id)
+        if column is None:
+            column = len(self._columns)
+            self._columns[skill_id] = column
+        return column
+
+    def _location_id(self, location):
+
+        key = location_key(location)
+        return self._locations.setdefault(key, len(self._locations))
+
+    def _upsert(self, job_id, deadline, experience_level, location, skill_ids):
+
+        columns = [self._column(skill_id) for skill_id in skill_ids]
+        row = self._rows.get(job_id)
+        if row is None:
+            row = self._size
+            self._ensure_capacity(row + 1, len(self._columns))
+            self._rows[job_id] = row
+            self._size += 1
+        else:
+            self._ensure_capacity(self._size, len(self._columns))
+
+        self._matrix[row] = 0
+        if columns:
+            self._matrix[row, columns] = 1.0 / len(columns)
+        self._job_ids[row] = job_id
+        self._deadlines[row] = deadline.timestamp()
+        self._exp_min[row], self._exp_max[row] = experience_range(experience_level)
+        self._location_ids[row] = self._location_id(location)
+        self._remote[row] = any(word in (location or '').casefold() for word in REMOTE_KEYWORDS)
+
+    def _remove(self, job_id):
+
+        row = self._rows.pop(job_id, None)
+        if row is None:
+            return
+        last = self._size - 1
+        if row != last:
+            # Swap the last row into the hole to keep storage dense.
+            for array in (self._matrix, self._job_ids, self._deadlines, self._exp_min,
+                          self._exp_max, self._location_ids, self._remote):
+                array[row] = array[last]
+            self._rows[int(self._job_ids[row])] = row
+        self._matrix[last] = 0
+        self._size = last
+
+    # Synchronisation with the database
+
+    def _active_jobs(self):
+
+        from job.models import Job
+
+        return Job.active_objects.filter(
+            job_status=JobStatusChoices.PUBLISHED,
+            deadline__gt=timezone.now(),
+        )
+
+    def _fetch(self, job_ids=None):
+        """ Read the given jobs (or every active job) and their skill ids. """
+
+        from job.models import Job
+
+        jobs = self._active_jobs()
+        if job_ids is not None:
+            jobs = jobs.filter(pk__in=job_ids)
+        rows = list(jobs.values_list('pk', 'deadline', 'experience_level', 'location'))
+
+        skills = {}
+        links = Job.skill_tags.through.objects.filter(job_id__in=jobs.values('pk'))
+        for job_id, skill_id in links.values_list('job_id', 'skill_id'):
+            skills.setdefault(job_id, []).append(skill_id)
+        return rows, skills
+
+    def _apply(self, rows, skills, job_ids=None):
+        """ Upsert fetched jobs and drop the requested ones that are no longer active. """
+
+        found = set()
+        for job_id, deadline, experience_level, location in rows:
+            found.add(job_id)
+            self._upsert(job_id, deadline, experience_level, location, skills.get(job_id, []))
+
+        if job_ids is not None:
+            for job_id in set(job_ids) - found:
+                self._remove(job_id)
+
+    def _refresh_due(self):
+
+        refresh_seconds = getattr(settings, 'JOB_MATCHING_REFRESH_SECONDS', 60)
+        return time.monotonic() - self._refreshed_at >= refresh_seconds
+
+    def _stale(self):
+
+        return not self._loaded or bool(self._dirty) or self._refresh_due()
+
+    def _sync(self):
+
+        with self._lock:
+            if not self._stale():
+                return
+
+        with self._refresh_lock:
+            with self._lock:
+                if not self._stale():
+                    return
+                generation = self._generation
+                loaded = self._loaded
+                refresh_due = loaded and self._refresh_due()
+                watermark = self._watermark
+                job_ids = set(self._dirty)
+                self._dirty.clear()
+
+            if not loaded:
+                started = timezone.now()
+                rows, skills = self._fetch()
+                with self._lock:
+                    if self._generation != generation:
+                        return
+                    self._reset()
+                    self._apply(rows, skills)
+                    self._watermark = started
+                    self._loaded = True
+                    self._refreshed_at = time.monotonic()
+                return
+
+            if refresh_due:
+                from job.models import Job
+
+                changed = Job.objects.filter(updated_at__gt=watermark).values_list('pk', 'updated_at')
+                for job_id, updated_at in changed:
+                    job_ids.add(job_id)
+                    watermark = max(watermark, updated_at)
+
+            rows, skills = self._fetch(job_ids) if job_ids else ([], {})
+            with self._lock:
+                if self._generation != generation:
+                    return
+                self._apply(rows, skills, job_ids)
+                self._watermark = watermark
+                if refresh_due:
+                    self._refreshed_at = time.monotonic()
+
+    # Scoring
+
+    def score(self, skill_ids, experience_years=None, city='', limit=20):
+        """ Return up to ``limit`` (job_id, score) pairs, best first. """
+
+        weights = getattr(settings, 'JOB_MATCHING_WEIGHTS', DEFAULT_WEIGHTS)
+
+        self._sync()
+        with self._lock:
+            size = self._size
+            if not size or limit <= 0:
+                return []
+
+            candidate = np.zeros(self._matrix.shape[1], dtype=np.float32)
+            columns = [self._columns[skill_id] for skill_id in skill_ids if skill_id in self._columns]
+            if columns:
+                candidate[columns] = 1.0
+            skill_scores = self._matrix[:size] @ candidate
+
+            exp_min = self._exp_min[:size]
+            exp_max = self._exp_max[:size]
+            if experience_years is None:
+                experience_scores = np.full(size, 0.5, dtype=np.float32)
+            else:
+                years = float(experience_years)
+                under = np.clip(1.0 - (exp_min - years) / 3.0, 0.0, 1.0)
+                experience_scores = np.where(
+                    years >= exp_min,
+                    np.where(years <= exp_max + 2, 1.0, 0.7),
+                    under,
+                )
+                experience_scores = np.where(exp_min < 0, 0.5, experience_scores)
+
+            location_scores = self._remote[:size].astype(np.float32)
+            city_id = self._locations.get(location_key(city)) if city else None
+            if city_id is not None:
+                location_scores = np.maximum(location_scores, self._location_ids[:size] == city_id)
+
+            scores = (
+                weights['skills'] * skill_scores
+                + weights['experience'] * experience_scores
+                + weights['location'] * location_scores
+            )
+            scores[self._deadlines[:size] <= timezone.now().timestamp()] = -np.inf
+
+            k = min(limit, size)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind='stable')]
+            job_ids = self._job_ids[top]
+            top_scores = scores[top]
+
+        return [
+            (int(job_id), float(score))
+            for job_id, score in zip(job_ids, top_scores)
+            if np.isfinite(score)
+        ]
+
+    def recommend(self, profile, limit=20):
+
+        skill_ids = list(profile.skill_tags.values_list('pk', flat=True))
+        return self.score(
+            skill_ids,
+            experience_years=profile.experience_years,
+            city=profile.city,
+            limit=limit,
+        )
+
+
+matching_engine = JobMatchingEngine()
+
+
+def schedule_refresh(job_id):
+    """ Mark a job for re-scoring once the current transaction commits. """
+
+    transaction.on_commit(lambda: matching_engine.mark_dirty(job_id))
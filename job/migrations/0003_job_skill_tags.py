@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-17 02:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_skill'),
+        ('job', '0002_job_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='skill_tags',
+            field=models.ManyToManyField(blank=True, help_text='Normalized skills, kept in sync with skills_required', related_name='jobs', to='core.skill'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.1 on 2026-10-17 02:56
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_skill'),
+        ('job', '0003_job_skill_tags'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['created_at'], name='jobs_created_7c32a5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['salary_max'], name='jobs_salary__71cae5_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.1 on 2026-10-17 02:57
+
+import dirtyfields.dirtyfields
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_skill'),
+        ('job', '0004_job_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecruiterStats',
+            fields=[
+                ('uid', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, help_text='Unique identifier for this model instance.', unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Timestamp indicating when the instance was created.')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Timestamp indicating when the instance was last updated.')),
+                ('status', models.CharField(choices=[('ACTIVE', 'Active'), ('INACTIVE', 'Inactive'), ('DELETED', 'Deleted'), ('DRAFT', 'Draft'), ('REMOVED', 'Removed')], default='ACTIVE', help_text='Status of the instance, typically used for soft deletion.', max_length=20)),
+                ('recruiter', models.OneToOneField(help_text='Recruiter these counters belong to', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='job_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('published_jobs', models.IntegerField(default=0)),
+                ('closed_jobs', models.IntegerField(default=0)),
+                ('total_applications', models.IntegerField(default=0)),
+                ('pending_applications', models.IntegerField(default=0)),
+                ('reviewing_applications', models.IntegerField(default=0)),
+                ('shortlisted_applications', models.IntegerField(default=0)),
+                ('interview_scheduled_applications', models.IntegerField(default=0)),
+                ('accepted_applications', models.IntegerField(default=0)),
+                ('rejected_applications', models.IntegerField(default=0)),
+                ('withdrawn_applications', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Recruiter Stats',
+                'verbose_name_plural': 'Recruiter Stats',
+                'db_table': 'recruiter_stats',
+            },
+            bases=(dirtyfields.dirtyfields.DirtyFieldsMixin, models.Model),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.1 on 2026-10-17 02:58
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_counters(apps, schema_editor):
+
+    Job = apps.get_model('job', 'Job')
+    JobApplication = apps.get_model('job', 'JobApplication')
+
+    def counted(condition):
+        return Coalesce(Subquery(
+            JobApplication.objects.order_by()
+            .filter(condition, job=OuterRef('pk'), status='ACTIVE')
+            .values('job')
+            .annotate(total=Count('pk'))
+            .values('total')
+        ), 0)
+
+    Job.objects.update(
+        total_applications=counted(~Q(application_status='WITHDRAWN')),
+        pending_applications=counted(Q(application_status='PENDING')),
+        shortlisted_applications=counted(Q(application_status='SHORTLISTED')),
+        accepted_applications=counted(Q(application_status='ACCEPTED')),
+        rejected_applications=counted(Q(application_status='REJECTED')),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0005_recruiterstats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='accepted_applications',
+            field=models.PositiveIntegerField(default=0, help_text='Applications accepted'),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='pending_applications',
+            field=models.PositiveIntegerField(default=0, help_text='Applications pending review'),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='rejected_applications',
+            field=models.PositiveIntegerField(default=0, help_text='Applications rejected'),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='shortlisted_applications',
+            field=models.PositiveIntegerField(default=0, help_text='Applications shortlisted'),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-17 02:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0006_job_application_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobapplication',
+            name='idempotency_key',
+            field=models.CharField(blank=True, help_text='Idempotency-Key sent with the apply request, used to recognise retries', max_length=64),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.1 on 2026-10-17 03:04
+
+import dirtyfields.dirtyfields
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_userprofile_application_email_mode'),
+        ('job', '0007_jobapplication_idempotency_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecruiterDigest',
+            fields=[
+                ('uid', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, help_text='Unique identifier for this model instance.', unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Timestamp indicating when the instance was created.')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Timestamp indicating when the instance was last updated.')),
+                ('status', models.CharField(choices=[('ACTIVE', 'Active'), ('INACTIVE', 'Inactive'), ('DELETED', 'Deleted'), ('DRAFT', 'Draft'), ('REMOVED', 'Removed')], default='ACTIVE', help_text='Status of the instance, typically used for soft deletion.', max_length=20)),
+                ('recruiter', models.OneToOneField(help_text='Recruiter receiving the digest', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='application_digest', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('pending_applications', models.IntegerField(default=0)),
+                ('pending_since', models.DateTimeField(blank=True, help_text='When the oldest unsent application arrived', null=True)),
+                ('last_application_id', models.BigIntegerField(default=0, help_text='Newest application already covered by a digest')),
+                ('last_sent_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Recruiter Digest',
+                'verbose_name_plural': 'Recruiter Digests',
+                'db_table': 'recruiter_digests',
+                'indexes': [models.Index(fields=['pending_since'], name='recruiter_d_pending_2cb152_idx')],
+            },
+            bases=(dirtyfields.dirtyfields.DirtyFieldsMixin, models.Model),
+        ),
+    ]
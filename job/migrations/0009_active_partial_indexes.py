@@ -0,0 +1,32 @@
+# Generated by Django 5.2.1 on 2026-10-17 03:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_userprofile_application_email_mode'),
+        ('job', '0008_recruiterdigest'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('status', 'ACTIVE')), fields=['job_status', 'deadline'], name='jobs_active_status_deadline'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('status', 'ACTIVE')), fields=['recruiter', 'created_at'], name='jobs_active_recruiter_created'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(condition=models.Q(('status', 'ACTIVE')), fields=['job', 'application_status'], name='applications_active_job_status'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(condition=models.Q(('status', 'ACTIVE')), fields=['candidate', 'created_at'], name='applications_active_candidate'),
+        ),
+    ]
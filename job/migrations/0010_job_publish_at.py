@@ -0,0 +1,25 @@
+# Generated by Django 5.2.1 on 2026-10-17 03:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_userprofile_application_email_mode'),
+        ('job', '0009_active_partial_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='publish_at',
+            field=models.DateTimeField(blank=True, help_text='Publish this DRAFT job automatically at this time', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('job_status', 'DRAFT'), ('status', 'ACTIVE')), fields=['publish_at'], name='jobs_active_draft_publish_at'),
+        ),
+    ]
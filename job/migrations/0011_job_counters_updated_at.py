@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-17 04:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0010_job_publish_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='counters_updated_at',
+            field=models.DateTimeField(blank=True, help_text='When the application counters last changed (they leave updated_at alone)', null=True),
+        ),
+    ]
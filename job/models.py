@@ -1,13 +1,17 @@
 """ Implement your job related models here. """
 
 import uuid
+from django.conf import settings
 from django.db import models
 from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator
 from django.utils import timezone
 
+from core.ids import IdAllocator
 from shared.base_model import BaseModel
+from shared.choices import StatusChoices
 from job.choices import JobStatusChoices, ApplicationStatusChoices
+from job.managers import JobManager, RecruiterDigestManager, RecruiterStatsManager
 
 User = get_user_model()
 
@@ -71,6 +75,12 @@ class Job(BaseModel):
         blank=True,
         help_text="Comma-separated list of required skills"
     )
+    skill_tags = models.ManyToManyField(
+        'core.Skill',
+        blank=True,
+        related_name='jobs',
+        help_text="Normalized skills, kept in sync with skills_required"
+    )
     
 
     deadline = models.DateTimeField(
@@ -84,6 +94,11 @@ class Job(BaseModel):
         default=JobStatusChoices.PUBLISHED,
         help_text="Current status of the job posting"
     )
+    publish_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Publish this DRAFT job automatically at this time"
+    )
     
 
     recruiter = models.ForeignKey(
@@ -98,6 +113,29 @@ class Job(BaseModel):
         default=0,
         help_text="Total number of applications received"
     )
+    pending_applications = models.PositiveIntegerField(
+        default=0,
+        help_text="Applications pending review"
+    )
+    shortlisted_applications = models.PositiveIntegerField(
+        default=0,
+        help_text="Applications shortlisted"
+    )
+    accepted_applications = models.PositiveIntegerField(
+        default=0,
+        help_text="Applications accepted"
+    )
+    rejected_applications = models.PositiveIntegerField(
+        default=0,
+        help_text="Applications rejected"
+    )
+    counters_updated_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the application counters last changed (they leave updated_at alone)"
+    )
+
+    objects = JobManager()
     
     class Meta:
         db_table = 'jobs'
@@ -108,6 +146,24 @@ class Job(BaseModel):
             models.Index(fields=['unique_job_id']),
             models.Index(fields=['recruiter', 'job_status']),
             models.Index(fields=['deadline']),
+            models.Index(fields=['created_at']),
+            models.Index(fields=['salary_max']),
+            # Partial indexes: only live rows, matching ``active_objects``.
+            models.Index(
+                fields=['job_status', 'deadline'],
+                condition=models.Q(status=StatusChoices.ACTIVE),
+                name='jobs_active_status_deadline',
+            ),
+            models.Index(
+                fields=['recruiter', 'created_at'],
+                condition=models.Q(status=StatusChoices.ACTIVE),
+                name='jobs_active_recruiter_created',
+            ),
+            models.Index(
+                fields=['publish_at'],
+                condition=models.Q(status=StatusChoices.ACTIVE, job_status=JobStatusChoices.DRAFT),
+                name='jobs_active_draft_publish_at',
+            ),
         ]
 
     def __str__(self):
@@ -121,15 +177,7 @@ class Job(BaseModel):
 
     def generate_unique_job_id(self):
 
-        import random
-        import string
-        
-        prefix = "JOB"
-        while True:
-            random_part = ''.join(random.choices(string.digits, k=6))
-            job_id = f"{prefix}{random_part}"
-            if not Job.objects.filter(unique_job_id=job_id).exists():
-                return job_id
+        return job_ids.allocate()
 
     @property
     def is_active(self):
@@ -162,6 +210,13 @@ class Job(BaseModel):
         return "Salary not specified"
 
 
+# Public job ids ("JOB" + digits), handed out in blocks reserved on an IdSequence row.
+job_ids = IdAllocator(
+    'job', 'JOB', Job, 'unique_job_id',
+    block_size=getattr(settings, 'JOB_ID_BLOCK_SIZE', 100),
+)
+
+
 class JobApplication(BaseModel):
 
     job = models.ForeignKey(
@@ -207,6 +262,12 @@ class JobApplication(BaseModel):
         blank=True,
         help_text="Scheduled interview date and time"
     )
+
+    idempotency_key = models.CharField(
+        max_length=64,
+        blank=True,
+        help_text="Idempotency-Key sent with the apply request, used to recognise retries"
+    )
     
     class Meta:
         db_table = 'job_applications'
@@ -221,21 +282,21 @@ class JobApplication(BaseModel):
             models.Index(fields=['job', 'application_status']),
             models.Index(fields=['candidate', 'application_status']),
             models.Index(fields=['created_at']),
+            models.Index(
+                fields=['job', 'application_status'],
+                condition=models.Q(status=StatusChoices.ACTIVE),
+                name='applications_active_job_status',
+            ),
+            models.Index(
+                fields=['candidate', 'created_at'],
+                condition=models.Q(status=StatusChoices.ACTIVE),
+                name='applications_active_candidate',
+            ),
         ]
 
     def __str__(self):
         return f"{self.candidate.get_full_name()} applied to {self.job.title}"
 
-    def save(self, *args, **kwargs):
-
-        is_new = self.pk is None
-        super().save(*args, **kwargs)
-        
-        if is_new:
-
-            self.job.total_applications = self.job.applications.count()
-            self.job.save(update_fields=['total_applications'])
-
     @property
     def is_pending(self):
 
@@ -249,4 +310,81 @@ class JobApplication(BaseModel):
     @property
     def is_rejected(self):
 
-        return self.application_status == ApplicationStatusChoices.REJECTED
\ No newline at end of file
+        return self.application_status == ApplicationStatusChoices.REJECTED
+
+
+class RecruiterStats(BaseModel):
+    """
+    Per-recruiter dashboard counters, maintained incrementally by job and
+    application signals and rebuilt by ``reconcile_recruiter_stats``.
+    """
+
+    recruiter = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='job_stats',
+        help_text="Recruiter these counters belong to"
+    )
+
+    published_jobs = models.IntegerField(default=0)
+    closed_jobs = models.IntegerField(default=0)
+
+    total_applications = models.IntegerField(default=0)
+    pending_applications = models.IntegerField(default=0)
+    reviewing_applications = models.IntegerField(default=0)
+    shortlisted_applications = models.IntegerField(default=0)
+    interview_scheduled_applications = models.IntegerField(default=0)
+    accepted_applications = models.IntegerField(default=0)
+    rejected_applications = models.IntegerField(default=0)
+    withdrawn_applications = models.IntegerField(default=0)
+
+    objects = RecruiterStatsManager()
+
+    class Meta:
+        db_table = 'recruiter_stats'
+        verbose_name = 'Recruiter Stats'
+        verbose_name_plural = 'Recruiter Stats'
+
+    def __str__(self):
+        return f"Stats for {self.recruiter_id}"
+
+
+class RecruiterDigest(BaseModel):
+    """
+    Applications waiting to be summarised for a recruiter in digest mode.
+    Only a count is kept; the digest itself is built from the applications
+    after ``last_application_id`` when it is flushed.
+    """
+
+    recruiter = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='application_digest',
+        help_text="Recruiter receiving the digest"
+    )
+    pending_applications = models.IntegerField(default=0)
+    pending_since = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the oldest unsent application arrived"
+    )
+    last_application_id = models.BigIntegerField(
+        default=0,
+        help_text="Newest application already covered by a digest"
+    )
+    last_sent_at = models.DateTimeField(null=True, blank=True)
+
+    objects = RecruiterDigestManager()
+
+    class Meta:
+        db_table = 'recruiter_digests'
+        verbose_name = 'Recruiter Digest'
+        verbose_name_plural = 'Recruiter Digests'
+        indexes = [
+            models.Index(fields=['pending_since']),
+        ]
+
+    def __str__(self):
+        return f"Digest for {self.recruiter_id}"
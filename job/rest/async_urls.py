@@ -0,0 +1,15 @@
+from django.urls import path
+
+from job.rest.views.async_views import (
+    AsyncJobListView,
+    AsyncJobDetailView,
+    AsyncJobApplicationListView,
+    AsyncRecruiterDashboardView
+)
+
+urlpatterns = [
+    path('jobs/', AsyncJobListView.as_view(), name='async-job-list'),
+    path('jobs/<int:pk>/', AsyncJobDetailView.as_view(), name='async-job-detail'),
+    path('applications/', AsyncJobApplicationListView.as_view(), name='async-application-list'),
+    path('recruiter-dashboard/', AsyncRecruiterDashboardView.as_view(), name='async-recruiter-dashboard'),
+]
@@ -0,0 +1,57 @@
+from django.db.models import Count
+from django_filters import rest_framework as filters
+
+from core.models import Skill
+from job.models import Job, JobApplication
+
+
+class JobFilter(filters.FilterSet):
+
+    skills = filters.CharFilter(
+        method='filter_skills',
+        help_text="Comma-separated skill names, matched case-insensitively"
+    )
+    skills_match = filters.ChoiceFilter(
+        choices=[('any', 'Any'), ('all', 'All')],
+        method='filter_skills_match',
+        help_text="Require any (default) or all of the given skills"
+    )
+
+    class Meta:
+        model = Job
+        fields = ['job_status', 'location', 'job_type', 'experience_level']
+
+    def filter_skills(self, queryset, name, value):
+
+        names = Skill.objects.parse(value)
+        if not names:
+            return queryset
+
+        # Subqueries only: building the filter never hits the database, so
+        # the async list view can apply it from the event loop.
+        skill_ids = Skill.objects.filter(canonical_name__in=list(names)).values('pk')
+        links = Job.skill_tags.through.objects.filter(skill_id__in=skill_ids)
+        if self.form.cleaned_data.get('skills_match') == 'all':
+            # A name with no matching skill keeps every job below the count.
+            links = links.values('job_id').annotate(
+                matched=Count('skill_id')
+            ).filter(matched=len(names))
+        return queryset.filter(pk__in=links.values('job_id'))
+
+    def filter_skills_match(self, queryset, name, value):
+
+        return queryset
+
+
+class JobApplicationFilter(filters.FilterSet):
+    """
+    The ``filterset_fields`` of JobApplicationViewSet, with ``job`` as a
+    plain id so validating the filter needs no query (used by the async
+    application list).
+    """
+
+    job = filters.NumberFilter(field_name='job_id')
+
+    class Meta:
+        model = JobApplication
+        fields = ['application_status', 'job']
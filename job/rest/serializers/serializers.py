@@ -13,7 +13,7 @@ class JobListSerializer(serializers.ModelSerializer):
     recruiter_name = serializers.CharField(source='recruiter.get_full_name', read_only=True)
     is_active = serializers.BooleanField(read_only=True)
     salary_range = serializers.CharField(source='get_salary_range', read_only=True)
-    skills_list = serializers.ListField(source='get_skills_list', read_only=True)
+    skills_list = serializers.SerializerMethodField()
     
     class Meta:
         model = Job
@@ -23,6 +23,17 @@ class JobListSerializer(serializers.ModelSerializer):
             'deadline', 'is_active', 'created_at'
         ]
 
+    def get_skills_list(self, obj):
+        # Served from the prefetched skill_tags relation set up by JobViewSet
+        return [skill.name for skill in obj.skill_tags.all()]
+
+class JobRecommendationSerializer(JobListSerializer):
+
+    match_score = serializers.FloatField(read_only=True)
+
+    class Meta(JobListSerializer.Meta):
+        fields = JobListSerializer.Meta.fields + ['match_score']
+
 class JobDetailSerializer(serializers.ModelSerializer):
 
     recruiter_name = serializers.CharField(source='recruiter.get_full_name', read_only=True)
@@ -37,8 +48,10 @@ class JobDetailSerializer(serializers.ModelSerializer):
         model = Job
         fields = '__all__'
         read_only_fields = [
-            'unique_job_id', 'recruiter', 'total_applications',
-            'created_at', 'updated_at'
+            'unique_job_id', 'recruiter', 'total_applications', 'skill_tags',
+            'pending_applications', 'shortlisted_applications',
+            'accepted_applications', 'rejected_applications',
+            'counters_updated_at', 'created_at', 'updated_at'
         ]
 
 class JobCreateSerializer(serializers.ModelSerializer):
@@ -48,7 +61,7 @@ class JobCreateSerializer(serializers.ModelSerializer):
         fields = [
             'title', 'description', 'requirements', 'location',
             'salary_min', 'salary_max', 'job_type', 'experience_level',
-            'skills_required', 'deadline'
+            'skills_required', 'deadline', 'publish_at'
         ]
         
     def validate_deadline(self, value):
@@ -72,6 +85,13 @@ class JobCreateSerializer(serializers.ModelSerializer):
                 raise serializers.ValidationError(
                     "Minimum salary cannot be greater than maximum salary."
                 )
+        publish_at = data.get('publish_at')
+        if publish_at:
+            if publish_at >= data.get('deadline', publish_at):
+                raise serializers.ValidationError("Publish time must be before the deadline.")
+            if publish_at > timezone.now():
+                # Held back until the scheduler publishes it.
+                data['job_status'] = JobStatusChoices.DRAFT
         return data
 
 class JobApplicationSerializer(serializers.ModelSerializer):
@@ -92,7 +112,7 @@ class JobApplicationSerializer(serializers.ModelSerializer):
         ]
         
     def validate(self, data):
-        job = data.get('job') or self.instance.job if self.instance else None
+        job = data.get('job') or (self.instance.job if self.instance else None)
         
         if not job:
             raise serializers.ValidationError("Job is required.")
@@ -106,6 +126,15 @@ class JobApplicationSerializer(serializers.ModelSerializer):
             
         return data
 
+class JobApplySerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = JobApplication
+        fields = ['cover_letter', 'resume']
+        extra_kwargs = {
+            'resume': {'required': False},
+        }
+
 class JobApplicationStatusSerializer(serializers.ModelSerializer):
 
     class Meta:
@@ -119,8 +148,8 @@ class JobApplicationStatusSerializer(serializers.ModelSerializer):
 
 class RecruiterDashboardSerializer(serializers.Serializer):
 
-    total_published_jobs = serializers.IntegerField()
-    total_closed_jobs = serializers.IntegerField()
-    total_candidate_applications = serializers.IntegerField()
-    total_candidates_hired = serializers.IntegerField()
-    total_candidates_rejected = serializers.IntegerField()
\ No newline at end of file
+    total_published_jobs = serializers.IntegerField(source='published_jobs')
+    total_closed_jobs = serializers.IntegerField(source='closed_jobs')
+    total_candidate_applications = serializers.IntegerField(source='total_applications')
+    total_candidates_hired = serializers.IntegerField(source='accepted_applications')
+    total_candidates_rejected = serializers.IntegerField(source='rejected_applications')
\ No newline at end of file
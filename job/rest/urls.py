@@ -4,7 +4,9 @@ from rest_framework.routers import DefaultRouter
 from job.rest.views.views import (
     JobViewSet,
     JobApplicationViewSet,
-    RecruiterDashboardView
+    JobRecommendationView,
+    RecruiterDashboardView,
+    JobCacheStatsView
 )
 
 router = DefaultRouter()
@@ -14,5 +16,7 @@ router.register(r'applications', JobApplicationViewSet, basename='application')
 urlpatterns =[
     
     path('recruiter-dashboard/', RecruiterDashboardView.as_view(), name='recruiter-dashboard'),
+    path('recommendations/', JobRecommendationView.as_view(), name='job-recommendations'),
+    path('cache-stats/', JobCacheStatsView.as_view(), name='job-cache-stats'),
 ]
 urlpatterns += router.urls  
\ No newline at end of file
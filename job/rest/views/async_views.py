@@ -0,0 +1,81 @@
+from asgiref.sync import sync_to_async
+from django.db.models import aprefetch_related_objects
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.permissions import IsAuthenticated
+
+from job.models import Job, JobApplication, RecruiterStats
+from job.search import search_jobs
+from job.rest.filters import JobApplicationFilter, JobFilter
+from job.rest.serializers.serializers import (
+    JobListSerializer,
+    JobDetailSerializer,
+    JobApplicationSerializer,
+    RecruiterDashboardSerializer
+)
+from job.rest.views.views import scope_applications, scope_jobs
+from shared.async_views import AsyncPageNumberPagination, AsyncReadView
+from shared.permissions import IsRecruiterUser
+
+
+class AsyncJobListView(AsyncReadView):
+
+    async def get(self, request):
+
+        queryset = scope_jobs(Job.active_objects.all(), request.user)
+        filterset = JobFilter(request.GET, queryset=queryset, request=request)
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+
+        queryset = filterset.qs.select_related('recruiter').prefetch_related('skill_tags')
+        query = request.GET.get('q', '').strip()
+        if query:
+            queryset = search_jobs(queryset, query)
+
+        paginator = AsyncPageNumberPagination()
+        jobs = await paginator.paginate_queryset(queryset, request)
+        serializer = JobListSerializer(jobs, many=True, context={'request': request})
+        return self.render(paginator.get_paginated_data(serializer.data))
+
+class AsyncJobDetailView(AsyncReadView):
+
+    async def get(self, request, pk):
+
+        queryset = scope_jobs(Job.active_objects.all(), request.user).select_related('recruiter')
+        try:
+            job = await queryset.aget(pk=pk)
+        except Job.DoesNotExist:
+            raise NotFound('No Job matches the given query.')
+        await aprefetch_related_objects([job], 'skill_tags')
+
+        serializer = JobDetailSerializer(job, context={'request': request})
+        return self.render(serializer.data)
+
+class AsyncJobApplicationListView(AsyncReadView):
+
+    async def get(self, request):
+
+        queryset = scope_applications(JobApplication.active_objects.all(), request.user)
+        filterset = JobApplicationFilter(request.GET, queryset=queryset, request=request)
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+
+        queryset = filterset.qs.select_related('job__recruiter', 'candidate')
+        paginator = AsyncPageNumberPagination()
+        applications = await paginator.paginate_queryset(queryset, request)
+        serializer = JobApplicationSerializer(applications, many=True, context={'request': request})
+        return self.render(paginator.get_paginated_data(serializer.data))
+
+class AsyncRecruiterDashboardView(AsyncReadView):
+
+    permission_classes = [IsAuthenticated, IsRecruiterUser]
+
+    async def get(self, request):
+
+        user = request.user
+        stats = await RecruiterStats.objects.filter(pk=user.pk).afirst()
+        if stats is None:
+            # First visit only; recompute is a sync bulk upsert.
+            stats = (await sync_to_async(RecruiterStats.objects.recompute)([user.pk]))[user.pk]
+
+        serializer = RecruiterDashboardSerializer(stats)
+        return self.render(serializer.data)
@@ -1,20 +1,37 @@
 from rest_framework import viewsets, generics, status
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.views import APIView
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser
 from django_filters.rest_framework import DjangoFilterBackend
+from django.conf import settings
 from django.utils import timezone
 
-from job.models import Job, JobApplication
-from job.choices import JobStatusChoices, ApplicationStatusChoices
+from job.models import Job, JobApplication, RecruiterStats
+from job.search import search_jobs
+from job.cache import JobResponseCacheMixin, cache_stats, reset_stats
+from job.exporter import FORMATS as EXPORT_FORMATS, export_response
+from job.importer import ImportFormatError, detect_format, import_jobs
+from job.matching import matching_engine
+from job.services import DuplicateApplication, submit_application
+from job.write_behind import WriteBehindTimeout, get_application_writer
+from job.rest.filters import JobFilter
+from job.choices import JobStatusChoices
 from job.rest.serializers.serializers import (
     JobListSerializer,
+    JobRecommendationSerializer,
     JobDetailSerializer,
     JobCreateSerializer,
     JobApplicationSerializer,
+    JobApplySerializer,
     JobApplicationStatusSerializer,
     RecruiterDashboardSerializer
 )
+from shared.conditional import ConditionalGetMixin
+from shared.pagination import SelectablePagination
+from shared.throttling import UserThrottle
 from shared.permissions import (
     IsRecruiterUser,
     IsCandidateUser,
@@ -22,11 +39,44 @@ from shared.permissions import (
     IsOwnerOrReadOnly
 )
 
-class JobViewSet(viewsets.ModelViewSet):
+def scope_jobs(queryset, user):
+    """ Jobs ``user`` may see: published ones for candidates, their own for recruiters. """
 
-    queryset = Job.objects.all()
+    if getattr(user, 'role', None) == 'CANDIDATE':
+        # The scheduler closes expired jobs, but only learns of a new deadline
+        # on its next reload (and may not be running), so check it here too.
+        queryset = queryset.filter(job_status=JobStatusChoices.PUBLISHED, deadline__gt=timezone.now())
+
+    elif getattr(user, 'role', None) == 'RECRUITER':
+        queryset = queryset.filter(recruiter=user)
+    return queryset
+
+def scope_applications(queryset, user):
+    """ Applications ``user`` may see: their own for candidates, those to their jobs for recruiters. """
+
+    if getattr(user, 'role', None) == 'CANDIDATE':
+        return queryset.filter(candidate=user)
+
+    elif getattr(user, 'role', None) == 'RECRUITER':
+        return queryset.filter(job__recruiter=user)
+    return queryset
+
+class JobViewSet(ConditionalGetMixin, JobResponseCacheMixin, viewsets.ModelViewSet):
+
+    queryset = Job.active_objects.all()
     filter_backends = [DjangoFilterBackend]
-    filterset_fields = ['job_status', 'location', 'job_type', 'experience_level']
+    filterset_class = JobFilter
+    pagination_class = SelectablePagination
+    cursor_ordering_fields = ['created_at', 'deadline', 'salary_max']
+    # ?q= results are ordered by search rank, which has no keyset position
+    cursor_incompatible_params = ['q']
+    # Responses show the recruiter's name and email, and is_active/is_expired flip at the deadline
+    etag_related_fields = ['recruiter__updated_at']
+    etag_clock_field = 'deadline'
+    # Application counters are bumped without touching updated_at
+    detail_etag_fields = ['counters_updated_at']
+    # Set per action (see ``apply``); other actions are not rate limited.
+    throttle_scope = None
     
     def get_serializer_class(self):
 
@@ -38,7 +88,7 @@ class JobViewSet(viewsets.ModelViewSet):
         
     def get_permissions(self):
 
-        if self.action == 'create':
+        if self.action in ['create', 'bulk_import']:
             permission_classes = [IsAuthenticated, IsRecruiterUser]
         elif self.action in ['update', 'partial_update', 'destroy']:
             permission_classes = [IsAuthenticated, IsRecruiterOwnerOrReadOnly]
@@ -52,55 +102,107 @@ class JobViewSet(viewsets.ModelViewSet):
         
     def get_queryset(self):
 
-        queryset = super().get_queryset()
-        
-
-        if getattr(self.request.user, 'role', None) == 'CANDIDATE':
-            return queryset.filter(
-                job_status=JobStatusChoices.PUBLISHED,
-                deadline__gt=timezone.now(),
-                status='ACTIVE'
-            )
+        queryset = scope_jobs(super().get_queryset(), self.request.user)
 
-        elif getattr(self.request.user, 'role', None) == 'RECRUITER':
-            return queryset.filter(
-                recruiter=self.request.user,
-                status='ACTIVE'
-            )
-        return queryset.filter(status='ACTIVE')
+        if self.action == 'apply':
+            queryset = queryset.select_related('recruiter')
+        elif self.action == 'list':
+            queryset = queryset.prefetch_related('skill_tags')
+            query = self.request.query_params.get('q', '').strip()
+            if query:
+                queryset = search_jobs(queryset, query)
+        return queryset
         
     @action(
         detail=True,
         methods=['post'],
-        permission_classes=[IsAuthenticated, IsCandidateUser]
+        permission_classes=[IsAuthenticated, IsCandidateUser],
+        throttle_classes=[UserThrottle],
+        throttle_scope='apply'
     )
     def apply(self, request, pk=None):
 
         job = self.get_object()
         
 
-        if not (job.job_status == JobStatusChoices.PUBLISHED and 
-                job.deadline > timezone.now() and
-                job.status == 'ACTIVE'):
+        if not job.is_active:
             return Response(
                 {'detail': 'This job is not currently accepting applications.'},
                 status=status.HTTP_403_FORBIDDEN
             )
-        
-        serializer = JobApplicationSerializer(
-            data={'job': job.id},
-            context={'request': request}
-        )
-        serializer.is_valid(raise_exception=True)
-        serializer.save(candidate=request.user)
+
+        payload = JobApplySerializer(data=request.data)
+        payload.is_valid(raise_exception=True)
+
+        idempotency_key = request.headers.get('Idempotency-Key', '')
+        max_length = JobApplication._meta.get_field('idempotency_key').max_length
+        if len(idempotency_key) > max_length:
+            # Truncating could make two different keys collide and replay another request's application.
+            raise ValidationError({'Idempotency-Key': [f'Must be at most {max_length} characters.']})
+
+        submit = submit_application
+        if settings.APPLICATION_WRITE_BEHIND_ENABLED:
+            submit = get_application_writer().submit
+
+        try:
+            application, created = submit(
+                job,
+                request.user,
+                cover_letter=payload.validated_data.get('cover_letter', ''),
+                resume=payload.validated_data.get('resume'),
+                idempotency_key=idempotency_key,
+            )
+        except DuplicateApplication as exc:
+            raise ValidationError({'non_field_errors': [str(exc)]})
+        except WriteBehindTimeout as exc:
+            return Response(
+                {'detail': str(exc)},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={'Retry-After': '1'}
+            )
+
+        serializer = JobApplicationSerializer(application, context={'request': request})
+        if not created:
+            return Response(
+                serializer.data,
+                status=status.HTTP_200_OK,
+                headers={'Idempotent-Replayed': 'true'}
+            )
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
-class JobApplicationViewSet(viewsets.ModelViewSet):
+    @action(
+        detail=False,
+        methods=['post'],
+        url_path='import',
+        parser_classes=[MultiPartParser],
+        permission_classes=[IsAuthenticated, IsRecruiterUser]
+    )
+    def bulk_import(self, request):
 
-    queryset = JobApplication.objects.all()
+        upload = request.FILES.get('file')
+        if upload is None:
+            raise ValidationError({'file': ['Upload a CSV or NDJSON file.']})
+        try:
+            fmt = detect_format(
+                upload.name,
+                upload.content_type,
+                request.data.get('import_format') or request.query_params.get('import_format'),
+            )
+        except ImportFormatError as exc:
+            raise ValidationError({'import_format': [str(exc)]})
+
+        report = import_jobs(upload, request.user, fmt)
+        return Response(report, status=status.HTTP_200_OK)
+
+class JobApplicationViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
+
+    queryset = JobApplication.active_objects.all()
     serializer_class = JobApplicationSerializer
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['application_status', 'job']
+    pagination_class = SelectablePagination
+    cursor_ordering_fields = ['created_at']
+    etag_related_fields = ['job__updated_at', 'candidate__updated_at', 'job__recruiter__updated_at']
     
     def get_serializer_class(self):
 
@@ -123,21 +225,49 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
         
     def get_queryset(self):
 
-        queryset = super().get_queryset()
-        
+        return scope_applications(super().get_queryset(), self.request.user)
 
-        if getattr(self.request.user, 'role', None) == 'CANDIDATE':
-            return queryset.filter(
-                candidate=self.request.user,
-                status='ACTIVE'
-            )
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
 
-        elif getattr(self.request.user, 'role', None) == 'RECRUITER':
-            return queryset.filter(
-                job__recruiter=self.request.user,
-                status='ACTIVE'
-            )
-        return queryset.filter(status='ACTIVE')
+        fmt = request.query_params.get('export_format', 'csv')
+        if fmt not in EXPORT_FORMATS:
+            raise ValidationError({'export_format': [f'Use one of: {", ".join(EXPORT_FORMATS)}.']})
+        # Same role scoping and filters as the list endpoint, without pagination.
+        return export_response(self.filter_queryset(self.get_queryset()), fmt)
+
+class JobRecommendationView(generics.ListAPIView):
+
+    permission_classes = [IsAuthenticated, IsCandidateUser]
+    serializer_class = JobRecommendationSerializer
+    pagination_class = None
+    default_limit = 20
+    max_limit = 100
+
+    def get_limit(self):
+
+        try:
+            limit = int(self.request.query_params.get('limit', self.default_limit))
+        except (TypeError, ValueError):
+            limit = self.default_limit
+        return max(1, min(limit, self.max_limit))
+
+    def get_queryset(self):
+
+        matches = matching_engine.recommend(self.request.user.profile, limit=self.get_limit())
+        scores = dict(matches)
+
+        jobs = Job.active_objects.filter(
+            pk__in=scores,
+            job_status=JobStatusChoices.PUBLISHED,
+            deadline__gt=timezone.now()
+        ).select_related('recruiter').prefetch_related('skill_tags')
+
+        jobs = list(jobs)
+        for job in jobs:
+            job.match_score = round(scores[job.pk], 4)
+        jobs.sort(key=lambda job: job.match_score, reverse=True)
+        return jobs
 
 class RecruiterDashboardView(generics.RetrieveAPIView):
 
@@ -151,33 +281,23 @@ class RecruiterDashboardView(generics.RetrieveAPIView):
     def retrieve(self, request, *args, **kwargs):
 
         user = self.get_object()
-        
-        stats = {
-            'total_published_jobs': Job.objects.filter(
-                recruiter=user,
-                job_status=JobStatusChoices.PUBLISHED,
-                status='ACTIVE'
-            ).count(),
-            'total_closed_jobs': Job.objects.filter(
-                recruiter=user,
-                job_status=JobStatusChoices.CLOSED,
-                status='ACTIVE'
-            ).count(),
-            'total_candidate_applications': JobApplication.objects.filter(
-                job__recruiter=user,
-                status='ACTIVE'
-            ).count(),
-            'total_candidates_hired': JobApplication.objects.filter(
-                job__recruiter=user,
-                application_status=ApplicationStatusChoices.ACCEPTED,
-                status='ACTIVE'
-            ).count(),
-            'total_candidates_rejected': JobApplication.objects.filter(
-                job__recruiter=user,
-                application_status=ApplicationStatusChoices.REJECTED,
-                status='ACTIVE'
-            ).count(),
-        }
-        
+
+        stats = RecruiterStats.objects.filter(pk=user.pk).first()
+        if stats is None:
+            stats = RecruiterStats.objects.recompute([user.pk])[user.pk]
+
         serializer = self.get_serializer(stats)
-        return Response(serializer.data)
\ No newline at end of file
+        return Response(serializer.data)
+
+class JobCacheStatsView(APIView):
+
+    permission_classes = [IsAuthenticated, IsAdminUser]
+
+    def get(self, request):
+
+        return Response(cache_stats())
+
+    def delete(self, request):
+
+        reset_stats()
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,166 @@
+""" Time-based job lifecycle: publish scheduled drafts and close jobs past their deadline. """
+
+import heapq
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from job.cache import invalidate_all
+from job.choices import JobStatusChoices
+from job.matching import schedule_refresh
+from job.models import Job, RecruiterStats
+
+
+logger = logging.getLogger(__name__)
+
+PUBLISH = 'publish'
+CLOSE = 'close'
+
+# transition -> (status it applies to, time field, new status, counters moved)
+TRANSITIONS = {
+    PUBLISH: (
+        JobStatusChoices.DRAFT, 'publish_at', JobStatusChoices.PUBLISHED,
+        {'published_jobs': 1},
+    ),
+    CLOSE: (
+        JobStatusChoices.PUBLISHED, 'deadline', JobStatusChoices.CLOSED,
+        {'published_jobs': -1, 'closed_jobs': 1},
+    ),
+}
+
+
+def scheduler_setting(name, default):
+
+    return getattr(settings, f'JOB_SCHEDULER_{name}', default)
+
+
+def apply_transition(transition, now=None, batch_size=None):
+    """
+    Move every job due for ``transition`` in batches of set-based UPDATEs
+    and return the ids that changed.
+
+    Rows are claimed with ``SELECT ... FOR UPDATE SKIP LOCKED`` where the
+    backend supports it, and each UPDATE re-checks the source status, so
+    concurrent schedulers never apply a transition (or its counter deltas)
+    twice.
+    """
+    from_status, field, to_status, counters = TRANSITIONS[transition]
+    now = now or timezone.now()
+    batch_size = batch_size or scheduler_setting('BATCH_SIZE', 500)
+    changed = []
+
+    while True:
+        with transaction.atomic():
+            due = Job.active_objects.filter(job_status=from_status, **{f'{field}__lte': now})
+            rows = list(
+                due.select_for_update(skip_locked=True)
+                .order_by(field)
+                .values_list('pk', 'recruiter_id')[:batch_size]
+            )
+            if not rows:
+                break
+
+            by_recruiter = {}
+            for job_id, recruiter_id in rows:
+                by_recruiter.setdefault(recruiter_id, []).append(job_id)
+
+            for recruiter_id, job_ids in by_recruiter.items():
+                updated = due.filter(pk__in=job_ids).update(job_status=to_status, updated_at=now)
+                if not updated:
+                    continue
+                RecruiterStats.objects.bump(
+                    recruiter_id, **{name: delta * updated for name, delta in counters.items()}
+                )
+                for job_id in job_ids:
+                    schedule_refresh(job_id)
+                changed.extend(job_ids)
+
+        if len(rows) < batch_size:
+            break
+
+    if changed:
+        transaction.on_commit(invalidate_all)
+    return changed
+
+
+class JobLifecycleScheduler:
+    """
+    Keeps a min-heap of upcoming ``(when, transition)`` events loaded from
+    the database and sleeps until the earliest one. The heap only decides
+    when to wake up: the transitions themselves are set-based UPDATEs over
+    everything due, so a missed or stale heap entry is harmless.
+    """
+
+    def __init__(self, horizon=None, reload_seconds=None):
+
+        self.horizon = timedelta(seconds=horizon or scheduler_setting('HORIZON_SECONDS', 3600))
+        self.reload_seconds = reload_seconds or scheduler_setting('RELOAD_SECONDS', 60)
+        self._heap = []
+        self._loaded_at = None
+        self._stop = threading.Event()
+
+    def load(self, now=None):
+        """ Rebuild the heap from transitions due before ``now + horizon``. """
+
+        now = now or timezone.now()
+        limit = scheduler_setting('HEAP_SIZE', 1000)
+        heap = []
+        for transition, (from_status, field, _, _) in TRANSITIONS.items():
+            upcoming = (
+                Job.active_objects
+                .filter(job_status=from_status, **{f'{field}__lte': now + self.horizon})
+                .order_by(field)
+                .values_list(field, flat=True)[:limit]
+            )
+            heap.extend((when, transition) for when in upcoming)
+        heapq.heapify(heap)
+        self._heap = heap
+        self._loaded_at = now
+
+    def run_pending(self, now=None):
+        """ Apply every transition whose time has come; return ``{transition: count}``. """
+
+        now = now or timezone.now()
+        if self._loaded_at is None or (now - self._loaded_at).total_seconds() >= self.reload_seconds:
+            self.load(now)
+
+        due = set()
+        while self._heap and self._heap[0][0] <= now:
+            due.add(heapq.heappop(self._heap)[1])
+        return {transition: len(apply_transition(transition, now)) for transition in sorted(due)}
+
+    def seconds_until_next(self, now=None):
+
+        now = now or timezone.now()
+        next_reload = self.reload_seconds - (now - self._loaded_at).total_seconds()
+        if self._heap:
+            return max(0.0, min(next_reload, (self._heap[0][0] - now).total_seconds()))
+        return max(0.0, next_reload)
+
+    def run_forever(self):
+
+        while not self._stop.is_set():
+            try:
+                changed = self.run_pending()
+                if any(changed.values()):
+                    logger.info("Job scheduler transitions: %s", changed)
+            except Exception:
+                logger.exception("Job scheduler tick failed")
+            self._stop.wait(self.seconds_until_next() if self._loaded_at else self.reload_seconds)
+
+    def stop(self):
+
+        self._stop.set()
+
+
+def start_in_background():
+    """ Run the scheduler on a daemon thread in this process and return it. """
+
+    scheduler = JobLifecycleScheduler()
+    thread = threading.Thread(target=scheduler.run_forever, name='job-scheduler', daemon=True)
+    thread.start()
+    return scheduler
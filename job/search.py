@@ -0,0 +1,168 @@
+""" Full-text search over job postings backed by an SQLite FTS5 index. """
+
+import re
+
+from django.db import connection, connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+
+SEARCH_TABLE = 'jobs_fts'
+
+# Columns mirrored from ``jobs`` into the FTS table, with their bm25 weights.
+SEARCH_FIELDS = {
+    'title': 10.0,
+    'skills_required': 5.0,
+    'requirements': 2.0,
+    'description': 1.0,
+}
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def is_supported(using=None):
+
+    conn = connection if using is None else connections[using]
+    return conn.vendor == 'sqlite'
+
+
+def build_match_query(text):
+    """
+    Turn free user input into a safe FTS5 MATCH expression.
+
+    Every token is quoted so FTS5 operators typed by users are treated as
+    plain words; tokens are ANDed and the last one is prefix-matched so
+    partially typed words still find results.
+    """
+    tokens = TOKEN_RE.findall(text or '')
+    if not tokens:
+        return ''
+    terms = [f'"{token}"' for token in tokens]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def create_index():
+
+    columns = ', '.join(SEARCH_FIELDS)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} "
+            f"USING fts5({columns}, tokenize='unicode61 remove_diacritics 2')"
+        )
+
+
+def drop_index():
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'DROP TABLE IF EXISTS {SEARCH_TABLE}')
+
+
+def index_job(job, using=None):
+
+    if not is_supported(using):
+        return
+    columns = ', '.join(SEARCH_FIELDS)
+    placeholders = ', '.join(['%s'] * (len(SEARCH_FIELDS) + 1))
+    values = [job.pk] + [getattr(job, field) or '' for field in SEARCH_FIELDS]
+    with connections[using or 'default'].cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [job.pk])
+        cursor.execute(
+            f'INSERT INTO {SEARCH_TABLE} (rowid, {columns}) VALUES ({placeholders})',
+            values
+        )
+
+
+def index_jobs(jobs, using=None):
+    """ Add freshly inserted jobs (e.g. from ``bulk_create``) in one statement. """
+
+    if not jobs or not is_supported(using):
+        return
+    columns = ', '.join(SEARCH_FIELDS)
+    placeholders = ', '.join(['%s'] * (len(SEARCH_FIELDS) + 1))
+    with connections[using or 'default'].cursor() as cursor:
+        cursor.executemany(
+            f'INSERT INTO {SEARCH_TABLE} (rowid, {columns}) VALUES ({placeholders})',
+            [[job.pk] + [getattr(job, field) or '' for field in SEARCH_FIELDS] for job in jobs]
+        )
+
+
+def unindex_job(job_id, using=None):
+
+    if not is_supported(using):
+        return
+    with connections[using or 'default'].cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [job_id])
+
+
+def rebuild_index(batch_size=1000):
+    """ Recreate the FTS table from the ``jobs`` table and return the row count. """
+
+    from job.models import Job
+
+    if not is_supported():
+        return 0
+
+    drop_index()
+    create_index()
+
+    columns = ', '.join(SEARCH_FIELDS)
+    placeholders = ', '.join(['%s'] * (len(SEARCH_FIELDS) + 1))
+    rows = Job.objects.order_by().values_list('pk', *SEARCH_FIELDS)
+
+    total = 0
+    batch = []
+    with connection.cursor() as cursor:
+        for row in rows.iterator(chunk_size=batch_size):
+            batch.append([row[0]] + [value or '' for value in row[1:]])
+            if len(batch) >= batch_size:
+                cursor.executemany(
+                    f'INSERT INTO {SEARCH_TABLE} (rowid, {columns}) VALUES ({placeholders})',
+                    batch
+                )
+                total += len(batch)
+                batch = []
+        if batch:
+            cursor.executemany(
+                f'INSERT INTO {SEARCH_TABLE} (rowid, {columns}) VALUES ({placeholders})',
+                batch
+            )
+            total += len(batch)
+    return total
+
+
+def search_jobs(queryset, text):
+    """
+    Restrict ``queryset`` to jobs matching ``text``, best matches first.
+
+    The FTS table drives the match and bm25 supplies ``search_rank`` (lower
+    is better), so any role scoping already applied to ``queryset`` is kept.
+    Backends without FTS5 fall back to ``icontains`` lookups.
+    """
+    match = build_match_query(text)
+    if not match:
+        return queryset
+
+    if not is_supported(queryset.db):
+        condition = Q()
+        for token in TOKEN_RE.findall(text):
+            token_match = Q()
+            for field in SEARCH_FIELDS:
+                token_match |= Q(**{f'{field}__icontains': token})
+            condition &= token_match
+        return queryset.filter(condition)
+
+    table = queryset.model._meta.db_table
+    weights = ', '.join(str(weight) for weight in SEARCH_FIELDS.values())
+    return queryset.filter(
+        pk__in=RawSQL(
+            f'SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s',
+            (match,)
+        )
+    ).annotate(
+        search_rank=RawSQL(
+            f'SELECT bm25({SEARCH_TABLE}, {weights}) FROM {SEARCH_TABLE} '
+            f'WHERE {SEARCH_TABLE} MATCH %s AND {SEARCH_TABLE}.rowid = "{table}"."id"',
+            (match,)
+        )
+    ).order_by('search_rank', '-created_at')
@@ -0,0 +1,47 @@
+""" Write paths for job applications shared by the API and background workers. """
+
+from django.db import IntegrityError, transaction
+
+from job.models import JobApplication
+
+
+class DuplicateApplication(Exception):
+    """The candidate already has an application for this job"""
+
+    def __init__(self, application=None):
+
+        super().__init__("You have already applied to this job.")
+        self.application = application
+
+
+def submit_application(job, candidate, cover_letter='', resume=None, idempotency_key=''):
+    """
+    Insert an application and return ``(application, created)``.
+
+    Duplicates are detected by the ``(job, candidate)`` unique constraint
+    instead of a pre-check query. A retry carrying the same idempotency
+    key as the stored application returns it with ``created=False``; any
+    other duplicate raises ``DuplicateApplication``.
+    """
+    application = JobApplication(
+        job=job,
+        candidate=candidate,
+        cover_letter=cover_letter,
+        idempotency_key=idempotency_key,
+    )
+    if resume:
+        application.resume = resume
+
+    try:
+        with transaction.atomic():
+            application.save()
+    except IntegrityError:
+        existing = JobApplication.objects.filter(job=job, candidate=candidate).first()
+        if existing is None:
+            raise
+        existing.job = job
+        existing.candidate = candidate
+        if idempotency_key and existing.idempotency_key == idempotency_key:
+            return existing, False
+        raise DuplicateApplication(existing)
+    return application, True
@@ -1,28 +1,273 @@
-from django.db.models.signals import post_save
-from django.dispatch import receiver
-from django.core.mail import send_mail
-from django.conf import settings
+from collections import Counter
 
-from job.models import JobApplication
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import Signal, receiver
+from django.db import transaction
+
+from core.choices import ApplicationEmailModeChoices
+from core.models import Skill, UserProfile
+from job.choices import ApplicationStatusChoices, JobStatusChoices
+from job.managers import JOB_STATUS_COUNTERS, application_counter
+from job.models import Job, JobApplication, RecruiterDigest, RecruiterStats
+from shared.choices import StatusChoices
+from job.search import SEARCH_FIELDS, index_job, index_jobs, unindex_job
+from job.matching import schedule_refresh
+from job.cache import invalidate_job, invalidate_lists
 from authapp.utils import EmailService
 
+
+# Sent with ``jobs`` (saved instances with pks) after Job.objects.bulk_create
+# calls that should get the same side effects as post_save(created=True).
+jobs_bulk_created = Signal()
+
 @receiver(post_save, sender=JobApplication)
 def send_application_notifications(sender, instance, created, **kwargs):
 
     if created:
+        # Queued in the insert transaction; run_mail_worker does the SMTP work.
+        recruiter_id = instance.job.recruiter_id
+        mode = UserProfile.objects.filter(user_id=recruiter_id).values_list(
+            'application_email_mode', flat=True
+        ).first()
+        if mode == ApplicationEmailModeChoices.DIGEST:
+            RecruiterDigest.objects.add_pending(recruiter_id, instance.pk)
+        else:
+            EmailService.send_job_application_notification(
+                instance.job, instance.candidate, dedupe_key=f'application:{instance.pk}:recruiter'
+            )
+        EmailService.send_application_confirmation(
+            instance.job, instance.candidate, dedupe_key=f'application:{instance.pk}:candidate'
+        )
+
+
+@receiver(post_save, sender=Job)
+def sync_job_skill_tags(sender, instance, created, update_fields=None, raw=False, **kwargs):
+
+    if raw:
+        return
+    if created and not instance.skills_required:
+        return
+    if not created and update_fields is not None and 'skills_required' not in update_fields:
+        return
+    instance.skill_tags.set(Skill.objects.from_text(instance.skills_required))
+
+
+@receiver(post_save, sender=Job)
+def update_job_search_index(sender, instance, created, update_fields=None, raw=False, using=None, **kwargs):
+
+    if raw:
+        return
+    if not created and update_fields is not None and not set(update_fields) & set(SEARCH_FIELDS):
+        return
+    index_job(instance, using=using)
+
+
+@receiver(post_delete, sender=Job)
+def remove_job_from_search_index(sender, instance, using=None, **kwargs):
+
+    unindex_job(instance.pk, using=using)
+
+
+@receiver(post_save, sender=Job)
+def refresh_job_matching_row(sender, instance, raw=False, **kwargs):
+
+    if not raw:
+        schedule_refresh(instance.pk)
+
+
+@receiver(post_delete, sender=Job)
+def drop_job_matching_row(sender, instance, **kwargs):
+
+    schedule_refresh(instance.pk)
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_job_responses(sender, instance, raw=False, **kwargs):
+
+    if raw:
+        return
+    job_id, recruiter_id = instance.pk, instance.recruiter_id
+    transaction.on_commit(lambda: invalidate_job(job_id, recruiter_id))
+
+
+@receiver(post_save, sender=JobApplication)
+@receiver(post_delete, sender=JobApplication)
+def invalidate_job_detail_responses(sender, instance, raw=False, **kwargs):
+
+    if raw:
+        return
+    # Only the job's counters change; its list entries stay valid.
+    job_id = instance.job_id
+    transaction.on_commit(lambda: invalidate_job(job_id))
+
+
+# Recruiter dashboard and per-job application counters
+
+COUNTED_FIELDS = {
+    Job: ('job_status', 'status'),
+    JobApplication: ('application_status', 'status'),
+}
+
+
+def job_counters(job_status, status):
+
+    if status != StatusChoices.ACTIVE:
+        return Counter()
+    if job_status == JobStatusChoices.PUBLISHED:
+        return Counter(published_jobs=1)
+    if job_status == JobStatusChoices.CLOSED:
+        return Counter(closed_jobs=1)
+    return Counter()
+
+
+def application_counters(application_status, status):
+
+    if status != StatusChoices.ACTIVE:
+        return Counter()
+    return Counter({'total_applications': 1, application_counter(application_status): 1})
+
+
+def job_application_counters(application_status, status):
+
+    if status != StatusChoices.ACTIVE or application_status == ApplicationStatusChoices.WITHDRAWN:
+        return Counter()
+    counters = Counter(total_applications=1)
+    if application_status in JOB_STATUS_COUNTERS:
+        counters[application_counter(application_status)] = 1
+    return counters
+
+
+def counter_deltas(counters, previous, current):
+
+    deltas = Counter(counters(*current))
+    deltas.subtract(counters(*previous) if previous else Counter())
+    return {field: delta for field, delta in deltas.items() if delta}
+
+
+def application_recruiter_id(application):
+
+    try:
+        return application.job.recruiter_id
+    except Job.DoesNotExist:
+        return None
+
+
+@receiver(pre_save, sender=Job)
+@receiver(pre_save, sender=JobApplication)
+def remember_counted_state(sender, instance, raw=False, update_fields=None, **kwargs):
+
+    if raw or instance._state.adding:
+        instance._counted_state = None
+        return
+
+    dirty = instance.get_dirty_fields()
+    instance._counted_state = tuple(
+        dirty.get(field, getattr(instance, field))
+        if update_fields is None or field in update_fields
+        else getattr(instance, field)
+        for field in COUNTED_FIELDS[sender]
+    )
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_save, sender=JobApplication)
+def update_counters(sender, instance, created, raw=False, **kwargs):
+
+    if raw:
+        return
+    current = tuple(getattr(instance, field) for field in COUNTED_FIELDS[sender])
+    previous = None if created else getattr(instance, '_counted_state', current)
+    if previous == current:
+        return
+
+    if sender is Job:
+        RecruiterStats.objects.bump(
+            instance.recruiter_id, **counter_deltas(job_counters, previous, current)
+        )
+        return
+
+    Job.objects.bump_counters(
+        instance.job_id, **counter_deltas(job_application_counters, previous, current)
+    )
+    recruiter_id = application_recruiter_id(instance)
+    if recruiter_id is not None:
+        RecruiterStats.objects.bump(
+            recruiter_id, **counter_deltas(application_counters, previous, current)
+        )
+
+
+@receiver(post_delete, sender=Job)
+@receiver(post_delete, sender=JobApplication)
+def release_counters(sender, instance, **kwargs):
+
+    current = tuple(getattr(instance, field) for field in COUNTED_FIELDS[sender])
+    gone = (None, None)
+
+    if sender is Job:
+        RecruiterStats.objects.bump(
+            instance.recruiter_id, **counter_deltas(job_counters, current, gone)
+        )
+        return
+
+    Job.objects.bump_counters(
+        instance.job_id, **counter_deltas(job_application_counters, current, gone)
+    )
+    recruiter_id = application_recruiter_id(instance)
+    if recruiter_id is not None:
+        RecruiterStats.objects.bump(
+            recruiter_id, **counter_deltas(application_counters, current, gone)
+        )
+
+
+# Side effects of post_save(created=True) for jobs inserted with bulk_create
+
+@receiver(jobs_bulk_created, sender=Job)
+def sync_bulk_job_skill_tags(sender, jobs, **kwargs):
+
+    parsed = {job.pk: Skill.objects.parse(job.skills_required) for job in jobs}
+    names = {}
+    for job_names in parsed.values():
+        names.update(job_names)
+    skills = {skill.canonical_name: skill.pk for skill in Skill.objects.from_names(names)}
+
+    Through = Job.skill_tags.through
+    Through.objects.bulk_create(
+        [
+            Through(job_id=job_id, skill_id=skills[canonical])
+            for job_id, job_names in parsed.items()
+            for canonical in job_names if canonical in skills
+        ],
+        ignore_conflicts=True,
+    )
+
+
+@receiver(jobs_bulk_created, sender=Job)
+def index_bulk_created_jobs(sender, jobs, using=None, **kwargs):
+
+    index_jobs(jobs, using=using)
+
+
+@receiver(jobs_bulk_created, sender=Job)
+def count_bulk_created_jobs(sender, jobs, **kwargs):
+
+    deltas = {}
+    for job in jobs:
+        deltas.setdefault(job.recruiter_id, Counter()).update(job_counters(job.job_status, job.status))
+    for recruiter_id, counters in deltas.items():
+        if +counters:
+            RecruiterStats.objects.bump(recruiter_id, **counters)
+
+
+@receiver(jobs_bulk_created, sender=Job)
+def refresh_bulk_matching_rows(sender, jobs, **kwargs):
+
+    for job in jobs:
+        schedule_refresh(job.pk)
+
+
+@receiver(jobs_bulk_created, sender=Job)
+def invalidate_bulk_job_responses(sender, jobs, **kwargs):
 
-        EmailService.send_job_application_notification(instance.job, instance.candidate)
-        
-
-        subject = 'Application Submitted Successfully'
-        message = f'Hi {instance.candidate.get_full_name()},\n\n' \
-                 f'Your application for "{instance.job.title}" has been received.\n\n' \
-                 f'We will review your application and get back to you soon.\n\n' \
-                 f'Regards,\nJobSite Team'
-        send_mail(
-            subject,
-            message,
-            settings.DEFAULT_FROM_EMAIL,
-            [instance.candidate.email],
-            fail_silently=False,
-        )
\ No newline at end of file
+    recruiter_ids = {job.recruiter_id for job in jobs}
+    transaction.on_commit(lambda: invalidate_lists(*recruiter_ids))
@@ -0,0 +1,161 @@
+""" Write-behind queue that group-commits job applications from one writer thread per process. """
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from job.managers import coalesce_counters
+from job.services import submit_application
+from shared.db_router import note_write
+
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindTimeout(Exception):
+    """The writer did not get to the application before the caller gave up"""
+
+    def __init__(self):
+
+        super().__init__("Applications are backed up; please retry shortly.")
+
+
+def write_behind_setting(name, default):
+
+    return getattr(settings, f'APPLICATION_WRITE_BEHIND_{name}', default)
+
+
+class ApplicationWriter:
+    """
+    Serializes application inserts through a single thread. Callers enqueue
+    an already-validated insert and wait on a future; the thread drains
+    whatever is queued (waiting up to ``max_delay_ms`` for a burst to fill a
+    batch of ``batch_size``), runs each insert under its own savepoint with
+    the counter bumps coalesced, and commits the batch once. Futures are
+    resolved after the commit, so a caller never sees an uncommitted row.
+    """
+
+    def __init__(self, batch_size=None, max_delay_ms=None):
+
+        self.batch_size = batch_size or write_behind_setting('BATCH_SIZE', 50)
+        if max_delay_ms is None:
+            max_delay_ms = write_behind_setting('MAX_DELAY_MS', 2)
+        self.max_delay = max_delay_ms / 1000
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self.run_forever, name='application-writer', daemon=True)
+                self._thread.start()
+
+    def enqueue(self, job, candidate, **kwargs):
+        """ Queue ``submit_application(job, candidate, **kwargs)`` and return its future. """
+
+        self.start()
+        future = Future()
+        self._queue.put((future, job, candidate, kwargs))
+        return future
+
+    def submit(self, job, candidate, timeout=None, **kwargs):
+        """
+        Blocking counterpart of ``submit_application``: same arguments,
+        result and ``DuplicateApplication`` error, plus ``WriteBehindTimeout``
+        when the application is still queued after ``timeout`` seconds, or
+        its batch is still being written ``timeout`` seconds after that (the
+        row may then still commit; an Idempotency-Key retry replays it).
+        """
+        if timeout is None:
+            timeout = write_behind_setting('TIMEOUT_SECONDS', 10)
+        future = self.enqueue(job, candidate, **kwargs)
+        try:
+            result = future.result(timeout)
+        except FutureTimeoutError:
+            # Still queued: withdraw it. Already being written: wait for the outcome.
+            if future.cancel():
+                raise WriteBehindTimeout()
+            try:
+                result = future.result(timeout)
+            except FutureTimeoutError:
+                raise WriteBehindTimeout()
+        note_write()
+        return result
+
+    def next_batch(self):
+
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_delay
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return [item for item in batch if item[0].set_running_or_notify_cancel()]
+
+    def write_batch(self, batch):
+
+        outcomes = []
+        try:
+            with transaction.atomic(), coalesce_counters():
+                for future, job, candidate, kwargs in batch:
+                    # submit_application already inserts (and runs the
+                    # post_save receivers) under its own savepoint.
+                    try:
+                        with coalesce_counters():
+                            outcomes.append((future, submit_application(job, candidate, **kwargs), None))
+                    except Exception as exc:
+                        outcomes.append((future, None, exc))
+        except Exception as exc:
+            logger.exception("Application write-behind batch of %d failed", len(batch))
+            self.fail(batch, exc)
+            return
+
+        for future, result, exc in outcomes:
+            if exc is None:
+                future.set_result(result)
+            else:
+                future.set_exception(exc)
+
+    def fail(self, batch, exc):
+
+        for future, *_ in batch:
+            if not future.done():
+                future.set_exception(exc)
+
+    def run_forever(self):
+
+        while True:
+            batch = []
+            try:
+                batch = self.next_batch()
+                if batch:
+                    # What request_started/request_finished do around each request.
+                    connection.close_if_unusable_or_obsolete()
+                    self.write_batch(batch)
+            except Exception as exc:
+                # Futures in the batch are already RUNNING; never leave their callers waiting.
+                logger.exception("Application write-behind writer failed")
+                self.fail(batch, exc)
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_application_writer():
+    """ The process-wide writer, created on first use. """
+
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = ApplicationWriter()
+        return _writer
@@ -0,0 +1,193 @@
+import math
+
+from django.contrib.auth.models import AnonymousUser
+from django.http import JsonResponse
+from django.views import View
+from rest_framework import status
+from rest_framework.exceptions import (
+    APIException,
+    AuthenticationFailed,
+    NotAuthenticated,
+    NotFound,
+    PermissionDenied,
+)
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.settings import api_settings as drf_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from authapp.authentication import CachedJWTAuthentication
+from authapp.revocation import get_revocation_list
+from authapp.tokens import VERSION_CLAIM
+
+
+class AsyncJWTAuthentication(CachedJWTAuthentication):
+    """
+    ``CachedJWTAuthentication`` with the revocation and fallback user
+    lookups on the async ORM. Token parsing, validation and cache hits are
+    CPU-only and reused as is.
+    """
+
+    async def aauthenticate(self, request):
+
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = await self.aget_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_validated_token(self, raw_token):
+
+        # Signature and claim checks only; the revocation check may need the async ORM.
+        validated_token = JWTAuthentication.get_validated_token(self, raw_token)
+        revocations = get_revocation_list()
+        await revocations.async_sync_if_due()
+        if await revocations.ais_revoked(validated_token):
+            raise InvalidToken('Token has been revoked')
+        return validated_token
+
+    async def aget_user(self, validated_token):
+
+        version = validated_token.get(VERSION_CLAIM)
+        if version is not None:
+            user = self.cached_user(validated_token, version)
+            if user is not None:
+                return user
+
+        user = await self.aload_user(validated_token)
+        return user if version is None else self.remember(user, version)
+
+    async def aload_user(self, validated_token):
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken('Token contained no recognizable user identification')
+
+        try:
+            user = await self.user_model.objects.aget(**{api_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed('User not found', code='user_not_found')
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed('User is inactive', code='user_inactive')
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed("The user's password has been changed.", code='password_changed')
+        return user
+
+
+class AsyncReadView(View):
+    """
+    Base for read-only endpoints served natively under ASGI.
+
+    DRF views are sync-only, so ASGI runs each of them in a worker thread.
+    These views run on the event loop: authentication, permission checks
+    and errors follow DRF's behaviour and response shapes, and database
+    access goes through the async ORM. Serializers may be reused as long as
+    everything they touch is loaded up front (``select_related`` /
+    ``prefetch_related``); a lazy query raises ``SynchronousOnlyOperation``.
+    """
+
+    http_method_names = ['get']
+    authentication_class = AsyncJWTAuthentication
+    permission_classes = [IsAuthenticated]
+
+    async def dispatch(self, request, *args, **kwargs):
+
+        authenticator = self.authentication_class()
+        try:
+            result = await authenticator.aauthenticate(request)
+            request.user, request.auth = result if result else (AnonymousUser(), None)
+            for permission in self.permission_classes:
+                if not permission().has_permission(request, self):
+                    if request.auth is None:
+                        raise NotAuthenticated()
+                    raise PermissionDenied()
+            return await super().dispatch(request, *args, **kwargs)
+        except APIException as exc:
+            return self.handle_exception(exc, authenticator, request)
+
+    def handle_exception(self, exc, authenticator, request):
+
+        data = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+        response = JsonResponse(data, status=exc.status_code, safe=False)
+        if exc.status_code == status.HTTP_401_UNAUTHORIZED:
+            response['WWW-Authenticate'] = authenticator.authenticate_header(request)
+        return response
+
+    def render(self, data, status_code=status.HTTP_200_OK):
+
+        return JsonResponse(data, status=status_code, safe=False)
+
+
+class AsyncPageNumberPagination:
+    """ Page-number pagination with the same parameters and payload as the sync endpoints. """
+
+    page_query_param = 'page'
+    page_size_query_param = 'page_size'
+    page_size = drf_settings.PAGE_SIZE
+    max_page_size = 100
+    invalid_page_message = 'Invalid page.'
+
+    def get_page_size(self, request):
+
+        try:
+            size = int(request.GET[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_page_number(self, request, num_pages):
+
+        value = request.GET.get(self.page_query_param, 1)
+        if value == 'last':
+            return num_pages
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_page_message)
+        if not 1 <= number <= num_pages:
+            raise NotFound(self.invalid_page_message)
+        return number
+
+    async def paginate_queryset(self, queryset, request):
+
+        page_size = self.get_page_size(request)
+        self.count = await queryset.acount()
+        num_pages = max(1, math.ceil(self.count / page_size))
+        number = self.get_page_number(request, num_pages)
+
+        offset = (number - 1) * page_size
+        page = queryset[offset:offset + page_size]
+        rows = [obj async for obj in page.aiterator(chunk_size=page_size)]
+
+        url = request.build_absolute_uri()
+        self.next_link = replace_query_param(url, self.page_query_param, number + 1) if number < num_pages else None
+        if number <= 1:
+            self.previous_link = None
+        elif number == 2:
+            self.previous_link = remove_query_param(url, self.page_query_param)
+        else:
+            self.previous_link = replace_query_param(url, self.page_query_param, number - 1)
+        return rows
+
+    def get_paginated_data(self, data):
+
+        return {
+            'count': self.count,
+            'next': self.next_link,
+            'previous': self.previous_link,
+            'results': data,
+        }
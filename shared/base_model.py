@@ -1,6 +1,9 @@
 import uuid
 
+from django.conf import settings
 from django.db import models
+from django.db.models.expressions import BaseExpression, Combinable
+from django.db.models.fields.files import FieldFile
 
 from shared.choices import StatusChoices
 
@@ -8,6 +11,29 @@ from dirtyfields import DirtyFieldsMixin
 from typing import Iterable
 
 
+class ActiveQuerySet(models.QuerySet):
+
+    def active(self):
+
+        return self.filter(status=StatusChoices.ACTIVE)
+
+    def inactive(self):
+
+        return self.exclude(status=StatusChoices.ACTIVE)
+
+
+class BaseManager(models.Manager.from_queryset(ActiveQuerySet)):
+    """Default manager for BaseModel subclasses; adds .active()/.inactive()"""
+
+
+class ActiveManager(BaseManager):
+    """Only rows that have not been soft-deleted"""
+
+    def get_queryset(self):
+
+        return super().get_queryset().active()
+
+
 class BaseModel(DirtyFieldsMixin, models.Model):
 
     uid = models.UUIDField(
@@ -32,10 +58,61 @@ class BaseModel(DirtyFieldsMixin, models.Model):
         help_text="Status of the instance, typically used for soft deletion.",
     )
 
+    objects = BaseManager()
+    active_objects = ActiveManager()
+
     class Meta:
         abstract = True
         ordering = ['-created_at']
 
+    def save(self, *args, **kwargs):
+        """
+        Saves of existing rows only write the fields that changed (plus
+        ``updated_at``) and are skipped entirely when nothing did. Explicit
+        ``update_fields``, inserts and DIRTY_FIELD_SAVES_ENABLED=False keep
+        Django's behaviour of writing every column.
+        """
+
+        if not args and self.saves_dirty_fields_only(kwargs):
+            changed = self.changed_fields()
+            if changed is not None:
+                if not changed:
+                    return
+                kwargs['update_fields'] = [*changed, 'updated_at']
+        super().save(*args, **kwargs)
+
+    def saves_dirty_fields_only(self, save_kwargs):
+
+        return (
+            getattr(settings, 'DIRTY_FIELD_SAVES_ENABLED', True)
+            and not self._state.adding
+            and save_kwargs.get('update_fields') is None
+            and not save_kwargs.get('force_insert')
+            and save_kwargs.get('using', self._state.db) == self._state.db
+        )
+
+    def changed_fields(self):
+        """ Names of loaded fields that differ from the stored row, or None if that can't be told. """
+
+        changed = set(self.get_dirty_fields(check_relationship=True))
+        deferred = self.get_deferred_fields()
+        for field in self._meta.concrete_fields:
+            if field.attname in deferred or field.name in changed:
+                continue
+            value = getattr(self, field.attname)
+            # Values dirtyfields leaves out of its comparison
+            if (
+                field.name not in self._original_state
+                or isinstance(value, (BaseExpression, Combinable))
+                or isinstance(value, FieldFile) and not value._committed
+            ):
+                changed.add(field.name)
+
+        if self._meta.pk.name in changed:
+            # A new primary key is a different row; let Django work that out.
+            return None
+        return changed
+
     def soft_delete(self):
 
         self.status = StatusChoices.INACTIVE
@@ -0,0 +1,82 @@
+""" Small helpers shared by the ``bench_*`` management commands. """
+
+import statistics
+import time
+from contextlib import contextmanager
+
+from django.db import connection
+
+
+class QueryCounter:
+    """
+    Count statements sent to the database inside a block. Queries issued by
+    the profiler's own tables (``silk_*``) are ignored.
+    """
+
+    def __init__(self, using=connection):
+
+        self.connection = using
+        self.count = 0
+        self.bytes = 0
+
+    def __call__(self, execute, sql, params, many, context):
+
+        if 'silk_' not in sql:
+            self.count += 1
+            self.bytes += len(sql.encode()) + sum(len(str(param).encode()) for param in (params or ()))
+        return execute(sql, params, many, context)
+
+    def __enter__(self):
+
+        self._wrapper = self.connection.execute_wrapper(self)
+        self._wrapper.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+
+        self._wrapper.__exit__(*exc_info)
+
+
+@contextmanager
+def timed(samples):
+    """Append the elapsed wall time of the block, in milliseconds, to ``samples``"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        samples.append((time.perf_counter() - start) * 1000)
+
+
+def percentile(samples, fraction):
+
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(samples):
+
+    if not samples:
+        return {'n': 0, 'mean': 0.0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0}
+    return {
+        'n': len(samples),
+        'mean': statistics.fmean(samples),
+        'p50': percentile(samples, 0.50),
+        'p95': percentile(samples, 0.95),
+        'p99': percentile(samples, 0.99),
+    }
+
+
+def write_table(stdout, headers, rows):
+
+    table = [list(map(str, headers))] + [
+        [f'{cell:.2f}' if isinstance(cell, float) else str(cell) for cell in row]
+        for row in rows
+    ]
+    widths = [max(len(row[i]) for row in table) for i in range(len(headers))]
+    for index, row in enumerate(table):
+        stdout.write('  '.join(cell.ljust(width) for cell, width in zip(row, widths)))
+        if index == 0:
+            stdout.write('  '.join('-' * width for width in widths))
@@ -0,0 +1,118 @@
+import hashlib
+import json
+from datetime import datetime
+
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified support for ``list`` and ``retrieve``.
+
+    Validators come from one aggregate query over the scoped, filtered
+    queryset: ``MAX(updated_at)``, the newest timestamp of each related row
+    in ``etag_related_fields`` (names, emails shown in the response), and
+    how many rows are past ``etag_clock_field`` (fields like ``is_expired``
+    flip there without a write). Details get a strong ETag plus
+    Last-Modified; lists get a weak ETag that also counts rows, and no
+    Last-Modified, since removing a row never raises ``MAX(updated_at)``.
+    A matching ``If-None-Match`` (or ``If-Modified-Since`` on a detail)
+    returns 304 before any serialization.
+    """
+
+    etag_field = 'updated_at'
+    etag_related_fields = ()
+    etag_clock_field = None
+    # Values shown by the detail response but written without touching
+    # etag_field; timestamps among them also count towards Last-Modified.
+    detail_etag_fields = ()
+
+    def etag_state(self, queryset, fields=()):
+
+        aggregates = {'last_modified': Max(self.etag_field), 'count': Count('pk')}
+        for index, field in enumerate([*self.etag_related_fields, *fields]):
+            aggregates[f'related_{index}'] = Max(field)
+        if self.etag_clock_field:
+            aggregates['passed'] = Count('pk', filter=Q(**{f'{self.etag_clock_field}__lte': timezone.now()}))
+            aggregates['clock'] = Max(self.etag_clock_field)
+        return queryset.order_by().aggregate(**aggregates)
+
+    def list(self, request, *args, **kwargs):
+
+        state = self.etag_state(self.filter_queryset(self.get_queryset()))
+        state.pop('clock', None)
+        last_modified = state.pop('last_modified')
+        etag = self.make_etag(request, 'list', last_modified, sorted(state.items()), weak=True)
+        return self.conditional_response(request, etag, None, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+
+        lookup = kwargs.get(self.lookup_url_kwarg or self.lookup_field)
+        state = self.etag_state(
+            self.filter_queryset(self.get_queryset()).filter(**{self.lookup_field: lookup}),
+            self.detail_etag_fields,
+        )
+        if not state['count']:
+            # Let the normal path produce the 404.
+            return super().retrieve(request, *args, **kwargs)
+
+        # The response last changed at the newest of: the row, a related
+        # row it shows, a detail timestamp, or the clock field if that has passed.
+        changes = [state['last_modified']] + [
+            state[f'related_{index}']
+            for index in range(len(self.etag_related_fields) + len(self.detail_etag_fields))
+        ]
+        if state.get('passed'):
+            changes.append(state['clock'])
+        last_modified = max(change for change in changes if isinstance(change, datetime))
+        etag = self.make_etag(request, 'detail', last_modified, [lookup, sorted(state.items())])
+        return self.conditional_response(
+            request, etag, last_modified, super().retrieve, *args, **kwargs
+        )
+
+    def make_etag(self, request, kind, last_modified, extra, weak=False):
+
+        raw = json.dumps(
+            [
+                kind,
+                request.path,
+                sorted(request.query_params.lists()),
+                getattr(request.user, 'pk', None),
+                last_modified.isoformat() if last_modified else None,
+                str(extra),
+            ],
+            separators=(',', ':'),
+        )
+        etag = quote_etag(hashlib.sha1(raw.encode()).hexdigest())
+        return f'W/{etag}' if weak else etag
+
+    def is_not_modified(self, request, etag, last_modified):
+
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match is not None:
+            # Weak comparison, as RFC 9110 requires for If-None-Match.
+            candidates = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+            return '*' in candidates or etag.removeprefix('W/') in candidates
+
+        if_modified_since = parse_http_date_safe(request.headers.get('If-Modified-Since', ''))
+        if if_modified_since is not None and last_modified is not None:
+            return int(last_modified.timestamp()) <= if_modified_since
+        return False
+
+    def conditional_response(self, request, etag, last_modified, handler, *args, **kwargs):
+
+        if self.is_not_modified(request, etag, last_modified):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+        return response
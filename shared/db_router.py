@@ -0,0 +1,120 @@
+""" Primary/replica database routing with read-your-writes stickiness. """
+
+import contextvars
+import hashlib
+import random
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+
+
+PIN_KEY_PREFIX = 'dbpin'
+
+# Alias reads go to in the current request; None means the primary. Code
+# running outside a request (commands, workers, the scheduler) never sets
+# it, so it always reads from the primary.
+_read_alias = contextvars.ContextVar('db_read_alias', default=None)
+_wrote = contextvars.ContextVar('db_wrote', default=None)
+
+
+def replica_aliases():
+
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+def choose_replica():
+
+    aliases = replica_aliases()
+    return random.choice(aliases) if aliases else None
+
+
+@contextmanager
+def route_reads(alias):
+    """
+    Send reads in the block to ``alias`` (None for the primary). Yields a
+    dict whose ``wrote`` flag is set once anything in the block writes.
+    """
+    state = {'wrote': False}
+    alias_token = _read_alias.set(alias)
+    wrote_token = _wrote.set(state)
+    try:
+        yield state
+    finally:
+        _read_alias.reset(alias_token)
+        _wrote.reset(wrote_token)
+
+
+def note_write():
+    """
+    Record that the current request wrote, switching its reads to the
+    primary. The router calls it for every write; code whose write ran on
+    another thread calls it directly.
+    """
+    state = _wrote.get()
+    if state is not None:
+        state['wrote'] = True
+        _read_alias.set(None)
+
+
+def get_pin_cache():
+
+    return caches[getattr(settings, 'DATABASE_PIN_CACHE_ALIAS', 'default')]
+
+
+def pin_key(identity):
+
+    return f'{PIN_KEY_PREFIX}:{identity}'
+
+
+def user_identity(user):
+
+    return f'user:{user.pk}'
+
+
+def session_identity(session_key):
+
+    return f'session:{hashlib.sha1(session_key.encode()).hexdigest()}'
+
+
+def pin_to_primary(*identities):
+    """ Keep reads for ``identities`` on the primary until replicas have caught up. """
+
+    timeout = getattr(settings, 'DATABASE_PRIMARY_STICKY_SECONDS', 5)
+    identities = [identity for identity in identities if identity]
+    if identities and timeout > 0:
+        get_pin_cache().set_many({pin_key(identity): 1 for identity in identities}, timeout)
+
+
+def is_pinned(identities):
+
+    if not identities:
+        return False
+    return bool(get_pin_cache().get_many([pin_key(identity) for identity in identities]))
+
+
+class PrimaryReplicaRouter:
+    """
+    Writes always go to the primary. Reads go to the replica chosen for
+    the current request by ``ReplicaRoutingMiddleware``, and back to the
+    primary for the rest of the request once it has written anything.
+    """
+
+    def db_for_read(self, model, **hints):
+
+        return _read_alias.get() or DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+
+        note_write()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+
+        # Replicas are copies of the primary, so objects from any alias can relate.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+
+        return db == DEFAULT_DB_ALIAS
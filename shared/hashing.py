@@ -0,0 +1,232 @@
+""" Password hashing on a bounded process pool instead of the request workers. """
+
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class HashingOverloaded(APIException):
+    """ Every hashing slot is taken; DRF answers 503 with ``Retry-After``. """
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'Too many password checks are in progress; please retry shortly.'
+    default_code = 'hashing_overloaded'
+    wait = 1
+
+
+# Run in the pool's worker processes
+
+def _warm_worker():
+
+    hashers.get_hashers()
+
+
+def _verify(password, encoded):
+
+    return hashers.verify_password(password, encoded)
+
+
+def _make(password, salt, hasher):
+
+    return hashers.make_password(password, salt, hasher)
+
+
+class PasswordHashingPool:
+    """
+    ``ProcessPoolExecutor`` for PBKDF2 work with a hard cap on how many
+    jobs may be queued or running. A caller that finds every slot taken
+    gets ``HashingOverloaded`` immediately instead of waiting, so a burst
+    of logins cannot pile up behind the request workers.
+
+    If a worker dies (OOM kill, segfault) the executor is broken for good,
+    so it is replaced and the job retried once; a second failure is
+    reported as ``HashingOverloaded`` rather than a 500.
+    """
+
+    def __init__(self, workers, max_pending):
+
+        self.workers = workers
+        self.max_pending = max_pending
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = None
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def executor(self):
+
+        with self._lock:
+            if self._executor is None:
+                # Workers never fork the (threaded) web process.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_warm_worker,
+                )
+            return self._executor
+
+    def replace_executor(self, broken):
+        """ Drop ``broken`` so the next submit starts fresh workers. """
+
+        with self._lock:
+            if self._executor is not broken:
+                # Another caller already replaced it.
+                return
+            self._executor = None
+            self._stats['restarts'] += 1
+        # A broken executor has already failed every pending job.
+        broken.shutdown(wait=False)
+
+    def submit(self, fn, *args):
+
+        return self._submit(fn, *args)[0]
+
+    def _submit(self, fn, *args):
+
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._stats['rejected'] += 1
+            raise HashingOverloaded()
+
+        started = time.perf_counter()
+        try:
+            executor = self.executor()
+            try:
+                future = executor.submit(fn, *args)
+            except BrokenProcessPool:
+                self.replace_executor(executor)
+                executor = self.executor()
+                future = executor.submit(fn, *args)
+        except BrokenProcessPool:
+            self._slots.release()
+            raise HashingOverloaded()
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._stats['submitted'] += 1
+            self._stats['in_flight'] += 1
+        future.add_done_callback(lambda done: self._finish(done, started))
+        return future, executor
+
+    def _finish(self, future, started):
+
+        self._slots.release()
+        with self._lock:
+            self._stats['in_flight'] -= 1
+            self._stats['failed' if future.exception() else 'completed'] += 1
+            self._stats['busy_seconds'] += time.perf_counter() - started
+
+    def run(self, fn, *args):
+
+        for _ in range(2):
+            future, executor = self._submit(fn, *args)
+            try:
+                return future.result()
+            except BrokenProcessPool:
+                self.replace_executor(executor)
+        raise HashingOverloaded()
+
+    async def arun(self, fn, *args):
+
+        for _ in range(2):
+            future, executor = self._submit(fn, *args)
+            try:
+                return await asyncio.wrap_future(future)
+            except BrokenProcessPool:
+                self.replace_executor(executor)
+        raise HashingOverloaded()
+
+    def stats(self):
+
+        with self._lock:
+            stats = dict(self._stats)
+        finished = stats['completed'] + stats['failed']
+        stats['mean_ms'] = stats.pop('busy_seconds') * 1000 / finished if finished else 0.0
+        stats.update(workers=self.workers, max_pending=self.max_pending)
+        return stats
+
+    def reset_stats(self):
+
+        with self._lock:
+            in_flight = getattr(self, '_stats', {}).get('in_flight', 0)
+            self._stats = {
+                'submitted': 0, 'completed': 0, 'failed': 0, 'rejected': 0,
+                'restarts': 0, 'in_flight': in_flight, 'busy_seconds': 0.0,
+            }
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_hashing_pool():
+    """ The process-wide pool, or None when PASSWORD_HASHING_POOL_ENABLED is off. """
+
+    global _pool
+    if not getattr(settings, 'PASSWORD_HASHING_POOL_ENABLED', True):
+        return None
+    with _pool_lock:
+        if _pool is None:
+            workers = getattr(settings, 'PASSWORD_HASHING_WORKERS', 2)
+            _pool = PasswordHashingPool(
+                workers, getattr(settings, 'PASSWORD_HASHING_MAX_PENDING', workers * 4)
+            )
+        return _pool
+
+
+def needs_hashing(password, encoded=None):
+    """ False for the cases Django answers without running a hasher. """
+
+    if password is None:
+        return False
+    return encoded is None or hashers.is_password_usable(encoded)
+
+
+# Drop-in versions of django.contrib.auth.hashers functions
+
+def check_password(password, encoded, setter=None):
+
+    pool = get_hashing_pool()
+    if pool is None or not needs_hashing(password, encoded):
+        is_correct, must_update = hashers.verify_password(password, encoded)
+    else:
+        is_correct, must_update = pool.run(_verify, password, encoded)
+    if setter and is_correct and must_update:
+        setter(password)
+    return is_correct
+
+
+async def acheck_password(password, encoded, setter=None):
+
+    pool = get_hashing_pool()
+    if pool is None or not needs_hashing(password, encoded):
+        is_correct, must_update = hashers.verify_password(password, encoded)
+    else:
+        is_correct, must_update = await pool.arun(_verify, password, encoded)
+    if setter and is_correct and must_update:
+        await setter(password)
+    return is_correct
+
+
+def make_password(password, salt=None, hasher='default'):
+
+    pool = get_hashing_pool()
+    if pool is None or not needs_hashing(password):
+        return hashers.make_password(password, salt, hasher)
+    return pool.run(_make, password, salt, hasher)
+
+
+async def amake_password(password, salt=None, hasher='default'):
+
+    pool = get_hashing_pool()
+    if pool is None or not needs_hashing(password):
+        return hashers.make_password(password, salt, hasher)
+    return await pool.arun(_make, password, salt, hasher)
@@ -0,0 +1,100 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.utils.functional import SimpleLazyObject
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from shared.db_router import (
+    choose_replica,
+    is_pinned,
+    pin_to_primary,
+    replica_aliases,
+    route_reads,
+    session_identity,
+    user_identity,
+)
+
+
+def request_identities(request):
+    """
+    Who is making the request, worked out without touching the database:
+    the user id inside a bearer token and/or the session cookie.
+    """
+    identities = []
+    parts = request.META.get('HTTP_AUTHORIZATION', '').split()
+    if len(parts) == 2 and parts[0] in api_settings.AUTH_HEADER_TYPES:
+        try:
+            identities.append(f'user:{AccessToken(parts[1])[api_settings.USER_ID_CLAIM]}')
+        except (TokenError, KeyError):
+            pass
+    session_key = request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+    if session_key:
+        identities.append(session_identity(session_key))
+    return identities
+
+
+def resolved_user(request):
+    """ The user the view authenticated, if any, without forcing the lazy session user. """
+
+    user = request.__dict__.get('user')
+    if user is None or isinstance(user, SimpleLazyObject) or not user.is_authenticated:
+        return None
+    return user
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Route each request's reads: safe-method requests go to a replica
+    unless the caller wrote recently, everything else uses the primary.
+    A request that writes pins its caller to the primary for
+    ``DATABASE_PRIMARY_STICKY_SECONDS`` so they read their own writes.
+
+    Works in both sync and async stacks so ASGI requests stay on the loop.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def choose_alias(self, request, identities):
+
+        if request.method not in SAFE_METHODS or is_pinned(identities):
+            return None
+        return choose_replica()
+
+    def finish(self, request, identities, state):
+
+        if state['wrote']:
+            user = resolved_user(request)
+            pin_to_primary(*identities, user_identity(user) if user else None)
+
+    def __call__(self, request):
+
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not replica_aliases():
+            return self.get_response(request)
+
+        identities = request_identities(request)
+        with route_reads(self.choose_alias(request, identities)) as state:
+            response = self.get_response(request)
+        self.finish(request, identities, state)
+        return response
+
+    async def __acall__(self, request):
+
+        if not replica_aliases():
+            return await self.get_response(request)
+
+        identities = request_identities(request)
+        with route_reads(self.choose_alias(request, identities)) as state:
+            response = await self.get_response(request)
+        self.finish(request, identities, state)
+        return response
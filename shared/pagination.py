@@ -0,0 +1,198 @@
+import base64
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework import exceptions
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    Opaque-cursor pagination keyed on ``(<ordering field>, id)``.
+
+    Each page is a single index range scan: no ``OFFSET`` and, with
+    ``?count=false``, no ``COUNT(*)``. Views may allow extra sort keys
+    through ``cursor_ordering_fields``; rows with a NULL sort key are left
+    out since they have no position in the keyset. Query parameters that
+    impose their own order (e.g. a search ranking) can be listed in
+    ``cursor_incompatible_params`` to have cursor requests rejected.
+    """
+
+    cursor_query_param = 'cursor'
+    ordering_query_param = 'ordering'
+    count_query_param = 'count'
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = 'page_size'
+    default_ordering = '-created_at'
+    max_page_size = 100
+    invalid_cursor_message = 'Invalid cursor.'
+    incompatible_param_message = 'Cursor pagination cannot be combined with this parameter.'
+
+    def get_page_size(self, request):
+
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_ordering(self, request, view):
+
+        allowed = getattr(view, 'cursor_ordering_fields', ['created_at'])
+        ordering = request.query_params.get(self.ordering_query_param, self.default_ordering)
+        if ordering.lstrip('-') not in allowed:
+            ordering = self.default_ordering
+        return ordering
+
+    def check_params(self, request, view):
+
+        for param in getattr(view, 'cursor_incompatible_params', ()):
+            if request.query_params.get(param, '').strip():
+                raise exceptions.ValidationError({param: [self.incompatible_param_message]})
+
+    def include_count(self, request):
+
+        value = request.query_params.get(self.count_query_param, 'true')
+        return value.lower() not in ('0', 'false', 'no')
+
+    def encode_cursor(self, obj, reverse):
+
+        position = getattr(obj, self.field_name)
+        payload = {
+            'o': self.ordering,
+            'v': None if position is None else str(position),
+            'id': obj.pk,
+            'r': reverse,
+        }
+        raw = json.dumps(payload, separators=(',', ':')).encode()
+        url = replace_query_param(
+            self.base_url, self.cursor_query_param,
+            base64.urlsafe_b64encode(raw).decode().rstrip('=')
+        )
+        return remove_query_param(url, 'page')
+
+    def decode_cursor(self, request):
+
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4))
+            payload = json.loads(raw)
+            if payload['o'] != self.ordering:
+                raise ValueError('ordering changed')
+            value = self.field.to_python(payload['v'])
+            if value is None:
+                # NULL sort keys are never encoded (see paginate_queryset).
+                raise ValueError('missing position')
+            return value, int(payload['id']), bool(payload['r'])
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def paginate_queryset(self, queryset, request, view=None):
+
+        self.check_params(request, view)
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(request, view)
+        self.descending = self.ordering.startswith('-')
+        self.field_name = self.ordering.lstrip('-')
+        self.field = queryset.model._meta.get_field(self.field_name)
+
+        if self.field.null:
+            queryset = queryset.exclude(**{f'{self.field_name}__isnull': True})
+
+        self.count = queryset.count() if self.include_count(request) else None
+
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor[2])
+        # Walking backwards flips the scan direction.
+        scan_descending = self.descending != reverse
+        prefix = '-' if scan_descending else ''
+        queryset = queryset.order_by(f'{prefix}{self.field_name}', f'{prefix}pk')
+
+        if cursor is not None:
+            value, pk, _ = cursor
+            op = 'lt' if scan_descending else 'gt'
+            queryset = queryset.filter(
+                Q(**{f'{self.field_name}__{op}': value}) |
+                Q(**{self.field_name: value, f'pk__{op}': pk})
+            )
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.next_link = None
+        self.previous_link = None
+        if rows:
+            if reverse or has_more:
+                self.next_link = self.encode_cursor(rows[-1], reverse=False)
+            if (has_more if reverse else cursor is not None):
+                self.previous_link = self.encode_cursor(rows[0], reverse=True)
+        return rows
+
+    def get_paginated_response(self, data):
+
+        payload = {}
+        if self.count is not None:
+            payload['count'] = self.count
+        payload['next'] = self.next_link
+        payload['previous'] = self.previous_link
+        payload['results'] = data
+        return Response(payload)
+
+    def get_paginated_response_schema(self, schema):
+
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'count': {'type': 'integer'},
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+
+class SelectablePagination(PageNumberPagination):
+    """
+    Page-number pagination by default; ``?pagination=cursor`` (or any
+    ``?cursor=`` value) switches the request to ``KeysetCursorPagination``
+    so existing clients keep their current responses.
+    """
+
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    mode_query_param = 'pagination'
+    cursor_class = KeysetCursorPagination
+
+    def use_cursor(self, request):
+
+        return (
+            request.query_params.get(self.mode_query_param) == 'cursor' or
+            self.cursor_class.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+
+        self.delegate = None
+        if self.use_cursor(request):
+            self.delegate = self.cursor_class()
+            return self.delegate.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+
+        if self.delegate is not None:
+            return self.delegate.get_paginated_response(data)
+        return super().get_paginated_response(data)
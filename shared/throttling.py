@@ -0,0 +1,189 @@
+"""
+Sliding-window rate limits for DRF views.
+
+Each limit keeps two fixed-window counters per key (this window and the
+previous one) and estimates the sliding count as
+``previous * (1 - elapsed_fraction) + current``, so a check is O(1) in time
+and memory. Counters live in a process-local backend by default, or in a
+Django cache alias that every worker shares.
+"""
+
+import hashlib
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.throttling import BaseThrottle
+
+
+def parse_rate(rate):
+    """ ``'5/min'`` -> ``(5, 60)``; the unit may be s, min, h or day (or a prefix). """
+
+    count, period = rate.split('/')
+    return int(count), {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}[period[0]]
+
+
+def sliding_count(previous, current, elapsed_fraction):
+
+    return previous * (1 - elapsed_fraction) + current
+
+
+def retry_after(limit, window, previous, current, elapsed):
+    """ Seconds until a new hit would fit under ``limit``. """
+
+    if current >= limit:
+        # Only once this window rolls over and enough of it has decayed.
+        return (window - elapsed) + window * (1 - limit / max(current, 1))
+    return window * (1 - (limit - current) / previous) - elapsed
+
+
+class LocalBackend:
+    """ Counters in this process's memory; cheapest, but each worker counts separately. """
+
+    def __init__(self, max_keys=100000):
+
+        self.max_keys = max_keys
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def hit(self, key, limit, window, now):
+
+        index, elapsed = divmod(now, window)
+        index = int(index)
+        with self._lock:
+            entry = self._counters.get(key)
+            if entry is None or entry[0] < index - 1:
+                previous, current = 0, 0
+            elif entry[0] == index - 1:
+                previous, current = entry[2], 0
+            else:
+                previous, current = entry[1], entry[2]
+
+            if sliding_count(previous, current, elapsed / window) >= limit:
+                return False, retry_after(limit, window, previous, current, elapsed)
+            self._counters[key] = (index, previous, current + 1)
+            if len(self._counters) > self.max_keys:
+                self.prune(index)
+        return True, 0.0
+
+    def prune(self, index):
+
+        # Keys from before the previous window no longer count for anything.
+        self._counters = {key: entry for key, entry in self._counters.items() if entry[0] >= index - 1}
+
+
+class CacheBackend:
+    """
+    Counters in a Django cache, shared by every worker that uses the same
+    cache server. Read-then-increment is not atomic across workers, so a
+    burst can overshoot the limit by roughly the number of workers.
+    """
+
+    def __init__(self, alias):
+
+        self.alias = alias
+
+    def hit(self, key, limit, window, now):
+
+        cache = caches[self.alias]
+        index, elapsed = divmod(now, window)
+        index = int(index)
+        current_key, previous_key = f'{key}:{index}', f'{key}:{index - 1}'
+        counts = cache.get_many([current_key, previous_key])
+        previous, current = counts.get(previous_key, 0), counts.get(current_key, 0)
+
+        if sliding_count(previous, current, elapsed / window) >= limit:
+            return False, retry_after(limit, window, previous, current, elapsed)
+        # Kept for two windows: one as "current", one as "previous".
+        if not cache.add(current_key, 1, timeout=2 * window):
+            try:
+                cache.incr(current_key)
+            except ValueError:
+                cache.set(current_key, 1, timeout=2 * window)
+        return True, 0.0
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            if getattr(settings, 'THROTTLE_BACKEND', 'local') == 'cache':
+                _backend = CacheBackend(getattr(settings, 'THROTTLE_CACHE_ALIAS', 'default'))
+            else:
+                _backend = LocalBackend()
+        return _backend
+
+
+class SlidingWindowThrottle(BaseThrottle):
+    """
+    Base throttle. The view's ``throttle_scope`` plus this class's ``kind``
+    name the rate in ``THROTTLE_RATES`` (e.g. ``login_ip: '20/min'``); a
+    scope without a rate is not limited. Subclasses pick what a caller is
+    counted by in ``get_ident_key``; returning None skips the limit.
+    """
+
+    kind = None
+
+    def get_ident_key(self, request, view):
+
+        raise NotImplementedError('.get_ident_key() must be overridden')
+
+    def allow_request(self, request, view):
+
+        scope = f"{getattr(view, 'throttle_scope', None)}_{self.kind}"
+        rate = getattr(settings, 'THROTTLE_RATES', {}).get(scope)
+        if not rate:
+            return True
+        ident = self.get_ident_key(request, view)
+        if ident is None:
+            return True
+
+        limit, window = parse_rate(rate)
+        allowed, self._wait = get_backend().hit(f'throttle:{scope}:{ident}', limit, window, time.time())
+        return allowed
+
+    def wait(self):
+
+        return max(1, math.ceil(self._wait))
+
+
+class IPThrottle(SlidingWindowThrottle):
+    """ Counts by client IP (honours DRF's ``NUM_PROXIES`` for X-Forwarded-For). """
+
+    kind = 'ip'
+
+    def get_ident_key(self, request, view):
+
+        return self.get_ident(request)
+
+
+class EmailThrottle(SlidingWindowThrottle):
+    """ Counts by the ``email`` in the request body, so one account can't be hammered from many IPs. """
+
+    kind = 'email'
+
+    def get_ident_key(self, request, view):
+
+        email = request.data.get('email') if hasattr(request.data, 'get') else None
+        if not isinstance(email, str) or not email.strip():
+            return None
+        return hashlib.sha1(email.strip().lower().encode()).hexdigest()
+
+
+class UserThrottle(SlidingWindowThrottle):
+    """ Counts by authenticated user, falling back to the client IP. """
+
+    kind = 'user'
+
+    def get_ident_key(self, request, view):
+
+        if request.user and request.user.is_authenticated:
+            return f'user:{request.user.pk}'
+        return self.get_ident(request)